@@ -0,0 +1,64 @@
+"""
+Run the benchmark suite, optionally saving or comparing against a baseline.
+
+    python -m benchmarks                          # run everything
+    python -m benchmarks -k triangulation         # only matching benchmarks
+    python -m benchmarks --save main              # save as baselines/main.json
+    python -m benchmarks --compare main           # exit 1 on any regression
+"""
+from __future__ import annotations
+
+import argparse
+import fnmatch
+import sys
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__.split("\n")[1])
+    parser.add_argument("-k", "--filter", action="append", help="Only run benchmarks whose names contain this (or match this glob)")
+    parser.add_argument("--skip-scenes", action="store_true", help="Leave out whole scene benchmarks")
+    parser.add_argument("--list", action="store_true", help="List benchmark names and exit")
+    parser.add_argument("--save", metavar="NAME", help="Save results as a baseline")
+    parser.add_argument("--compare", metavar="NAME", help="Compare results with a saved baseline")
+    parser.add_argument("--threshold", type=float, default=0.1, help="Ratio by which a metric must worsen to count as a regression")
+    parser.add_argument("-r", "--resolution", default="854x480", help="Resolution for rendering, passed as \"WxH\"")
+    parser.add_argument("--fps", type=int, default=15, help="Frame rate for scene benchmarks")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+
+    # manimlib reads its configuration from the command line on import,
+    # so this has to be in place first. -w renders headless.
+    sys.argv = ["manimgl", "-w", "-r", args.resolution, "--fps", str(args.fps)]
+
+    from benchmarks import bench_mobjects  # noqa: F401 (registers benchmarks)
+    if not args.skip_scenes:
+        from benchmarks import bench_scenes  # noqa: F401
+    from benchmarks.harness import BENCHMARKS, compare, load_baseline, run_benchmarks, save_baseline
+
+    names = list(BENCHMARKS)
+    if args.filter:
+        names = [
+            name for name in names
+            if any(pattern in name or fnmatch.fnmatch(name, pattern) for pattern in args.filter)
+        ]
+    if args.list:
+        print("\n".join(names))
+        return 0
+
+    results = run_benchmarks(names)
+
+    if args.save:
+        path = save_baseline(results, args.save, dict(resolution=args.resolution, fps=str(args.fps)))
+        print(f"Baseline saved to {path}")
+    if args.compare:
+        report, n_regressions = compare(results, load_baseline(args.compare), args.threshold)
+        print(report)
+        return 1 if n_regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,306 @@
+"""
+Benchmarks for the hot paths between building mobjects and uploading
+their data to the GPU.
+"""
+from __future__ import annotations
+
+import itertools as it
+import shutil
+
+import numpy as np
+
+from manimlib import *
+from manimlib.mobject.svg.svg_mobject import SVG_HASH_TO_MOB_MAP
+from manimlib.utils.space_ops import EARCLIP_CACHE
+from manimlib.utils.tex_file_writing import latex_to_svg
+
+from benchmarks.harness import benchmark
+from benchmarks.harness import measure
+from benchmarks.harness import retained_memory
+
+
+def circle_grid(n_rows: int = 10, n_cols: int = 10) -> VGroup:
+    # Varying radii, so the circles aren't drawn as instances of one another
+    return VGroup(*(
+        Circle(radius=0.1 + 0.01 * (i % 7), fill_opacity=0.5)
+        for i in range(n_rows * n_cols)
+    )).arrange_in_grid(n_rows, n_cols)
+
+
+def many_holed_shape(n_holes: int = 20) -> VMobject:
+    shape = Square(side_length=6)
+    for i in range(n_holes):
+        hole = Circle(radius=0.1).reverse_points()
+        hole.move_to(2.5 * np.array([np.cos(i), np.sin(i), 0]) * (i / n_holes))
+        shape.append_vectorized_mobject(hole)
+    return shape
+
+
+def svg_string(n_paths: int = 100) -> str:
+    paths = "\n".join(
+        f'<path d="M {i} 0 C {i + 3} 5 {i + 6} -5 {i + 9} 0 S {i + 15} 5 {i + 18} 0 Z" fill="#{i % 256:02x}8080"/>'
+        for i in range(n_paths)
+    )
+    return f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {n_paths + 20} 20">{paths}</svg>'
+
+
+def measure_triangulation(mob: VMobject):
+    def triangulate():
+        # Neither the mobject's triangulation nor the outline cache can help
+        EARCLIP_CACHE.clear()
+        return mob.compute_triangulation()
+    return measure(triangulate)
+
+
+@benchmark("vmobject.get_triangulation.polygon")
+def triangulation_polygon():
+    return measure_triangulation(RegularPolygon(200))
+
+
+@benchmark("vmobject.get_triangulation.holes")
+def triangulation_holes():
+    return measure_triangulation(many_holed_shape())
+
+
+@benchmark("vmobject.get_triangulation.many_holes")
+def triangulation_many_holes():
+    # As with a detailed map, with islands within some of the holes
+    shape = Square(side_length=40)
+    for i in range(1000):
+        center = np.array([i % 32 - 15.5, i // 32 - 15.5, 0])
+        shape.append_vectorized_mobject(Circle(radius=0.3).move_to(center).reverse_points())
+        if i % 3 == 0:
+            shape.append_vectorized_mobject(Circle(radius=0.1).move_to(center))
+    return measure_triangulation(shape)
+
+
+@benchmark("vmobject.point_from_proportion")
+def point_from_proportion():
+    # As when an updater tracks a point moving along a long path
+    path = VMobject().set_points_smoothly([
+        (t * np.cos(t), t * np.sin(t), 0)
+        for t in np.linspace(0, 10 * TAU, 2000)
+    ])
+    alphas = it.cycle(np.linspace(0, 1, 101))
+    return measure(lambda: path.point_from_proportion(next(alphas)))
+
+
+@benchmark("vmobject.rotate")
+def vmobject_rotate():
+    # As when an updater turns a mobject in 3d each frame
+    group = circle_grid()
+
+    def rotate():
+        group.rotate(1e-2, axis=UP + OUT)
+        return [mob.get_shader_data() for mob in group.family_members_with_points()]
+    return measure(rotate)
+
+
+@benchmark("boolean_ops.union")
+def boolean_union():
+    # Overlapping outlines, as when merging the regions of a map
+    shapes = [
+        Circle(radius=0.3 + 0.02 * (i % 5)).move_to([0.4 * (i % 20) - 4, 0.4 * (i // 20) - 2, 0])
+        for i in range(200)
+    ]
+    return measure(lambda: Union(*shapes))
+
+
+@benchmark("boolean_ops.difference")
+def boolean_difference():
+    subject = many_holed_shape()
+    clip = circle_grid()
+    return measure(lambda: Difference(subject, clip))
+
+
+@benchmark("mobject.memory.glyphs")
+def mobject_memory_glyphs():
+    # As with a page of Tex, each glyph being a small mobject of its own
+    string = svg_string(n_paths=1000)
+    SVGMobject(svg_string=string)
+
+    def glyphs():
+        return SVGMobject(svg_string=string)
+    metrics = measure(glyphs, memory=False)
+    metrics["bytes_per_mobject"] = retained_memory(glyphs) / 1000
+    return metrics
+
+
+@benchmark("mobject.copy")
+def mobject_copy():
+    group = circle_grid()
+    return measure(group.copy)
+
+
+@benchmark("transform.interpolate")
+def transform_interpolate():
+    source = circle_grid()
+    target = VGroup(*(Square(side_length=0.2) for _ in source)).arrange_in_grid(10, 10)
+    anim = Transform(source, target)
+    anim.begin()
+    alphas = it.cycle(np.linspace(0, 1, 31))
+    return measure(lambda: anim.interpolate(next(alphas)))
+
+
+@benchmark("transform.begin.mismatched")
+def transform_begin_mismatched():
+    # Aligning shapes with very different numbers of curves and subpaths
+    source = many_holed_shape(n_holes=50)
+    target = VMobject().set_points_smoothly([
+        (3 * np.cos(t), 2 * np.sin(3 * t), 0)
+        for t in np.linspace(0, TAU, 1000)
+    ])
+    return measure(lambda: Transform(source.copy(), target.copy()).begin())
+
+
+@benchmark("transform.interpolate.lagged")
+def transform_interpolate_lagged():
+    source = circle_grid()
+    target = VGroup(*(Square(side_length=0.2) for _ in source)).arrange_in_grid(10, 10)
+    anim = Transform(source, target, lag_ratio=0.05)
+    anim.begin()
+    alphas = it.cycle(np.linspace(0, 1, 31))
+    return measure(lambda: anim.interpolate(next(alphas)))
+
+
+@benchmark("creation.show_creation")
+def show_creation_interpolate():
+    anim = ShowCreation(circle_grid())
+    anim.begin()
+    alphas = it.cycle(np.linspace(0, 1, 31))
+    return measure(lambda: anim.interpolate(next(alphas)))
+
+
+@benchmark("creation.write")
+def write_interpolate():
+    anim = Write(circle_grid())
+    anim.begin()
+    alphas = it.cycle(np.linspace(0, 1, 31))
+    return measure(lambda: anim.interpolate(next(alphas)))
+
+
+@benchmark("vector_field.update")
+def vector_field_update():
+    field = TimeVaryingVectorField(
+        lambda coords, t: np.array([np.sin(coords[:, 1] + t), np.cos(coords[:, 0] - t)]).T,
+        NumberPlane(),
+        density=4,
+    )
+    return measure(lambda: field.update(1 / 30))
+
+
+@benchmark("vector_cloud.update")
+def vector_cloud_update():
+    field = TimeVaryingVectorCloud(
+        lambda coords, t: np.array([np.sin(coords[:, 1] + t), np.cos(coords[:, 0] - t)]).T,
+        NumberPlane(),
+        density=4,
+    )
+    return measure(lambda: field.update(1 / 30))
+
+
+@benchmark("svg.parse.cold")
+def svg_parse_cold():
+    string = svg_string()
+
+    def parse():
+        SVG_HASH_TO_MOB_MAP.clear()
+        return SVGMobject(svg_string=string)
+    return measure(parse)
+
+
+@benchmark("svg.parse.warm")
+def svg_parse_warm():
+    string = svg_string()
+    SVGMobject(svg_string=string)
+    return measure(lambda: SVGMobject(svg_string=string))
+
+
+def require_latex():
+    if shutil.which("latex") is None:
+        raise RuntimeError("latex is not installed")
+
+
+@benchmark("tex.compile.cold")
+def tex_compile_cold():
+    require_latex()
+    counter = it.count()
+    # Distinct content each call, so neither cache can help
+    return measure(
+        lambda: latex_to_svg(f"\\int_0^{{{next(counter)}}} x^2 \\, dx", show_message_during_execution=False),
+        min_time=0, repeat=3,
+    )
+
+
+@benchmark("tex.compile.disk_cache")
+def tex_compile_disk_cache():
+    require_latex()
+    tex = R"\sum_{n=1}^\infty \frac{1}{n^2} = \frac{\pi^2}{6}"
+    latex_to_svg(tex, show_message_during_execution=False)
+
+    def compile_from_disk_cache():
+        latex_to_svg.cache_clear()
+        return latex_to_svg(tex, show_message_during_execution=False)
+    return measure(compile_from_disk_cache)
+
+
+def headless_ctx():
+    if not hasattr(headless_ctx, "ctx"):
+        headless_ctx.ctx = Camera.create_headless_context()
+    return headless_ctx.ctx
+
+
+@benchmark("shader_wrapper.read_in.all_changed")
+def read_in_all_changed():
+    ctx = headless_ctx()
+    group = circle_grid()
+    group.get_shader_wrapper_list(ctx)
+
+    def upload():
+        for mob in group.get_family():
+            mob.note_changed_data(recurse_up=False)
+        return group.get_shader_wrapper_list(ctx)
+    return measure(upload)
+
+
+@benchmark("shader_wrapper.read_in.one_changed")
+def read_in_one_changed():
+    ctx = headless_ctx()
+    group = circle_grid()
+    group.get_shader_wrapper_list(ctx)
+    submob = group[len(group) // 2]
+
+    def upload():
+        submob.note_changed_data()
+        return group.get_shader_wrapper_list(ctx)
+    return measure(upload)
+
+
+@benchmark("shader_wrapper.read_in.instanced")
+def read_in_instanced():
+    ctx = headless_ctx()
+    dots = VGroup(*(Dot() for _ in range(1000))).arrange_in_grid(25, 40)
+    dots.get_shader_wrapper_list(ctx)
+
+    def upload():
+        dots.shift(1e-3 * RIGHT)
+        return dots.get_shader_wrapper_list(ctx)
+    return measure(upload)
+
+
+@benchmark("point_cloud_store.update")
+def point_cloud_store_update():
+    # As with a particle simulation, moving 10^6 points spread over many
+    # clouds each frame
+    ctx = headless_ctx()
+    store = PointCloudStore(*(
+        GlowDots(np.random.random((1000, 3))) for _ in range(1000)
+    ))
+    velocities = np.random.random((10**6, 3))
+    store.get_shader_wrapper_list(ctx)
+
+    def update():
+        store.get_packed_points()[:] += 1e-3 * velocities
+        store.note_changed_packed_data()
+        return store.get_shader_wrapper_list(ctx)
+    return measure(update)
@@ -0,0 +1,143 @@
+"""
+End to end benchmarks, running whole scenes headlessly: those in
+example_scenes.py, and the latest version of each generated scene
+under output/.
+"""
+from __future__ import annotations
+
+import importlib.util
+import inspect
+import re
+import tempfile
+import time
+from pathlib import Path
+
+from addict import Dict
+
+from manimlib import *
+from manimlib.config import manim_config
+from manimlib.extract_scene import is_child_scene
+from manimlib.utils.tracing import start_profiling
+from manimlib.utils.tracing import stop_profiling
+
+from benchmarks.harness import benchmark
+from benchmarks.harness import peak_memory
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+def load_module(path: Path):
+    name = "bench_scene_" + re.sub(r"\W", "_", str(path.relative_to(REPO_ROOT)))
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def get_scene_files() -> dict[str, Path]:
+    """
+    Maps a short label to each scene file, taking only the highest
+    numbered scene_vN.py in each output directory, as the last attempt
+    is the one most likely to render.
+    """
+    files = {"example_scenes": REPO_ROOT / "example_scenes.py"}
+    for out_dir in sorted((REPO_ROOT / "output").glob("*")):
+        versions = sorted(
+            out_dir.glob("scene_v*.py"),
+            key=lambda p: int(re.sub(r"\D", "", p.stem) or 0)
+        )
+        if versions:
+            files[f"output.{out_dir.name}"] = versions[-1]
+    return files
+
+
+def get_scene_config(write_to_movie: bool = False, output_directory: str = "") -> Dict:
+    config = Dict(manim_config.scene)
+    config.file_writer_config = dict(
+        write_to_movie=write_to_movie,
+        save_last_frame=False,
+        quiet=True,
+        output_directory=output_directory,
+    )
+    return config
+
+
+def run_scene(scene_class: type, config: Dict) -> dict[str, float]:
+    """
+    Runs a scene, returning its wall time, along with the number of
+    frames it rendered and how long those took, via the profiler
+    """
+    start_profiling()
+    try:
+        start = time.perf_counter()
+        scene_class(**config).run()
+        seconds = time.perf_counter() - start
+    finally:
+        profiler = stop_profiling()
+    times, calls, counts = profiler.get_totals()
+    frames = counts.get("frames", 0)
+    frame_seconds = times.get("frame_render", 0.0)
+    return dict(
+        seconds=seconds,
+        frames=frames,
+        fps=(frames / seconds if seconds > 0 else 0.0),
+        frame_render_seconds=frame_seconds,
+    )
+
+
+def scene_benchmark(scene_class: type):
+    def run():
+        config = get_scene_config()
+        # The first run also pays for compiling shaders, Tex and Text,
+        # and parsing SVGs, while the second finds them all cached
+        cold = run_scene(scene_class, config)
+        warm = run_scene(scene_class, config)
+        metrics = dict(
+            seconds_cold=cold["seconds"],
+            seconds=warm["seconds"],
+            frames=warm["frames"],
+            fps=warm["fps"],
+            frame_render_seconds=warm["frame_render_seconds"],
+        )
+        metrics["peak_mb"] = peak_memory(lambda: scene_class(**config).run())
+        return metrics
+    return run
+
+
+def register_scene_benchmarks() -> None:
+    for label, path in get_scene_files().items():
+        try:
+            module = load_module(path)
+        except Exception as err:
+            def failed(err=err):
+                raise RuntimeError(f"Could not load scene file: {type(err).__name__}: {err}")
+            benchmark(f"scene.{label}")(failed)
+            continue
+        for name, scene_class in inspect.getmembers(module, lambda x: is_child_scene(x, module)):
+            benchmark(f"scene.{label}.{name}")(scene_benchmark(scene_class))
+
+
+class PipeBenchmarkScene(Scene):
+    def construct(self):
+        self.add(Circle(fill_opacity=0.5), Square(side_length=3))
+        self.wait(4)
+
+
+@benchmark("file_writer.pipe")
+def file_writer_pipe():
+    """
+    Frames per second when every frame is read back from the GPU and piped
+    to ffmpeg, compared with rendering alone, for a scene which is cheap to draw
+    """
+    with tempfile.TemporaryDirectory() as temp_dir:
+        no_writes = run_scene(PipeBenchmarkScene, get_scene_config())
+        writes = run_scene(PipeBenchmarkScene, get_scene_config(True, temp_dir))
+    return dict(
+        seconds=writes["seconds"],
+        frames=writes["frames"],
+        fps=writes["fps"],
+        fps_without_writing=no_writes["fps"],
+    )
+
+
+register_scene_benchmarks()
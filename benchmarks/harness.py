@@ -0,0 +1,221 @@
+"""
+Timing, memory measurement and baseline comparison for the benchmarks.
+
+A benchmark is a function registered with @benchmark, which does any setup
+it needs and returns a dict of metrics, usually by passing the operation
+under test to measure(). Lower values are better, except for frame
+rates, i.e. metrics whose names start with "fps".
+"""
+from __future__ import annotations
+
+import gc
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from typing import Callable
+
+BASELINE_DIR = Path(__file__).parent / "baselines"
+
+# Metrics too noisy, or too dependent on the other metrics, to gate on
+INFORMATIONAL = {"median_seconds", "loops", "frames"}
+
+BENCHMARKS: dict[str, Callable[[], dict[str, float]]] = {}
+
+
+@dataclass
+class Result:
+    name: str
+    metrics: dict[str, float] = field(default_factory=dict)
+    error: str = ""
+
+
+def benchmark(name: str):
+    def decorator(func: Callable[[], dict[str, float]]):
+        BENCHMARKS[name] = func
+        return func
+    return decorator
+
+
+def measure(
+    func: Callable[[], object],
+    min_time: float = 0.2,
+    repeat: int = 5,
+    memory: bool = True,
+) -> dict[str, float]:
+    """
+    Time func in the style of timeit: pick a number of loops taking at
+    least min_time, then report the best and median time per call across
+    repeat samples. With memory=True, one further call is made while
+    tracing allocations, to find its peak memory use.
+    """
+    loops = 1
+    while True:
+        elapsed = _time_loops(func, loops)
+        if elapsed >= min_time or loops >= 1_000_000:
+            break
+        loops *= 2 if elapsed > min_time / 10 else 10
+    samples = [elapsed / loops] + [
+        _time_loops(func, loops) / loops
+        for _ in range(repeat - 1)
+    ]
+    metrics = dict(
+        seconds=min(samples),
+        median_seconds=statistics.median(samples),
+        loops=loops,
+    )
+    if memory:
+        metrics["peak_mb"] = peak_memory(func)
+    return metrics
+
+
+def _time_loops(func: Callable[[], object], loops: int) -> float:
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        for _ in range(loops):
+            func()
+        return time.perf_counter() - start
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+
+def peak_memory(func: Callable[[], object]) -> float:
+    """
+    Peak memory, in MB, allocated through Python (including numpy
+    arrays) during one call of func
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1] / 2**20
+    finally:
+        tracemalloc.stop()
+
+
+def retained_memory(func: Callable[[], object]) -> float:
+    """
+    Memory, in bytes, allocated through Python during one call of func
+    and still held once it returns, i.e. mostly by what it returns
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = func()
+        gc.collect()
+        nbytes = tracemalloc.get_traced_memory()[0]
+        del result
+        return nbytes
+    finally:
+        tracemalloc.stop()
+
+
+def run_benchmarks(names: list[str], verbose: bool = True) -> list[Result]:
+    results = []
+    for name in names:
+        if verbose:
+            print(f"{name} ...", end=" ", flush=True)
+        try:
+            result = Result(name, BENCHMARKS[name]())
+        except Exception as err:
+            result = Result(name, error=f"{type(err).__name__}: {err}")
+        results.append(result)
+        if verbose:
+            print(result.error or format_metrics(result.metrics))
+    return results
+
+
+def format_metrics(metrics: dict[str, float]) -> str:
+    parts = []
+    for key, value in metrics.items():
+        if key.endswith("seconds"):
+            parts.append(f"{key}={format_seconds(value)}")
+        elif isinstance(value, float):
+            parts.append(f"{key}={value:.4g}")
+        else:
+            parts.append(f"{key}={value}")
+    return " ".join(parts)
+
+
+def format_seconds(seconds: float) -> str:
+    for unit, scale in [("s", 1), ("ms", 1e-3), ("us", 1e-6)]:
+        if seconds >= scale:
+            return f"{seconds / scale:.3g}{unit}"
+    return f"{seconds / 1e-9:.3g}ns"
+
+
+def get_machine_info() -> dict[str, str]:
+    info = dict(
+        python=sys.version.split()[0],
+        platform=platform.platform(),
+        processor=platform.processor() or platform.machine(),
+    )
+    try:
+        import numpy
+        info["numpy"] = numpy.__version__
+    except ImportError:
+        pass
+    return info
+
+
+def save_baseline(results: list[Result], name: str, extra_info: dict | None = None) -> Path:
+    BASELINE_DIR.mkdir(exist_ok=True)
+    path = BASELINE_DIR / f"{name}.json"
+    data = dict(
+        machine={**get_machine_info(), **(extra_info or {})},
+        created=time.strftime("%Y-%m-%d %H:%M:%S"),
+        results={
+            r.name: (dict(error=r.error) if r.error else r.metrics)
+            for r in results
+        },
+    )
+    path.write_text(json.dumps(data, indent=2))
+    return path
+
+
+def load_baseline(name: str) -> dict:
+    path = Path(name)
+    if not path.exists():
+        path = BASELINE_DIR / f"{name}.json"
+    return json.loads(path.read_text())
+
+
+def compare(results: list[Result], baseline: dict, threshold: float = 0.1) -> tuple[str, int]:
+    """
+    Returns a report comparing results with a saved baseline, and the
+    number of metrics which got worse by more than the threshold ratio
+    """
+    lines = [f"Compared against baseline from {baseline.get('created', '?')} ({baseline['machine'].get('platform', '?')})"]
+    n_regressions = 0
+    for result in results:
+        old = baseline["results"].get(result.name)
+        if old is None:
+            lines.append(f"  {result.name}: new")
+            continue
+        if result.error or "error" in old:
+            # One which used to run and now fails counts as a regression
+            worse = bool(result.error) and "error" not in old
+            n_regressions += worse
+            line = f"  {result.name}: error now={result.error or '-'} before={old.get('error', '-')}"
+            lines.append(f"{line} REGRESSION" if worse else line)
+            continue
+        for key, value in result.metrics.items():
+            if key in INFORMATIONAL or key not in old or not old[key]:
+                continue
+            ratio = value / old[key]
+            higher_is_better = key.startswith("fps")
+            worse = (ratio < 1 - threshold) if higher_is_better else (ratio > 1 + threshold)
+            better = (ratio > 1 + threshold) if higher_is_better else (ratio < 1 - threshold)
+            flag = "REGRESSION" if worse else ("improved" if better else "")
+            n_regressions += worse
+            lines.append(f"  {result.name}.{key}: {old[key]:.4g} -> {value:.4g} ({ratio:.2f}x) {flag}".rstrip())
+    lines.append(f"{n_regressions} regression(s) beyond {threshold:.0%}")
+    return "\n".join(lines), n_regressions
@@ -9,7 +9,15 @@ if TYPE_CHECKING:
 
 from manimlib.constants import *
 
-from manimlib.window import *
+
+def __getattr__(name: str):
+    # The window needs pyglet, and so a display, so it's only imported
+    # once something asks for it, as __main__ does when showing scenes
+    if name == "Window":
+        from manimlib.window import Window
+        return Window
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 from manimlib.animation.animation import *
 from manimlib.animation.composition import *
@@ -49,10 +57,13 @@ from manimlib.mobject.svg.special_tex import *
 from manimlib.mobject.svg.tex_mobject import *
 from manimlib.mobject.svg.text_mobject import *
 from manimlib.mobject.three_dimensions import *
+from manimlib.mobject.types.arrow_cloud import *
 from manimlib.mobject.types.dot_cloud import *
 from manimlib.mobject.types.image_mobject import *
 from manimlib.mobject.types.point_cloud_mobject import *
+from manimlib.mobject.types.point_cloud_store import *
 from manimlib.mobject.types.surface import *
+from manimlib.mobject.types.video_mobject import *
 from manimlib.mobject.types.vectorized_mobject import *
 from manimlib.mobject.value_tracker import *
 from manimlib.mobject.vector_field import *
@@ -6,7 +6,6 @@ from manimlib.config import manim_config
 from manimlib.config import parse_cli
 import manimlib.extract_scene
 from manimlib.utils.cache import clear_cache
-from manimlib.window import Window
 
 
 from IPython.terminal.embed import KillEmbedded
@@ -27,7 +26,9 @@ def run_scenes():
     run_config = manim_config.run
 
     if run_config.show_in_window:
-        # Create a reusable window
+        # Create a reusable window. This is only imported here,
+        # as pyglet needs a display
+        from manimlib.window import Window
         window = Window(**manim_config.window)
         scene_config.update(window=window)
 
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from copy import deepcopy
 
+import numpy as np
+
 from manimlib.mobject.mobject import _AnimationBuilder
 from manimlib.mobject.mobject import Mobject
 from manimlib.utils.iterables import remove_list_redundancies
@@ -165,6 +167,15 @@ class Animation(object):
         # Typically ipmlemented by subclass
         pass
 
+    def get_sub_alphas(self, alpha: float) -> np.ndarray:
+        """
+        Array of the sub_alpha for each of self.families, as used by
+        interpolate_mobject
+        """
+        alpha = self.time_spanned_alpha(alpha)
+        n = len(self.families)
+        return np.array([self.get_sub_alpha(alpha, i, n) for i in range(n)], dtype=float)
+
     def get_sub_alpha(
         self,
         alpha: float,
@@ -5,6 +5,9 @@ from abc import ABC, abstractmethod
 import numpy as np
 
 from manimlib.animation.animation import Animation
+from manimlib.animation.fused_interpolation import FusedPartial
+from manimlib.animation.fused_interpolation import FusedTransform
+from manimlib.animation.fused_interpolation import PackedFamily
 from manimlib.mobject.svg.string_mobject import StringMobject
 from manimlib.mobject.types.vectorized_mobject import VMobject
 from manimlib.utils.bezier import integer_interpolate
@@ -49,6 +52,34 @@ class ShowCreation(ShowPartial):
     def __init__(self, mobject: Mobject, lag_ratio: float = 1.0, **kwargs):
         super().__init__(mobject, lag_ratio=lag_ratio, **kwargs)
 
+    def begin(self) -> None:
+        self.fused = None
+        super().begin()
+        # Where possible, draw the whole family with one vectorized pass
+        # over its points each frame, rather than curve by curve
+        fusable = all((
+            type(self).interpolate_submobject is ShowPartial.interpolate_submobject,
+            type(self).get_bounds is ShowCreation.get_bounds,
+            FusedPartial.can_fuse(self.mobject, self.starting_mobject),
+        ))
+        if fusable:
+            self.fused = FusedPartial(
+                PackedFamily(self.mobject.get_family(), bind=True),
+                self.starting_mobject,
+            )
+
+    def finish(self) -> None:
+        super().finish()
+        if self.fused is not None:
+            self.fused.mobject.unbind()
+            self.fused = None
+
+    def interpolate_mobject(self, alpha: float) -> None:
+        if self.fused is not None and self.fused.is_bound():
+            self.fused.become_partial(self.get_sub_alphas(alpha))
+        else:
+            super().interpolate_mobject(alpha)
+
     def get_bounds(self, alpha: float) -> tuple[float, float]:
         return (0, alpha)
 
@@ -100,13 +131,64 @@ class DrawBorderThenFill(Animation):
     def begin(self) -> None:
         self.mobject.set_animating_status(True)
         self.outline = self.get_outline()
+        self.fused_partial = None
+        self.fused_transform = None
         super().begin()
         self.mobject.match_style(self.outline)
+        self.init_fused_interpolation()
+
+    def init_fused_interpolation(self) -> None:
+        """
+        Where possible, packs the data of the whole family, so that each
+        frame draws the outlines of some submobjects, and fills in others,
+        with one vectorized pass for each, rather than several small ones
+        for each submobject
+        """
+        if type(self).interpolate_submobject is not DrawBorderThenFill.interpolate_submobject:
+            return
+        if not FusedPartial.can_fuse(self.mobject, self.outline):
+            return
+        if not FusedTransform.can_fuse(self.mobject, self.outline, self.starting_mobject):
+            return
+        packed = PackedFamily(self.mobject.get_family(), bind=True)
+        self.fused_partial = FusedPartial(packed, self.outline)
+        self.fused_transform = FusedTransform(packed, self.outline, self.starting_mobject)
+        self.filled = np.array([self.sm_to_index[hash(sm)] == 1 for sm in packed.family])
 
     def finish(self) -> None:
         super().finish()
+        if self.fused_partial is not None:
+            self.fused_partial.mobject.unbind()
+            self.fused_partial = None
+            self.fused_transform = None
         self.mobject.refresh_joint_angles()
 
+    def interpolate_mobject(self, alpha: float) -> None:
+        if self.fused_partial is None or not self.fused_partial.is_bound():
+            super().interpolate_mobject(alpha)
+            return
+        # As in interpolate_submobject, each submobject spends the first
+        # half of its sub_alpha drawing its outline, and the second half
+        # going from its outline to its final style
+        sub_alphas = self.get_sub_alphas(alpha)
+        filling = sub_alphas >= 0.5
+        phase_alphas = np.where(sub_alphas >= 1, 1.0, (2 * sub_alphas) % 1)
+        if not filling.all():
+            self.fused_partial.become_partial(phase_alphas, members=~filling)
+        if filling.any():
+            family = self.fused_partial.mobject.family
+            for index in np.flatnonzero(filling & ~self.filled):
+                # First time crossing over, where interpolate_submobject
+                # would call set_data, which also marks the shape of the
+                # submobject's family as changed, so that joint angles and
+                # normals get recomputed
+                submob = family[index]
+                submob.refresh_bounding_box()
+                submob.note_changed_shape()
+                self.sm_to_index[hash(submob)] = 1
+            self.filled |= filling
+            self.fused_transform.interpolate(phase_alphas, members=filling)
+
     def get_outline(self) -> VMobject:
         outline = self.mobject.copy()
         outline.set_fill(opacity=0)
@@ -0,0 +1,284 @@
+from __future__ import annotations
+
+import numpy as np
+
+from manimlib.mobject.mobject import Mobject
+from manimlib.mobject.types.vectorized_mobject import VMobject
+from manimlib.utils.iterables import concatenate_records
+from manimlib.utils.paths import straight_path
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Callable, Optional
+
+
+class PackedFamily(object):
+    """
+    Copies the data of a family of mobjects sharing one data dtype into a
+    single contiguous array, along with their bounding boxes, so that one
+    vectorized operation can act on the whole family, rather than several
+    small ones for each member.
+
+    With bind=True, the data and bounding box of each mobject are then
+    replaced by views into the packed arrays, so writing to those updates
+    every mobject in place, until unbind is called.
+    """
+    def __init__(self, family: list[Mobject], bind: bool = False):
+        self.family = family
+        self.lengths = np.array([len(mob.data) for mob in family], dtype=int)
+        self.starts = np.cumsum(self.lengths) - self.lengths
+        self.data = concatenate_records([mob.data for mob in family])
+        self.bounding_boxes = np.array([mob.bounding_box for mob in family])
+        # For each vertex, the index of the mobject it belongs to, and its
+        # index within that mobject's data
+        self.owners = np.repeat(np.arange(len(family)), self.lengths)
+        self.local_indices = np.arange(len(self.data)) - self.starts[self.owners]
+        self.views: list[np.ndarray] = []
+        if bind:
+            self.bind()
+
+    @staticmethod
+    def can_pack(*families: list[Mobject]) -> bool:
+        dtype = families[0][0].data.dtype
+        return all(
+            mob.data.dtype == dtype
+            for family in families
+            for mob in family
+        )
+
+    def bind(self) -> None:
+        self.views = [
+            self.data[start:start + length]
+            for start, length in zip(self.starts, self.lengths)
+        ]
+        for mob, view, bounding_box in zip(self.family, self.views, self.bounding_boxes):
+            mob.data = view
+            mob.bounding_box = bounding_box
+
+    def is_bound(self) -> bool:
+        """
+        False once any mobject's data has been replaced, e.g. by resizing
+        """
+        return bool(self.views) and all(
+            mob.data is view
+            for mob, view in zip(self.family, self.views)
+        )
+
+    def unbind(self) -> None:
+        for mob, view in zip(self.family, self.views):
+            if mob.data is view:
+                mob.data = view.copy()
+            mob.bounding_box = mob.bounding_box.copy()
+        self.views = []
+
+    def vertex_alphas(self, alphas: np.ndarray | float, ndim: int) -> np.ndarray | float:
+        """
+        Spreads one alpha per mobject over its vertices, shaped to broadcast
+        against a data field with ndim dimensions
+        """
+        if isinstance(alphas, float):
+            return alphas
+        return alphas[self.owners].reshape(-1, *(ndim - 1) * [1])
+
+    def note_changed_data(self) -> None:
+        for mob in self.family:
+            mob.note_changed_data(recurse_up=False)
+        # Parents of the family's root still need to know
+        self.family[0].note_changed_data()
+
+    def refresh_bounding_boxes(self, members: np.ndarray) -> None:
+        """
+        Marks the bounding boxes of members whose points moved as needing
+        to be recomputed, along with those of any groups containing them
+        """
+        for mob, moved in zip(self.family, members):
+            if moved or mob.submobjects:
+                mob._needs_new_bounding_box = True
+        self.family[0].refresh_bounding_box()
+
+
+def uniform_alpha(alphas: np.ndarray) -> Optional[float]:
+    """
+    The shared value, if all alphas are equal, which lets path functions
+    which only take a single alpha act on the whole family
+    """
+    if len(alphas) > 0 and (alphas == alphas[0]).all():
+        return float(alphas[0])
+    return None
+
+
+class FusedTransform(object):
+    """
+    Does what calling Mobject.interpolate on each member of an aligned
+    family would do, with a single vectorized interpolation per data key
+    across the whole family, which is packed and bound in mobject
+    """
+    def __init__(self, mobject: PackedFamily, start: Mobject, target: Mobject):
+        family = mobject.family
+        self.mobject = mobject
+        self.start = PackedFamily(start.get_family())
+        self.target = PackedFamily(target.get_family())
+        self.pointlike_data_keys = family[0].pointlike_data_keys
+        # Keys locked for every member stay as they are
+        self.keys = [
+            key for key in mobject.data.dtype.names
+            if not all(key in mob.locked_data_keys for mob in family)
+        ]
+        # Uniforms are few, so only those which change are interpolated,
+        # one member at a time
+        self.uniform_terms = [
+            (index, mob, key, sm1.uniforms[key], sm2.uniforms[key])
+            for index, (mob, sm1, sm2) in enumerate(zip(family, self.start.family, self.target.family))
+            for key in mob.uniforms
+            if key not in mob.locked_uniform_keys
+            if key in sm1.uniforms and key in sm2.uniforms
+            if not np.all(sm1.uniforms[key] == sm2.uniforms[key])
+        ]
+
+    @staticmethod
+    def can_fuse(mobject: Mobject, start: Mobject, target: Mobject) -> bool:
+        families = [mob.get_family() for mob in (mobject, start, target)]
+        return all((
+            not any(mob.has_updaters() for mob in (mobject, start, target)),
+            len(set(map(len, families))) == 1,
+            all(type(mob).interpolate is Mobject.interpolate for mob in families[0]),
+            PackedFamily.can_pack(*families),
+        )) and all(
+            len(sm.data) == len(sm1.data) == len(sm2.data)
+            for sm, sm1, sm2 in zip(*families)
+        )
+
+    def is_bound(self) -> bool:
+        return self.mobject.is_bound()
+
+    def interpolate(
+        self,
+        alphas: np.ndarray,
+        path_func: Callable[[np.ndarray, np.ndarray, float], np.ndarray] = straight_path,
+        members: Optional[np.ndarray] = None,
+    ) -> bool:
+        """
+        Interpolates each member with its own alpha, from alphas. If a
+        boolean array members is given, only those where it's True change.
+
+        Returns False without changing anything if path_func can't take
+        those alphas, as only straight_path is known to accept an array.
+        """
+        packed = self.mobject
+        if members is None:
+            members = np.ones(len(alphas), dtype=bool)
+            vertices = slice(None)
+        else:
+            vertices = np.flatnonzero(members[packed.owners])
+
+        alpha = uniform_alpha(alphas[members])
+        if alpha is None:
+            if path_func is not straight_path:
+                return False
+            alpha = alphas
+
+        for key in self.keys:
+            md1 = self.start.data[key][vertices]
+            md2 = self.target.data[key][vertices]
+            vertex_alpha = packed.vertex_alphas(alpha, md1.ndim)
+            if not isinstance(vertex_alpha, float):
+                vertex_alpha = vertex_alpha[vertices]
+            if key in self.pointlike_data_keys:
+                packed.data[key][vertices] = path_func(md1, md2, vertex_alpha)
+            else:
+                packed.data[key][vertices] = (1 - vertex_alpha) * md1 + vertex_alpha * md2
+        if self.keys:
+            packed.note_changed_data()
+
+        for index, mob, key, u1, u2 in self.uniform_terms:
+            if members[index]:
+                a = alphas[index]
+                mob.uniforms[key] = (1 - a) * u1 + a * u2
+
+        box_alpha = alpha if isinstance(alpha, float) else np.repeat(alpha[members], 3)[:, np.newaxis]
+        packed.bounding_boxes[members] = path_func(
+            self.start.bounding_boxes[members].reshape(-1, 3),
+            self.target.bounding_boxes[members].reshape(-1, 3),
+            box_alpha,
+        ).reshape(-1, 3, 3)
+        return True
+
+
+class FusedPartial(object):
+    """
+    Does what calling VMobject.pointwise_become_partial(source, 0, b) on
+    each member of a family would do, with one vectorized pass over the
+    points of the whole family, for a separate b for each member. The
+    family is packed and bound in mobject.
+    """
+    def __init__(self, mobject: PackedFamily, source: VMobject):
+        self.mobject = mobject
+        self.source = PackedFamily(source.get_family())
+        self.num_curves = self.mobject.lengths // 2
+
+    @staticmethod
+    def can_fuse(mobject: Mobject, source: Mobject) -> bool:
+        families = [mob.get_family() for mob in (mobject, source)]
+        return all((
+            not any(mob.has_updaters() for mob in (mobject, source)),
+            len(families[0]) == len(families[1]),
+            all(
+                isinstance(mob, VMobject) and type(mob).pointwise_become_partial is VMobject.pointwise_become_partial
+                for mob in families[0]
+            ),
+            PackedFamily.can_pack(*families),
+        )) and all(
+            len(sm.data) == len(sm1.data)
+            for sm, sm1 in zip(*families)
+        )
+
+    def is_bound(self) -> bool:
+        return self.mobject.is_bound()
+
+    def become_partial(self, alphas: np.ndarray, members: Optional[np.ndarray] = None) -> None:
+        """
+        Sets each member to the portion of its source from 0 to its alpha.
+        If a boolean array members is given, only those where it's True
+        are changed.
+        """
+        packed = self.mobject
+        n_curves = self.num_curves
+
+        # As in integer_interpolate, the curve each alpha falls on, and
+        # how far along it
+        scaled = np.clip(alphas, 0, 1) * n_curves
+        curve_index = np.clip(np.floor(scaled), 0, np.maximum(n_curves - 1, 0)).astype(int)
+        residue = scaled - curve_index
+
+        # With no curves, only the joint angles get copied, unless the
+        # whole of the source is asked for
+        keep_points = (n_curves == 0) & (alphas < 1)
+        changed = np.ones(len(n_curves), dtype=bool) if members is None else members
+        vertices = np.flatnonzero(changed[packed.owners])
+        owners = packed.owners[vertices]
+        local = packed.local_indices[vertices]
+
+        src_points = self.source.data["point"]
+        points = src_points[vertices]
+        i1 = 2 * curve_index[owners]
+        r = residue[owners][:, np.newaxis]
+        first = packed.starts[owners] + i1
+        has_curve = n_curves[owners] > 0
+        p0 = src_points[np.where(has_curve, first, vertices)]
+        p1 = src_points[np.where(has_curve, first + 1, vertices)]
+        p2 = src_points[np.where(has_curve, first + 2, vertices)]
+        # Partial quadratic bezier from 0 to r, followed by its end point
+        h1 = (1 - r) * p0 + r * p1
+        h2 = (1 - r) * (1 - r) * p0 + 2 * r * (1 - r) * p1 + r * r * p2
+        points = np.where((local == i1 + 1)[:, np.newaxis], h1, points)
+        points = np.where((local >= i1 + 2)[:, np.newaxis], h2, points)
+        update = ~keep_points[owners]
+        packed.data["point"][vertices[update]] = points[update]
+
+        joint_angles = self.source.data["joint_angle"][vertices]
+        joint_angles[(local >= i1 + 3) & has_curve] = 0
+        packed.data["joint_angle"][vertices] = joint_angles
+
+        packed.refresh_bounding_boxes(changed & ~keep_points)
+        packed.note_changed_data()
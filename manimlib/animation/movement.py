@@ -114,5 +114,5 @@ class MoveAlongPath(Animation):
         super().__init__(mobject, suspend_mobject_updating=suspend_mobject_updating, **kwargs)
 
     def interpolate_mobject(self, alpha: float) -> None:
-        point = self.path.quick_point_from_proportion(self.rate_func(alpha))
+        point = self.path.point_from_proportion(self.rate_func(alpha))
         self.mobject.move_to(point)
@@ -45,7 +45,9 @@ class Rotating(Animation):
             self.starting_mobject.family_members_with_points(),
         )
         for sm1, sm2 in pairs:
-            for key in sm1.pointlike_data_keys:
+            # Data derived from the points, like normals, is reset along
+            # with them, so that rotating can carry it along too
+            for key in [*sm1.pointlike_data_keys, *sm1.derived_data_keys]:
                 sm1.data[key][:] = sm2.data[key]
         self.mobject.rotate(
             self.rate_func(self.time_spanned_alpha(alpha)) * self.angle,
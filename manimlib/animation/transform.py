@@ -5,6 +5,8 @@ import inspect
 import numpy as np
 
 from manimlib.animation.animation import Animation
+from manimlib.animation.fused_interpolation import FusedTransform
+from manimlib.animation.fused_interpolation import PackedFamily
 from manimlib.constants import DEG
 from manimlib.constants import OUT
 from manimlib.mobject.mobject import Group
@@ -64,15 +66,38 @@ class Transform(Animation):
             # change the structure of both arguments
             self.target_copy = self.target_mobject.copy()
         self.mobject.align_data_and_family(self.target_copy)
+        self.fused = None
         super().begin()
         if not self.mobject.has_updaters():
             self.mobject.lock_matching_data(
                 self.starting_mobject,
                 self.target_copy,
             )
+            self.init_fused_interpolation()
+
+    def init_fused_interpolation(self) -> None:
+        """
+        Where possible, packs the data of the whole family so that each
+        frame is one vectorized interpolation, rather than several small
+        ones for each submobject
+        """
+        if type(self).interpolate_submobject is not Transform.interpolate_submobject:
+            return
+        if type(self).get_all_families_zipped is not Transform.get_all_families_zipped:
+            return
+        if not FusedTransform.can_fuse(self.mobject, self.starting_mobject, self.target_copy):
+            return
+        self.fused = FusedTransform(
+            PackedFamily(self.mobject.get_family(), bind=True),
+            self.starting_mobject,
+            self.target_copy,
+        )
 
     def finish(self) -> None:
         super().finish()
+        if self.fused is not None:
+            self.fused.mobject.unbind()
+            self.fused = None
         self.mobject.unlock_data()
 
     def create_target(self) -> Mobject:
@@ -118,6 +143,12 @@ class Transform(Animation):
             ]
         ])
 
+    def interpolate_mobject(self, alpha: float) -> None:
+        if self.fused is not None and self.fused.is_bound():
+            if self.fused.interpolate(self.get_sub_alphas(alpha), self.path_func):
+                return
+        super().interpolate_mobject(alpha)
+
     def interpolate_submobject(
         self,
         submob: Mobject,
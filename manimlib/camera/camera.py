@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import sys
+
 import moderngl
 import numpy as np
 import OpenGL.GL as gl
@@ -10,6 +12,7 @@ from manimlib.constants import BLACK
 from manimlib.constants import DEFAULT_RESOLUTION
 from manimlib.constants import FRAME_HEIGHT
 from manimlib.constants import FRAME_WIDTH
+from manimlib.logger import log
 from manimlib.mobject.mobject import Mobject
 from manimlib.mobject.mobject import Point
 from manimlib.utils.color import color_to_rgba
@@ -71,13 +74,26 @@ class Camera(object):
 
     def init_context(self) -> None:
         if self.window is None:
-            self.ctx: moderngl.Context = moderngl.create_standalone_context()
+            self.ctx: moderngl.Context = self.create_headless_context()
         else:
             self.ctx: moderngl.Context = self.window.ctx
 
         self.ctx.enable(moderngl.PROGRAM_POINT_SIZE)
         self.ctx.enable(moderngl.BLEND)
 
+    @staticmethod
+    def create_headless_context() -> moderngl.Context:
+        """
+        On Linux, this prefers EGL, which needs no display server,
+        falling back to the default (X11) context if EGL is unavailable
+        """
+        if sys.platform.startswith("linux"):
+            try:
+                return moderngl.create_standalone_context(backend="egl")
+            except Exception as err:
+                log.debug(f"Unable to create EGL context, falling back to default: {err}")
+        return moderngl.create_standalone_context()
+
     def init_fbo(self) -> None:
         # This is the buffer used when writing to a video/image file
         self.fbo_for_files = self.get_fbo(self.samples)
@@ -196,6 +196,26 @@ def parse_cli():
             help="Calculate total framecount, to display in a progress bar, by doing " + \
                  "an initial run of the scene which skips animations."
         )
+        parser.add_argument(
+            "--profile",
+            action="store_true",
+            help="Time each stage of frame rendering, and count buffer uploads, " + \
+                 "shader compiles and cache hits, for each animation, then print " + \
+                 "a report when the scene ends",
+        )
+        parser.add_argument(
+            "--checkpoint_interval",
+            type=int,
+            help="When writing to a movie, save a checkpoint of the scene " + \
+                 "every this many animations, so an interrupted render " + \
+                 "can be picked up again with --resume",
+        )
+        parser.add_argument(
+            "--resume",
+            action="store_true",
+            help="Continue a movie render from its latest checkpoint, " + \
+                 "only rendering the frames which remain",
+        )
         parser.add_argument(
             "--video_dir",
             help="Directory to write video",
@@ -278,7 +298,10 @@ def update_file_writer_config(config: Dict, args: Namespace):
         open_file_upon_completion=args.open,
         show_file_location_upon_completion=args.finder,
         quiet=args.quiet,
+        resume=args.resume,
     )
+    if args.checkpoint_interval is not None:
+        file_writer_config.checkpoint_interval = args.checkpoint_interval
 
     if args.vcodec:
         file_writer_config.video_codec = args.vcodec
@@ -305,6 +328,7 @@ def update_scene_config(config: Dict, args: Namespace):
         start_at_animation_number=start,
         end_at_animation_number=end,
         presenter_mode=args.presenter_mode,
+        profile=args.profile,
     )
     if args.leave_progress_bars:
         scene_config.leave_progress_bars = True
@@ -0,0 +1,27 @@
+# Key symbols and modifier flags, with the same values as in
+# pyglet.window.key, which are what the window reports in key events.
+# They live here so that scenes can refer to them without importing
+# pyglet.window, which needs a display, e.g. when rendering headless.
+
+MOD_SHIFT = 1 << 0
+MOD_CTRL = 1 << 1
+MOD_ALT = 1 << 2
+MOD_CAPSLOCK = 1 << 3
+MOD_NUMLOCK = 1 << 4
+MOD_WINDOWS = 1 << 5
+MOD_COMMAND = 1 << 6
+MOD_OPTION = 1 << 7
+MOD_SCROLLLOCK = 1 << 8
+MOD_FUNCTION = 1 << 9
+
+BACKSPACE = 0xff08
+TAB = 0xff09
+SPACE = 0x020
+
+LEFT = 0xff51
+UP = 0xff52
+RIGHT = 0xff53
+DOWN = 0xff54
+
+LSHIFT = 0xffe1
+LCTRL = 0xffe3
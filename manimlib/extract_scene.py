@@ -72,6 +72,7 @@ def compute_total_frames(scene_class, scene_config):
     pre_config["file_writer_config"]["save_last_frame"] = False
     pre_config["file_writer_config"]["quiet"] = True
     pre_config["skip_animations"] = True
+    pre_config["profile"] = False
     pre_scene = scene_class(**pre_config)
     pre_scene.run()
     total_time = pre_scene.time - pre_scene.skip_time
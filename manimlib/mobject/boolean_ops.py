@@ -4,22 +4,51 @@ import numpy as np
 import pathops
 
 from manimlib.mobject.types.vectorized_mobject import VMobject
+from manimlib.utils.bezier import get_quadratic_approximation_of_cubic
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Sequence
 
 
 # Boolean operations between 2D mobjects
 # Borrowed from https://github.com/ManimCommunity/manim/
 
-def _convert_vmobject_to_skia_path(vmobject: VMobject) -> pathops.Path:
-    path = pathops.Path()
+PathVerb = pathops.PathVerb
+PathOp = pathops.PathOp
+
+# How many points skia stores with each kind of verb
+POINTS_PER_VERB = np.array([1, 1, 2, 2, 3, 0])  # MOVE, LINE, QUAD, CONIC, CUBIC, CLOSE
+
+
+def _convert_vmobject_to_skia_path(
+    vmobject: VMobject,
+    path: pathops.Path | None = None
+) -> pathops.Path:
+    """
+    Adds the subpaths of vmobject and its family to path, or to a new one
+    """
+    if path is None:
+        path = pathops.Path()
+    # pathops has no way to build a path from arrays, so this keeps the
+    # work done per curve down to a single call on plain floats
+    move_to = path.moveTo
+    quad_to = path.quadTo
+    close = path.close
+    tol = vmobject.tolerance_for_point_equality
     for submob in vmobject.family_members_with_points():
-        for subpath in submob.get_subpaths():
-            quads = vmobject.get_bezier_tuples_from_points(subpath)
-            start = subpath[0]
-            path.moveTo(*start[:2])
-            for p0, p1, p2 in quads:
-                path.quadTo(*p1[:2], *p2[:2])
-            if vmobject.consider_points_equal(subpath[0], subpath[-1]):
-                path.close()
+        points = submob.get_points()
+        ends = submob.get_subpath_end_indices()
+        starts = np.array([0, *(ends[:-1] + 2)])
+        closed = (abs(points[starts] - points[ends]) < tol).all(1)
+        xys = points[:, :2].tolist()
+        for start, end, is_closed in zip(starts, ends, closed):
+            move_to(*xys[start])
+            for i in range(start + 1, end, 2):
+                quad_to(*xys[i], *xys[i + 1])
+            if is_closed:
+                close()
     return path
 
 
@@ -27,52 +56,114 @@ def _convert_skia_path_to_vmobject(
     path: pathops.Path,
     vmobject: VMobject
 ) -> VMobject:
-    PathVerb = pathops.PathVerb
-    current_path_start = np.array([0.0, 0.0, 0.0])
-    for path_verb, points in path:
-        if path_verb == PathVerb.CLOSE:
-            vmobject.add_line_to(current_path_start)
-        else:
-            points = np.hstack((np.array(points), np.zeros((len(points), 1))))
-            if path_verb == PathVerb.MOVE:
-                for point in points:
-                    current_path_start = point
-                    vmobject.start_new_path(point)
-            elif path_verb == PathVerb.CUBIC:
-                vmobject.add_cubic_bezier_curve_to(*points)
-            elif path_verb == PathVerb.LINE:
-                vmobject.add_line_to(points[0])
-            elif path_verb == PathVerb.QUAD:
-                vmobject.add_quadratic_bezier_curve_to(*points)
-            else:
-                raise Exception(f"Unsupported: {path_verb}")
+    """
+    Sets the points of vmobject to match path, with the same result as
+    starting a new subpath for each move, a line for each line and close,
+    and a quadratic curve for each quad or cubic, but all in one set_points
+    """
+    verbs = np.fromiter(path.verbs, dtype=int)
+    if len(verbs) == 0:
+        return vmobject
+    if (verbs == PathVerb.CONIC).any():
+        raise Exception(f"Unsupported: {PathVerb.CONIC}")
+    xys = np.array(path.points, dtype=float).reshape(-1, 2)
+    skia_points = np.hstack([xys, np.zeros((len(xys), 1))])
+
+    # Where each verb ends, with closes going back to the most recent move
+    last_index = np.cumsum(POINTS_PER_VERB[verbs]) - 1
+    is_move = verbs == PathVerb.MOVE
+    move_verb = np.maximum.accumulate(np.where(is_move, np.arange(len(verbs)), 0))
+    end_index = np.where(verbs == PathVerb.CLOSE, last_index[move_verb], last_index)
+    ends = skia_points[end_index]
+    prev_ends = np.vstack([ends[:1], ends[:-1]])
+
+    # Each verb adds handle and anchor pairs, with a move adding one whose
+    # handle sits on the last anchor, which marks where a subpath ends
+    is_line = (verbs == PathVerb.LINE) | (verbs == PathVerb.CLOSE)
+    is_quad = verbs == PathVerb.QUAD
+    is_cubic = verbs == PathVerb.CUBIC
+    n_line_curves = 2 if vmobject.long_lines else 1
+    n_curves = np.ones(len(verbs), dtype=int)
+    n_curves[is_line] = n_line_curves
+    n_curves[is_cubic] = 2
+    offsets = 2 * (np.cumsum(n_curves) - n_curves)
+    points = np.zeros((2 * n_curves.sum(), 3))
+
+    points[offsets[is_move]] = prev_ends[is_move]
+    points[offsets[is_move] + 1] = ends[is_move]
+
+    alphas = np.linspace(0, 1, 2 * n_line_curves + 1)[1:]
+    line_offsets = offsets[is_line]
+    for i, alpha in enumerate(alphas):
+        points[line_offsets + i] = (1 - alpha) * prev_ends[is_line] + alpha * ends[is_line]
+
+    tol = vmobject.tolerance_for_point_equality
+    handles = skia_points[last_index[is_quad] - 1]
+    anchors = ends[is_quad]
+    # As in add_quadratic_bezier_curve_to, a handle on top of the previous
+    # anchor would mark the end of a subpath, so it's moved off of it
+    on_prev = (abs(handles - prev_ends[is_quad]) < tol).all(1)
+    handles[on_prev] = 0.5 * (handles[on_prev] + anchors[on_prev])
+    points[offsets[is_quad]] = handles
+    points[offsets[is_quad] + 1] = anchors
+
+    if is_cubic.any():
+        cubic_index = last_index[is_cubic]
+        quad_approx = get_quadratic_approximation_of_cubic(
+            prev_ends[is_cubic],
+            skia_points[cubic_index - 2],
+            skia_points[cubic_index - 1],
+            skia_points[cubic_index],
+        ).reshape(-1, 5, 3)
+        on_prev = (abs(quad_approx[:, 1] - quad_approx[:, 0]) < tol).all(1)
+        quad_approx[on_prev, 1] = 0.5 * (quad_approx[on_prev, 1] + quad_approx[on_prev, 2])
+        for i in range(4):
+            points[offsets[is_cubic] + i] = quad_approx[:, i + 1]
+
+    # The first move starts the first subpath, with nothing before it
+    vmobject.set_points(points[1:])
     return vmobject.reverse_points()
 
 
+def _skia_union(vmobjects: Sequence[VMobject]) -> pathops.Path:
+    """
+    Draws all vmobjects into one path, and simplifies it, as pathops.union
+    does, but without redrawing every path through a pen along the way
+    """
+    path = pathops.Path()
+    for vmobject in vmobjects:
+        _convert_vmobject_to_skia_path(vmobject, path)
+    path.simplify(fix_winding=True, keep_starting_points=True)
+    return path
+
+
+def _skia_op(vmobjects: Sequence[VMobject], operation: PathOp) -> pathops.Path:
+    """
+    Applies operation between the first of vmobjects and each of the rest
+    in turn, within a single call into skia. Note, this isn't used for
+    unions, where skia's builder mishandles paths with holes.
+    """
+    builder = pathops.OpBuilder()
+    for index, vmobject in enumerate(vmobjects):
+        builder.add(
+            _convert_vmobject_to_skia_path(vmobject),
+            PathOp.UNION if index == 0 else operation,
+        )
+    return builder.resolve()
+
+
 class Union(VMobject):
     def __init__(self, *vmobjects: VMobject, **kwargs):
         if len(vmobjects) < 2:
             raise ValueError("At least 2 mobjects needed for Union.")
         super().__init__(**kwargs)
-        outpen = pathops.Path()
-        paths = [
-            _convert_vmobject_to_skia_path(vmobject)
-            for vmobject in vmobjects
-        ]
-        pathops.union(paths, outpen.getPen())
-        _convert_skia_path_to_vmobject(outpen, self)
+        _convert_skia_path_to_vmobject(_skia_union(vmobjects), self)
 
 
 class Difference(VMobject):
     def __init__(self, subject: VMobject, clip: VMobject, **kwargs):
         super().__init__(**kwargs)
-        outpen = pathops.Path()
-        pathops.difference(
-            [_convert_vmobject_to_skia_path(subject)],
-            [_convert_vmobject_to_skia_path(clip)],
-            outpen.getPen(),
-        )
-        _convert_skia_path_to_vmobject(outpen, self)
+        _convert_skia_path_to_vmobject(_skia_op([subject, clip], PathOp.DIFFERENCE), self)
 
 
 class Intersection(VMobject):
@@ -80,22 +171,7 @@ class Intersection(VMobject):
         if len(vmobjects) < 2:
             raise ValueError("At least 2 mobjects needed for Intersection.")
         super().__init__(**kwargs)
-        outpen = pathops.Path()
-        pathops.intersection(
-            [_convert_vmobject_to_skia_path(vmobjects[0])],
-            [_convert_vmobject_to_skia_path(vmobjects[1])],
-            outpen.getPen(),
-        )
-        new_outpen = outpen
-        for _i in range(2, len(vmobjects)):
-            new_outpen = pathops.Path()
-            pathops.intersection(
-                [outpen],
-                [_convert_vmobject_to_skia_path(vmobjects[_i])],
-                new_outpen.getPen(),
-            )
-            outpen = new_outpen
-        _convert_skia_path_to_vmobject(outpen, self)
+        _convert_skia_path_to_vmobject(_skia_op(vmobjects, PathOp.INTERSECTION), self)
 
 
 class Exclusion(VMobject):
@@ -103,19 +179,4 @@ class Exclusion(VMobject):
         if len(vmobjects) < 2:
             raise ValueError("At least 2 mobjects needed for Exclusion.")
         super().__init__(**kwargs)
-        outpen = pathops.Path()
-        pathops.xor(
-            [_convert_vmobject_to_skia_path(vmobjects[0])],
-            [_convert_vmobject_to_skia_path(vmobjects[1])],
-            outpen.getPen(),
-        )
-        new_outpen = outpen
-        for _i in range(2, len(vmobjects)):
-            new_outpen = pathops.Path()
-            pathops.xor(
-                [outpen],
-                [_convert_vmobject_to_skia_path(vmobjects[_i])],
-                new_outpen.getPen(),
-            )
-            outpen = new_outpen
-        _convert_skia_path_to_vmobject(outpen, self)
+        _convert_skia_path_to_vmobject(_skia_op(vmobjects, PathOp.XOR), self)
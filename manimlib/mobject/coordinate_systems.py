@@ -23,8 +23,9 @@ from manimlib.mobject.types.surface import ParametricSurface
 from manimlib.mobject.types.vectorized_mobject import VGroup
 from manimlib.mobject.types.vectorized_mobject import VMobject
 from manimlib.utils.bezier import inverse_interpolate
+from manimlib.utils.bezier import quadratic_bezier_parameter
+from manimlib.utils.bezier import quadratic_bezier_points_at
 from manimlib.utils.dict_ops import merge_dicts_recursively
-from manimlib.utils.simple_functions import binary_search
 from manimlib.utils.space_ops import angle_of_vector
 from manimlib.utils.space_ops import get_norm
 from manimlib.utils.space_ops import rotate_vector
@@ -231,18 +232,18 @@ class CoordinateSystem(ABC):
         if hasattr(graph, "underlying_function"):
             return self.coords_to_point(x, graph.underlying_function(x))
         else:
-            alpha = binary_search(
-                function=lambda a: self.point_to_coords(
-                    graph.quick_point_from_proportion(a)
-                )[0],
-                target=x,
-                lower_bound=self.x_range[0],
-                upper_bound=self.x_range[1],
-            )
-            if alpha is not None:
-                return graph.quick_point_from_proportion(alpha)
-            else:
+            # Coordinates are affine in points, so along each curve of the
+            # graph x is itself a quadratic bezier. Find the first curve
+            # whose anchors span x, and solve for where it reaches x.
+            points = graph.get_points()
+            xs = self.point_to_coords(points)[0]
+            x0, x1 = xs[0:-1:2], xs[2::2]
+            spans = np.flatnonzero((np.minimum(x0, x1) <= x) & (x <= np.maximum(x0, x1)))
+            if len(spans) == 0:
                 return None
+            index = spans[0]
+            t = quadratic_bezier_parameter(xs[2 * index:2 * index + 3], x)
+            return quadratic_bezier_points_at(points, [index], [t])[0]
 
     def i2gp(self, x: float, graph: ParametricCurve) -> Vect3 | None:
         """
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import copy
+from functools import lru_cache
 from functools import wraps
 import itertools as it
+import operator as op
 import os
 import pickle
 import random
@@ -31,6 +33,7 @@ from manimlib.utils.color import rgb_to_hex
 from manimlib.utils.iterables import arrays_match
 from manimlib.utils.iterables import array_is_constant
 from manimlib.utils.iterables import batch_by_property
+from manimlib.utils.iterables import concatenate_records
 from manimlib.utils.iterables import list_update
 from manimlib.utils.iterables import listify
 from manimlib.utils.iterables import resize_array
@@ -43,6 +46,7 @@ from manimlib.utils.shaders import get_colormap_code
 from manimlib.utils.space_ops import angle_of_vector
 from manimlib.utils.space_ops import get_norm
 from manimlib.utils.space_ops import rotation_matrix_transpose
+from manimlib.utils.tracing import trace_span
 
 from typing import TYPE_CHECKING
 from typing import TypeVar, Generic, Iterable
@@ -60,6 +64,41 @@ if TYPE_CHECKING:
     NonTimeUpdater = Callable[["Mobject"], "Mobject" | None]
     Updater = Union[TimeBasedUpdater, NonTimeUpdater]
 
+# Every change to a mobject's data stamps it with a new number from here,
+# so that shader wrappers can tell which parts of their buffer are stale
+DATA_VERSIONS = it.count()
+
+# Shared by all mobjects with no locked or constant data keys
+NO_KEYS: frozenset[str] = frozenset()
+
+
+@lru_cache(maxsize=256)
+def get_shared_array(value: tuple, dtype: npt.DTypeLike = float) -> np.ndarray:
+    """
+    A read-only array holding value, for the uniforms and cached arrays
+    that start out the same for many mobjects to share. Such attributes
+    get changed by replacing the array, never by writing into it, and
+    copying a mobject doesn't copy read-only arrays.
+    """
+    array = np.array(value, dtype=dtype)
+    array.setflags(write=False)
+    return array
+
+
+@lru_cache
+def get_slot_names(cls: type) -> tuple[str, ...]:
+    return tuple(
+        name
+        for base in cls.__mro__
+        for name in base.__dict__.get("__slots__", ())
+        if name not in ("__dict__", "__weakref__")
+    )
+
+
+@lru_cache
+def get_slot_getter(cls: type) -> Callable[[object], tuple]:
+    return op.attrgetter(*get_slot_names(cls), "__dict__")
+
 
 class Mobject(object):
     """
@@ -75,6 +114,24 @@ class Mobject(object):
     ])
     aligned_data_keys = ['point']
     pointlike_data_keys = ['point']
+    derived_data_keys = []
+    # Runs of at least this many translated copies of the same
+    # mobject get drawn with instancing, where the shader allows it
+    min_instanced_run: int = 16
+
+    # Attributes which every mobject sets are held in slots, as a __dict__
+    # holding this many takes up more memory than the rest of a typical
+    # small mobject. Any others still go in __dict__.
+    __slots__ = (
+        "color", "opacity", "shading", "texture_paths", "depth_test", "z_index",
+        "submobjects", "parents", "family",
+        "locked_data_keys", "const_data_keys", "locked_uniform_keys",
+        "saved_state", "target", "bounding_box", "shader_wrapper",
+        "_is_animating", "_needs_new_bounding_box", "_data_has_changed", "_data_version",
+        "shader_code_replacements", "data", "_data_defaults", "uniforms",
+        "updaters", "_has_updaters_in_family", "updating_suspended", "event_listners",
+        "__dict__", "__weakref__",
+    )
 
     def __init__(
         self,
@@ -99,9 +156,11 @@ class Mobject(object):
         self.submobjects: list[Mobject] = []
         self.parents: list[Mobject] = []
         self.family: list[Mobject] | None = [self]
-        self.locked_data_keys: set[str] = set()
-        self.const_data_keys: set[str] = set()
-        self.locked_uniform_keys: set[str] = set()
+        # Rarely set, so these start out shared between all mobjects,
+        # and are replaced, rather than changed in place
+        self.locked_data_keys: frozenset[str] | set[str] = NO_KEYS
+        self.const_data_keys: frozenset[str] | set[str] = NO_KEYS
+        self.locked_uniform_keys: frozenset[str] | set[str] = NO_KEYS
         self.saved_state = None
         self.target = None
         self.bounding_box: Vect3Array = np.zeros((3, 3))
@@ -109,6 +168,7 @@ class Mobject(object):
         self._is_animating: bool = False
         self._needs_new_bounding_box: bool = True
         self._data_has_changed: bool = True
+        self._data_version: int = next(DATA_VERSIONS)
         self.shader_code_replacements: dict[str, str] = dict()
 
         self.init_data()
@@ -141,8 +201,8 @@ class Mobject(object):
     def init_uniforms(self):
         self.uniforms: UniformDict = {
             "is_fixed_in_frame": 0.0,
-            "shading": np.array(self.shading, dtype=float),
-            "clip_plane": np.zeros(4),
+            "shading": get_shared_array(tuple(self.shading)),
+            "clip_plane": get_shared_array((0.0, 0.0, 0.0, 0.0)),
         }
 
     def init_colors(self):
@@ -154,7 +214,7 @@ class Mobject(object):
 
     def set_uniforms(self, uniforms: dict) -> Self:
         for key, value in uniforms.items():
-            if isinstance(value, np.ndarray):
+            if isinstance(value, np.ndarray) and value.flags.writeable:
                 value = value.copy()
             self.uniforms[key] = value
         return self
@@ -204,6 +264,7 @@ class Mobject(object):
 
     def note_changed_data(self, recurse_up: bool = True) -> Self:
         self._data_has_changed = True
+        self._data_version = next(DATA_VERSIONS)
         if recurse_up:
             for mob in self.parents:
                 mob.note_changed_data()
@@ -514,7 +575,7 @@ class Mobject(object):
         Ensures all attributes which are mobjects are included
         in the submobjects list.
         """
-        mobject_attrs = [x for x in list(self.__dict__.values()) if isinstance(x, Mobject)]
+        mobject_attrs = [x for x in self.get_instance_attrs().values() if isinstance(x, Mobject)]
         self.set_submobjects(list_update(self.submobjects, mobject_attrs))
         return self
 
@@ -642,10 +703,39 @@ class Mobject(object):
                     null_value = [] if isinstance(value, list) else None
                     setattr(self, attr, null_value)
             result = func(self, *args, **kwargs)
-            self.__dict__.update(stash)
+            for attr, value in stash.items():
+                setattr(self, attr, value)
             return result
         return wrapper
 
+    def get_instance_attrs(self) -> dict[str, Any]:
+        """
+        All attributes set on this mobject, whether held
+        in its slots or in its __dict__
+        """
+        cls = self.__class__
+        try:
+            values = get_slot_getter(cls)(self)
+        except AttributeError:
+            # Some slot is unset
+            attrs = dict()
+            for name in get_slot_names(cls):
+                if hasattr(self, name):
+                    attrs[name] = getattr(self, name)
+            attrs.update(self.__dict__)
+            return attrs
+        # The last value is __dict__, which zip leaves out
+        attrs = dict(zip(get_slot_names(cls), values))
+        attrs.update(values[-1])
+        return attrs
+
+    def __getstate__(self) -> dict[str, Any]:
+        return self.get_instance_attrs()
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        for attr, value in state.items():
+            setattr(self, attr, value)
+
     @stash_mobject_pointers
     def serialize(self) -> bytes:
         return pickle.dumps(self)
@@ -662,17 +752,21 @@ class Mobject(object):
         if deep:
             return self.deepcopy()
 
-        result = copy.copy(self)
+        # A shallow copy, as copy.copy would make, with the state
+        # kept on hand for the deeper copying below
+        state = self.__getstate__()
+        result = self.__class__.__new__(self.__class__)
+        result.__setstate__(state)
 
         result.parents = []
         result.target = None
         result.saved_state = None
 
-        # copy.copy is only a shallow copy, so the internal
+        # That is only a shallow copy, so the internal
         # data which are numpy arrays or other mobjects still
         # need to be further copied.
         result.uniforms = {
-            key: value.copy() if isinstance(value, np.ndarray) else value
+            key: value.copy() if isinstance(value, np.ndarray) and value.flags.writeable else value
             for key, value in self.uniforms.items()
         }
 
@@ -686,16 +780,16 @@ class Mobject(object):
 
         # Similarly, instead of calling match_updaters, since we know the status
         # won't have changed, just directly match.
-        result.updaters = list(self.updaters)
+        result.updaters = self.updaters
         result._data_has_changed = True
         result.shader_wrapper = None
 
         family = self.get_family()
-        for attr, value in self.__dict__.items():
+        for attr, value in state.items():
             if isinstance(value, Mobject) and value is not self:
                 if value in family:
                     setattr(result, attr, result.family[family.index(value)])
-            elif isinstance(value, np.ndarray):
+            elif isinstance(value, np.ndarray) and value.flags.writeable:
                 setattr(result, attr, value.copy())
         return result
 
@@ -733,7 +827,7 @@ class Mobject(object):
             sm1.render_primitive = sm2.render_primitive
             sm1._needs_new_bounding_box = sm2._needs_new_bounding_box
         # Make sure named family members carry over
-        for attr, value in list(mobject.__dict__.items()):
+        for attr, value in mobject.get_instance_attrs().items():
             if isinstance(value, Mobject) and value in family2:
                 setattr(self, attr, family1[family2.index(value)])
         if match_updaters:
@@ -815,7 +909,7 @@ class Mobject(object):
     # Updating
 
     def init_updaters(self):
-        self.updaters: list[Updater] = list()
+        self.updaters: tuple[Updater, ...] = ()
         self._has_updaters_in_family: Optional[bool] = False
         self.updating_suspended: bool = False
 
@@ -834,11 +928,11 @@ class Mobject(object):
                 updater(self)
         return self
 
-    def get_updaters(self) -> list[Updater]:
+    def get_updaters(self) -> tuple[Updater, ...]:
         return self.updaters
 
     def add_updater(self, update_func: Updater, call: bool = True) -> Self:
-        self.updaters.append(update_func)
+        self.updaters = (*self.updaters, update_func)
         if call:
             self.update(dt=0)
         self.refresh_has_updater_status()
@@ -846,26 +940,30 @@ class Mobject(object):
         return self
 
     def insert_updater(self, update_func: Updater, index=0):
-        self.updaters.insert(index, update_func)
+        updaters = list(self.updaters)
+        updaters.insert(index, update_func)
+        self.updaters = tuple(updaters)
         self.refresh_has_updater_status()
         return self
 
     def remove_updater(self, update_func: Updater) -> Self:
-        while update_func in self.updaters:
-            self.updaters.remove(update_func)
+        self.updaters = tuple(
+            updater for updater in self.updaters
+            if updater != update_func
+        )
         self.refresh_has_updater_status()
         return self
 
     def clear_updaters(self, recurse: bool = True) -> Self:
         for mob in self.get_family(recurse):
-            mob.updaters = []
+            mob.updaters = ()
             mob._has_updaters_in_family = False
         for parent in self.get_ancestors():
             parent._has_updaters_in_family = False
         return self
 
     def match_updaters(self, mobject: Mobject) -> Self:
-        self.updaters = list(mobject.updaters)
+        self.updaters = mobject.updaters
         self.refresh_has_updater_status()
         return self
 
@@ -1449,11 +1547,11 @@ class Mobject(object):
         Makes parts bright where light gets reflected toward the camera
         """
         for mob in self.get_family(recurse):
-            shading = mob.uniforms["shading"]
+            shading = list(mob.uniforms["shading"])
             for i, value in enumerate([reflectiveness, gloss, shadow]):
                 if value is not None:
                     shading[i] = value
-            mob.set_uniform(shading=shading, recurse=False)
+            mob.set_uniform(shading=get_shared_array(tuple(shading)), recurse=False)
         return self
 
     def get_reflectiveness(self) -> float:
@@ -1895,9 +1993,9 @@ class Mobject(object):
 
     def unlock_data(self) -> Self:
         for mob in self.get_family():
-            mob.locked_data_keys = set()
-            mob.const_data_keys = set()
-            mob.locked_uniform_keys = set()
+            mob.locked_data_keys = NO_KEYS
+            mob.const_data_keys = NO_KEYS
+            mob.locked_uniform_keys = NO_KEYS
         return self
 
     # Operations touching shader uniforms
@@ -1949,14 +2047,16 @@ class Mobject(object):
         recurse=True
     ) -> Self:
         for submob in self.get_family(recurse):
+            clip_plane = submob.uniforms["clip_plane"].copy()
             if vect is not None:
-                submob.uniforms["clip_plane"][:3] = vect
+                clip_plane[:3] = vect
             if threshold is not None:
-                submob.uniforms["clip_plane"][3] = threshold
+                clip_plane[3] = threshold
+            submob.uniforms["clip_plane"] = clip_plane
         return self
 
     def deactivate_clip_plane(self) -> Self:
-        self.uniforms["clip_plane"][:] = 0
+        self.uniforms["clip_plane"] = get_shared_array((0.0, 0.0, 0.0, 0.0))
         return self
 
     # Shader code manipulation
@@ -2036,21 +2136,80 @@ class Mobject(object):
         return self.shader_wrapper
 
     def get_shader_wrapper_list(self, ctx: Context) -> list[ShaderWrapper]:
-        family = self.family_members_with_points()
+        return self.get_batched_shader_wrappers(ctx, self.family_members_with_points())
+
+    def get_batched_shader_wrappers(self, ctx: Context, family: list[Mobject]) -> list[ShaderWrapper]:
         batches = batch_by_property(family, lambda sm: sm.get_shader_wrapper(ctx).get_id())
 
         result = []
         for submobs, sid in batches:
-            shader_wrapper = submobs[0].shader_wrapper
-            data_list = [sm.get_shader_data() for sm in submobs]
-            shader_wrapper.read_in(data_list)
-            result.append(shader_wrapper)
+            for run, instanced in self.split_into_instanced_runs(submobs):
+                shader_wrapper = run[0].shader_wrapper
+                if instanced:
+                    origins = np.array([sm.data["point"][0] for sm in run])
+                    shader_wrapper.read_in_instances(
+                        run[0].get_shader_data(),
+                        run[0]._data_version,
+                        origins - origins[0],
+                    )
+                else:
+                    data_list = [sm.get_shader_data() for sm in run]
+                    shader_wrapper.read_in(data_list, [sm._data_version for sm in run])
+                result.append(shader_wrapper)
+        return result
+
+    def split_into_instanced_runs(self, submobs: list[Mobject]) -> list[tuple[list[Mobject], bool]]:
+        """
+        Splits a batch of submobjects sharing a shader into consecutive
+        runs, flagging the long runs of translated copies of one mobject
+        that can be drawn as instances of their first member
+        """
+        min_run = self.min_instanced_run
+        if len(submobs) < min_run or not submobs[0].shader_wrapper.supports_instancing():
+            return [(submobs, False)]
+
+        runs = []
+        for mobs, layout in batch_by_property(submobs, lambda sm: (len(sm.data), sm.data.dtype)):
+            if len(mobs) >= min_run:
+                is_copy = self.get_translated_copy_flags(mobs)
+            else:
+                is_copy = np.zeros(len(mobs), dtype=bool)
+            start = 0
+            for end in [*(np.where(~is_copy[1:])[0] + 1), len(mobs)]:
+                chain = mobs[start:end]
+                if len(chain) >= min_run:
+                    runs.append((chain, True))
+                elif runs and not runs[-1][1]:
+                    runs[-1][0].extend(chain)
+                else:
+                    runs.append((chain, False))
+                start = end
+        return runs
+
+    @staticmethod
+    def get_translated_copy_flags(mobs: list[Mobject], tolerance: float = 1e-5) -> np.ndarray:
+        """
+        For mobjects whose data share a length and dtype, returns an array
+        whose ith entry says if mobs[i] is a translated copy of mobs[i - 1]
+        """
+        stack = concatenate_records([mob.data for mob in mobs]).reshape(len(mobs), -1)
+        result = np.ones(len(mobs), dtype=bool)
+        result[0] = False
+        for key in stack.dtype.names:
+            if key in mobs[0].derived_data_keys:
+                continue
+            values = stack[key]
+            if key in mobs[0].pointlike_data_keys:
+                values = values - values[:, :1]
+            diffs = np.abs(values[1:] - values[:-1]).reshape(len(mobs) - 1, -1)
+            result[1:] &= (diffs < tolerance).all(1)
         return result
 
     def get_shader_data(self) -> np.ndarray:
         indices = self.get_shader_vert_indices()
         if indices is not None:
-            return self.data[indices]
+            # Much faster than fancy indexing for structured dtypes
+            return self.data.take(indices)
         else:
             return self.data
 
@@ -2062,12 +2221,14 @@ class Mobject(object):
 
     def render(self, ctx: Context, camera_uniforms: dict):
         if self._data_has_changed:
-            self.shader_wrappers = self.get_shader_wrapper_list(ctx)
+            with trace_span("shader_data"):
+                self.shader_wrappers = self.get_shader_wrapper_list(ctx)
             self._data_has_changed = False
-        for shader_wrapper in self.shader_wrappers:
-            shader_wrapper.update_program_uniforms(camera_uniforms)
-            shader_wrapper.pre_render()
-            shader_wrapper.render()
+        with trace_span("draw"):
+            for shader_wrapper in self.shader_wrappers:
+                shader_wrapper.update_program_uniforms(camera_uniforms)
+                shader_wrapper.pre_render()
+                shader_wrapper.render()
 
     # Event Handlers
     """
@@ -2081,7 +2242,7 @@ class Mobject(object):
     """
 
     def init_event_listners(self):
-        self.event_listners: list[EventListener] = []
+        self.event_listners: tuple[EventListener, ...] = ()
 
     def add_event_listner(
         self,
@@ -2089,7 +2250,7 @@ class Mobject(object):
         event_callback: Callable[[Mobject, dict[str]]]
     ):
         event_listner = EventListener(self, event_type, event_callback)
-        self.event_listners.append(event_listner)
+        self.event_listners = (*self.event_listners, event_listner)
         EVENT_DISPATCHER.add_listner(event_listner)
         return self
 
@@ -2099,13 +2260,15 @@ class Mobject(object):
         event_callback: Callable[[Mobject, dict[str]]]
     ):
         event_listner = EventListener(self, event_type, event_callback)
-        while event_listner in self.event_listners:
-            self.event_listners.remove(event_listner)
+        self.event_listners = tuple(
+            listner for listner in self.event_listners
+            if listner != event_listner
+        )
         EVENT_DISPATCHER.remove_listner(event_listner)
         return self
 
     def clear_event_listners(self, recurse: bool = True):
-        self.event_listners = []
+        self.event_listners = ()
         if recurse:
             for submob in self.submobjects:
                 submob.clear_event_listners(recurse=recurse)
@@ -2198,6 +2361,53 @@ class Group(Mobject, Generic[SubmobjectType]):
     def __getitem__(self, index) -> SubmobjectType:
         return super().__getitem__(index)
 
+    def get_shader_wrapper_list(self, ctx: Context) -> list[ShaderWrapper]:
+        """
+        Members which gather their own shader wrappers, like a
+        PointCloudStore, are asked for them, while the rest of the
+        family is batched as for any other mobject
+        """
+        result = []
+        batches = batch_by_property(
+            self.get_members_to_draw(),
+            lambda mob: class_gathers_own_shader_wrappers(type(mob))
+        )
+        for members, gathers_own in batches:
+            if gathers_own:
+                for mob in members:
+                    result.extend(mob.get_shader_wrapper_list(ctx))
+            else:
+                result.extend(self.get_batched_shader_wrappers(ctx, members))
+        return result
+
+    def get_members_to_draw(self) -> list[Mobject]:
+        """
+        Family members with points, in order, except that the family of
+        one which gathers its own shader wrappers is replaced by it alone
+        """
+        family = self.get_family()
+        if not any(map(class_gathers_own_shader_wrappers, {type(mob) for mob in family[1:]})):
+            return self.family_members_with_points()
+        members = []
+        index = 0
+        while index < len(family):
+            mob = family[index]
+            if index > 0 and class_gathers_own_shader_wrappers(type(mob)):
+                # Skip past the rest of its family
+                members.append(mob)
+                index += len(mob.get_family())
+                continue
+            if len(mob.data) > 0:
+                members.append(mob)
+            index += 1
+        return members
+
+
+@lru_cache
+def class_gathers_own_shader_wrappers(cls: type) -> bool:
+    return not issubclass(cls, Group) \
+        and cls.get_shader_wrapper_list is not Mobject.get_shader_wrapper_list
+
 
 class Point(Mobject):
     def __init__(
@@ -21,6 +21,8 @@ from manimlib.utils.bezier import quadratic_bezier_points_for_arc
 from manimlib.utils.images import get_full_vector_image_path
 from manimlib.utils.iterables import hash_obj
 from manimlib.utils.space_ops import rotation_about_z
+from manimlib.utils.tracing import add_count
+from manimlib.utils.tracing import trace_span
 
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
@@ -108,9 +110,11 @@ class SVGMobject(VMobject):
     def init_svg_mobject(self) -> None:
         hash_val = hash_obj(self.hash_seed)
         if hash_val in SVG_HASH_TO_MOB_MAP:
+            add_count("svg_cache_hits")
             submobs = [sm.copy() for sm in SVG_HASH_TO_MOB_MAP[hash_val]]
         else:
-            submobs = self.mobjects_from_svg_string(self.svg_string)
+            with trace_span("svg_parse", mobject=self.__class__.__name__):
+                submobs = self.mobjects_from_svg_string(self.svg_string)
             SVG_HASH_TO_MOB_MAP[hash_val] = [sm.copy() for sm in submobs]
 
         self.add(*submobs)
@@ -21,6 +21,7 @@ from manimlib.utils.cache import cache_on_disk
 from manimlib.utils.color import color_to_hex
 from manimlib.utils.color import int_to_hex
 from manimlib.utils.simple_functions import hash_string
+from manimlib.utils.tracing import traced
 
 from typing import TYPE_CHECKING
 
@@ -52,6 +53,7 @@ class _Alignment:
 
 @lru_cache(maxsize=128)
 @cache_on_disk
+@traced("text_layout")
 def markup_to_svg(
     markup_str: str,
     justify: bool = False,
@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import moderngl
+import numpy as np
+
+from manimlib.constants import DEFAULT_MOBJECT_COLOR
+from manimlib.mobject.mobject import Mobject
+from manimlib.mobject.types.point_cloud_mobject import PMobject
+from manimlib.utils.iterables import resize_with_interpolation
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy.typing as npt
+    from typing import Sequence, Tuple
+    from manimlib.typing import ManimColor, Vect3Array, Self
+
+
+DEFAULT_ARROW_STROKE_WIDTH = 3.0
+DEFAULT_ARROW_TIP_WIDTH_RATIO = 5.0
+DEFAULT_ARROW_TIP_LENGTH = 0.2
+
+
+class ArrowCloud(PMobject):
+    """
+    Many straight arrows drawn as one mobject. Each arrow is a single
+    vertex, holding its start, end, widths and color, which a geometry
+    shader expands into a shaft and a triangular tip. Compared with Arrow,
+    whose outline is built from bezier curves on the CPU, this is far
+    cheaper to build and to update each frame when there are thousands.
+
+    Widths are in the same units as stroke widths, while tip lengths are
+    in the same units as points. Arrows shorter than their tip are drawn
+    as a scaled down tip.
+    """
+    shader_folder: str = "arrow_cloud"
+    render_primitive: int = moderngl.POINTS
+    data_dtype: Sequence[Tuple[str, type, Tuple[int]]] = [
+        ('point', np.float32, (3,)),
+        ('end', np.float32, (3,)),
+        ('stroke_width', np.float32, (1,)),
+        ('tip_width', np.float32, (1,)),
+        ('tip_length', np.float32, (1,)),
+        ('rgba', np.float32, (4,)),
+    ]
+    pointlike_data_keys = ['point', 'end']
+
+    def __init__(
+        self,
+        starts: Vect3Array | None = None,
+        ends: Vect3Array | None = None,
+        color: ManimColor = DEFAULT_MOBJECT_COLOR,
+        opacity: float = 1.0,
+        stroke_width: float = DEFAULT_ARROW_STROKE_WIDTH,
+        tip_width_ratio: float = DEFAULT_ARROW_TIP_WIDTH_RATIO,
+        tip_length: float = DEFAULT_ARROW_TIP_LENGTH,
+        anti_alias_width: float = 1.5,
+        **kwargs
+    ):
+        self.tip_width_ratio = tip_width_ratio
+        self.anti_alias_width = anti_alias_width
+
+        super().__init__(color=color, opacity=opacity, **kwargs)
+        self.set_stroke_width(stroke_width)
+        self.set_tip_length(tip_length)
+
+        if starts is not None:
+            self.set_arrows(starts, ends)
+
+    def init_uniforms(self) -> None:
+        super().init_uniforms()
+        self.uniforms["anti_alias_width"] = self.anti_alias_width
+
+    def set_arrows(self, starts: Vect3Array, ends: Vect3Array) -> Self:
+        self.set_points(starts)
+        self.set_ends(ends)
+        return self
+
+    def get_starts(self) -> Vect3Array:
+        return self.get_points()
+
+    @Mobject.affects_data
+    def set_ends(self, ends: Vect3Array) -> Self:
+        self.data["end"][:] = ends
+        self.refresh_bounding_box()
+        return self
+
+    def get_ends(self) -> Vect3Array:
+        return self.data["end"]
+
+    def get_vectors(self) -> Vect3Array:
+        return self.get_ends() - self.get_starts()
+
+    @Mobject.affects_data
+    def put_starts_and_ends_on(self, starts: Vect3Array, ends: Vect3Array) -> Self:
+        self.data["point"][:] = starts
+        self.data["end"][:] = ends
+        self.refresh_bounding_box()
+        return self
+
+    @Mobject.affects_data
+    def set_stroke_widths(self, widths: npt.ArrayLike) -> Self:
+        widths = np.array(widths).reshape(-1, 1)
+        self.data["stroke_width"][:] = resize_with_interpolation(widths, self.get_num_points())
+        self.data["tip_width"][:] = self.tip_width_ratio * self.data["stroke_width"]
+        return self
+
+    @Mobject.affects_data
+    def set_stroke_width(self, width: float) -> Self:
+        data = self.data if self.get_num_points() > 0 else self._data_defaults
+        data["stroke_width"][:] = width
+        data["tip_width"][:] = self.tip_width_ratio * width
+        return self
+
+    def get_stroke_widths(self) -> np.ndarray:
+        return self.data["stroke_width"][:, 0]
+
+    def get_stroke_width(self) -> float:
+        data = self.data if self.get_num_points() > 0 else self._data_defaults
+        return data["stroke_width"][0, 0]
+
+    @Mobject.affects_data
+    def set_tip_lengths(self, lengths: npt.ArrayLike) -> Self:
+        lengths = np.array(lengths).reshape(-1, 1)
+        self.data["tip_length"][:] = resize_with_interpolation(lengths, self.get_num_points())
+        return self
+
+    @Mobject.affects_data
+    def set_tip_length(self, length: float) -> Self:
+        data = self.data if self.get_num_points() > 0 else self._data_defaults
+        data["tip_length"][:] = length
+        return self
+
+    def get_tip_lengths(self) -> np.ndarray:
+        return self.data["tip_length"][:, 0]
+
+    def compute_bounding_box(self) -> Vect3Array:
+        bb = super().compute_bounding_box()
+        if self.get_num_points() > 0:
+            ends = self.get_ends()
+            bb[0] = np.minimum(bb[0], ends.min(0))
+            bb[2] = np.maximum(bb[2], ends.max(0))
+            bb[1] = (bb[0] + bb[2]) / 2
+        return bb
+
+    def scale(
+        self,
+        scale_factor: float | npt.ArrayLike,
+        scale_tips: bool = True,
+        **kwargs
+    ) -> Self:
+        super().scale(scale_factor, **kwargs)
+        if scale_tips and np.isscalar(scale_factor) and self.has_points():
+            self.set_tip_lengths(abs(scale_factor) * self.get_tip_lengths())
+        return self
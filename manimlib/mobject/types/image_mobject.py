@@ -1,13 +1,19 @@
 from __future__ import annotations
 
+import math
+
 import numpy as np
 import moderngl
 from PIL import Image
 
+from manimlib.config import manim_config
 from manimlib.constants import DL, DR, UL, UR
+from manimlib.constants import FRAME_HEIGHT
 from manimlib.mobject.mobject import Mobject
 from manimlib.utils.bezier import inverse_interpolate
 from manimlib.utils.images import get_full_raster_image_path
+from manimlib.utils.images import get_image_pixels
+from manimlib.utils.images import get_image_size
 from manimlib.utils.iterables import listify
 from manimlib.utils.iterables import resize_with_interpolation
 
@@ -15,10 +21,17 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from typing import Sequence, Tuple
+    from moderngl.context import Context
     from manimlib.typing import Vect3
 
 
 class ImageMobject(Mobject):
+    """
+    With downsample=True, the image is loaded onto the GPU at no more than
+    the size it takes up on screen when first drawn, rather than at full
+    resolution, which saves memory in scenes with many large images. It
+    will look blurry if scaled up later on.
+    """
     shader_folder: str = "image"
     data_dtype: Sequence[Tuple[str, type, Tuple[int]]] = [
         ('point', np.float32, (3,)),
@@ -31,13 +44,20 @@ class ImageMobject(Mobject):
         self,
         filename: str,
         height: float = 4.0,
+        downsample: bool = False,
         **kwargs
     ):
         self.height = height
+        self.downsample = downsample
         self.image_path = get_full_raster_image_path(filename)
-        self.image = Image.open(self.image_path)
+        self.image_size = get_image_size(self.image_path)
         super().__init__(texture_paths={"Texture": self.image_path}, **kwargs)
 
+    @property
+    def image(self) -> Image.Image:
+        # The pixels are only read if needed, e.g. by point_to_rgb
+        return get_image_pixels(self.image_path)
+
     def init_data(self) -> None:
         super().init_data(length=6)
         self.data["point"][:] = [UL, DL, UR, DR, UR, DL]
@@ -45,10 +65,23 @@ class ImageMobject(Mobject):
         self.data["opacity"][:] = self.opacity
 
     def init_points(self) -> None:
-        size = self.image.size
+        size = self.image_size
         self.set_width(2 * size[0] / size[1], stretch=True)
         self.set_height(self.height)
 
+    def init_shader_wrapper(self, ctx: Context):
+        super().init_shader_wrapper(ctx)
+        if self.downsample:
+            self.shader_wrapper.set_texture_max_size(self.get_pixel_footprint())
+
+    def get_pixel_footprint(self) -> int:
+        """
+        Length in pixels of the longer side of the image, as drawn with
+        the default camera frame
+        """
+        pixels_per_unit = manim_config.camera.resolution[1] / FRAME_HEIGHT
+        return math.ceil(max(self.get_width(), self.get_height()) * pixels_per_unit)
+
     @Mobject.affects_data
     def set_opacity(self, opacity: float, recurse: bool = True):
         self.data["opacity"][:, 0] = resize_with_interpolation(
@@ -69,8 +102,9 @@ class ImageMobject(Mobject):
             # TODO, raise smarter exception
             raise Exception("Cannot sample color from outside an image")
 
-        pw, ph = self.image.size
-        rgb = self.image.getpixel((
+        image = self.image
+        pw, ph = image.size
+        rgb = image.getpixel((
             int((pw - 1) * x_alpha),
             int((ph - 1) * y_alpha),
         ))[:3]
@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+import numpy as np
+
+from manimlib.mobject.types.point_cloud_mobject import PGroup
+from manimlib.mobject.types.point_cloud_mobject import PMobject
+from manimlib.utils.iterables import batch_by_property
+from manimlib.utils.iterables import concatenate_records
+from manimlib.utils.tracing import add_count
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Optional
+    from moderngl.buffer import Buffer
+    from moderngl.context import Context
+    from manimlib.mobject.mobject import Mobject
+    from manimlib.shader_wrapper import ShaderWrapper
+    from manimlib.typing import Vect3Array, Self
+
+
+class PointCloudStore(PGroup):
+    """
+    Holds the data of many point clouds, such as DotClouds or GlowDots, in
+    one growable array, with the data of each cloud being a view of its
+    own range of it. All are drawn from a single vertex buffer, into which
+    only the ranges of clouds whose data changed are written each frame,
+    straight from that array, rather than being gathered and copied for
+    each frame.
+
+    For particle-style animations, an updater can act on every point at
+    once through get_packed_data or get_packed_points, so long as it calls
+    note_changed_packed_data after writing to them.
+
+    All clouds must share one data dtype. A cloud whose number of points
+    changes is copied into a new range the next time it's drawn, along
+    with those after it.
+    """
+    def __init__(self, *pmobs: PMobject, **kwargs):
+        self.init_buffer()
+        super().__init__(*pmobs, **kwargs)
+
+    def init_buffer(self) -> None:
+        self.buffer: Optional[np.ndarray] = None
+        self.clouds: list[Mobject] = []
+        self.views: list[np.ndarray] = []
+        self.starts = np.zeros(0, dtype=int)
+        self.lengths = np.zeros(0, dtype=int)
+        self.uploaded_versions = np.zeros(0, dtype=int)
+        self.vbo: Optional[Buffer] = None
+
+    def __getstate__(self):
+        # A copy packs its clouds into a buffer of its own
+        state = super().__getstate__()
+        state.update(
+            buffer=None, clouds=[], views=[],
+            starts=self.starts[:0], lengths=self.lengths[:0],
+            uploaded_versions=self.uploaded_versions[:0],
+            vbo=None,
+        )
+        return state
+
+    def add(self, *pmobs: PMobject) -> Self:
+        dtypes = set(
+            mob.data.dtype
+            for pmob in (self, *pmobs)
+            for mob in pmob.family_members_with_points()
+        )
+        if len(dtypes) > 1:
+            raise ValueError("All clouds in a PointCloudStore must share one data dtype")
+        return super().add(*pmobs)
+
+    def note_changed_family(self, only_changed_order: bool = False) -> Self:
+        super().note_changed_family(only_changed_order)
+        # So that the new layout gets packed before the next draw
+        self._data_has_changed = True
+        return self
+
+    def pack(self) -> None:
+        """
+        Binds the data of each cloud to its range of the buffer. Clouds
+        which were added, resized or replaced since the last call are
+        copied in, along with any after them, while those before them
+        stay where they are.
+        """
+        clouds = self.family_members_with_points()
+        index = 0
+        for old, new, view in zip(self.clouds, clouds, self.views):
+            if old is not new or new.data is not view:
+                break
+            index += 1
+        if index == len(clouds) == len(self.clouds):
+            return
+
+        lengths = np.array([len(mob.data) for mob in clouds], dtype=int)
+        starts = np.cumsum(lengths) - lengths
+        total = int(lengths.sum())
+        dtype = clouds[0].data.dtype if clouds else self.data.dtype
+        if self.buffer is None or self.buffer.dtype != dtype or len(self.buffer) < total:
+            # Everything moves to a new buffer, which grows by at least
+            # half, so that adding clouds one at a time isn't quadratic
+            capacity = total if self.buffer is None else max(total, 3 * len(self.buffer) // 2)
+            buffer = np.zeros(capacity, dtype=dtype)
+            index = 0
+        else:
+            buffer = self.buffer
+
+        start = starts[index] if index < len(clouds) else total
+        if index < len(clouds):
+            # Data for clouds already in the buffer may overlap where it
+            # goes, so it's all gathered before any is written
+            tail = concatenate_records([mob.data for mob in clouds[index:]])
+            concatenate_records([tail], out=buffer[start:total])
+
+        views = [buffer[s:s + n] for s, n in zip(starts[index:], lengths[index:])]
+        for mob, view in zip(clouds[index:], views):
+            mob.data = view
+        uploaded = np.full(len(clouds), -1, dtype=int)
+        uploaded[:index] = self.uploaded_versions[:index]
+
+        self.buffer = buffer
+        self.clouds = clouds
+        self.views = [*self.views[:index], *views]
+        self.starts = starts
+        self.lengths = lengths
+        self.uploaded_versions = uploaded
+
+    def get_num_packed_points(self) -> int:
+        return int(self.lengths.sum())
+
+    def get_packed_data(self) -> np.ndarray:
+        """
+        The data of every cloud, one after another in the order of the
+        family, which can be written to directly, followed by a call to
+        note_changed_packed_data
+        """
+        self.pack()
+        if self.buffer is None:
+            return self.data[:0]
+        return self.buffer[:self.get_num_packed_points()]
+
+    def get_packed_points(self) -> Vect3Array:
+        return self.get_packed_data()["point"]
+
+    def note_changed_packed_data(self) -> Self:
+        for mob in self.clouds:
+            mob.note_changed_data(recurse_up=False)
+        self.refresh_bounding_box(recurse_down=True)
+        self.note_changed_data()
+        return self
+
+    def write_changed_ranges(self, ctx: Context) -> None:
+        """
+        Uploads each contiguous run of clouds whose data has changed since
+        it was last uploaded
+        """
+        itemsize = self.buffer.itemsize
+        if self.vbo is None or self.vbo.size < self.buffer.nbytes:
+            if self.vbo is not None:
+                self.vbo.release()
+            self.vbo = ctx.buffer(reserve=self.buffer.nbytes)
+            add_count("vbos_allocated")
+            self.uploaded_versions[:] = -1
+
+        versions = np.array([mob._data_version for mob in self.clouds], dtype=int)
+        changed = np.hstack([False, versions != self.uploaded_versions, False])
+        run_bounds = np.flatnonzero(changed[1:] != changed[:-1]).reshape(-1, 2)
+        ends = self.starts + self.lengths
+        for first, last in run_bounds:
+            start, end = self.starts[first], ends[last - 1]
+            self.vbo.write(self.buffer[start:end], offset=start * itemsize)
+            add_count("bytes_uploaded", (end - start) * itemsize)
+        self.uploaded_versions = versions
+
+    def get_shader_wrapper_list(self, ctx: Context) -> list[ShaderWrapper]:
+        self.pack()
+        if not self.clouds:
+            return []
+        self.write_changed_ranges(ctx)
+
+        # Clouds are packed in the order they're drawn, so each batch
+        # sharing a shader is one range of the buffer
+        ends = self.starts + self.lengths
+        batches = batch_by_property(
+            range(len(self.clouds)),
+            lambda i: self.clouds[i].get_shader_wrapper(ctx).get_id()
+        )
+        result = []
+        for indices, sid in batches:
+            shader_wrapper = self.clouds[indices[0]].shader_wrapper
+            start = self.starts[indices[0]]
+            shader_wrapper.read_in_shared_buffer(self.vbo, start, ends[indices[-1]] - start)
+            result.append(shader_wrapper)
+        return result
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import math
 from functools import wraps
 
 import numpy as np
@@ -12,9 +13,11 @@ from manimlib.constants import DEG
 from manimlib.constants import ORIGIN, OUT
 from manimlib.constants import PI
 from manimlib.constants import TAU
+from manimlib.mobject.mobject import DATA_VERSIONS
 from manimlib.mobject.mobject import Mobject
 from manimlib.mobject.mobject import Group
 from manimlib.mobject.mobject import Point
+from manimlib.mobject.mobject import get_shared_array
 from manimlib.utils.bezier import bezier
 from manimlib.utils.bezier import get_quadratic_approximation_of_cubic
 from manimlib.utils.bezier import approx_smooth_quadratic_bezier_handles
@@ -25,9 +28,12 @@ from manimlib.utils.bezier import inverse_interpolate
 from manimlib.utils.bezier import find_intersection
 from manimlib.utils.bezier import outer_interpolate
 from manimlib.utils.bezier import partial_quadratic_bezier_points
+from manimlib.utils.bezier import quadratic_bezier_points_at
 from manimlib.utils.bezier import quadratic_bezier_points_for_arc
+from manimlib.utils.bezier import subdivide_quadratic_bezier_points
 from manimlib.utils.color import color_gradient
 from manimlib.utils.color import rgb_to_hex
+from manimlib.utils.iterables import apportion
 from manimlib.utils.iterables import make_even
 from manimlib.utils.iterables import resize_array
 from manimlib.utils.iterables import resize_with_interpolation
@@ -50,6 +56,7 @@ from typing import Generic, TypeVar, Iterable
 SubVmobjectType = TypeVar('SubVmobjectType', bound='VMobject')
 
 if TYPE_CHECKING:
+    import numpy.typing as npt
     from typing import Callable, Tuple, Any, Optional
     from manimlib.typing import ManimColor, Vect3, Vect4, Vect3Array, Self
     from moderngl.context import Context
@@ -65,6 +72,8 @@ class VMobject(Mobject):
         ('base_normal', np.float32, (3,)),  # Base points and unit normal vectors are interleaved in this array
         ('fill_border_width', np.float32, (1,)),
     ])
+    # Recomputed from the points before drawing
+    derived_data_keys = ['joint_angle', 'base_normal']
     pre_function_handle_to_anchor_scale_factor: float = 0.01
     make_smooth_after_applying_functions: bool = False
     # TODO, do we care about accounting for varying zoom levels?
@@ -76,6 +85,17 @@ class VMobject(Mobject):
         "miter": 3,
     }
 
+    __slots__ = (
+        "fill_color", "fill_opacity", "stroke_color", "stroke_opacity", "stroke_width",
+        "stroke_behind", "background_image_file", "long_lines", "joint_type",
+        "flat_stroke", "scale_stroke_with_zoom", "use_simple_quadratic_approx",
+        "anti_alias_width", "fill_border_width", "border_width",
+        "shape_version", "subpath_end_indices", "subpath_end_indices_version",
+        "unit_normal_version", "joint_angles_version",
+        "triangulation", "triangulation_version", "outer_vert_indices",
+        "arc_length_table", "arc_length_table_version",
+    )
+
     def __init__(
         self,
         color: ManimColor = None,  # If set, this will override stroke_color and fill_color
@@ -112,10 +132,19 @@ class VMobject(Mobject):
         self.anti_alias_width = anti_alias_width
         self.fill_border_width = fill_border_width
 
-        self.needs_new_joint_angles = True
-        self.needs_new_unit_normal = True
-        self.subpath_end_indices = None
-        self.outer_vert_indices = np.zeros(0, dtype=int)
+        # Data derived from the shape of the points is computed lazily, and
+        # records the shape_version it was computed from, see note_changed_shape.
+        # The triangulation and arc length table record the data version.
+        self.shape_version = next(DATA_VERSIONS)
+        self.subpath_end_indices = get_shared_array((), dtype=int)
+        self.subpath_end_indices_version = -1
+        self.unit_normal_version = -1
+        self.joint_angles_version = -1
+        self.triangulation = get_shared_array((), dtype='i4')
+        self.triangulation_version = -1
+        self.outer_vert_indices = get_shared_array((), dtype=int)
+        self.arc_length_table = get_shared_array((0.0,))
+        self.arc_length_table_version = -1
 
         super().__init__(**kwargs)
 
@@ -749,12 +778,12 @@ class VMobject(Mobject):
         # curves in a row, we also check that the following
         # anchor is genuinely distinct
         is_end = (a0 == h).all(1) & (abs(h - a1) > atol).any(1)
-        end_indices = (2 * n for n, end in enumerate(is_end) if end)
-        return np.array([*end_indices, len(points) - 1])
+        return np.array([*2 * np.flatnonzero(is_end), len(points) - 1])
 
     def get_subpath_end_indices(self) -> np.ndarray:
-        if self.subpath_end_indices is None:
+        if self.subpath_end_indices_version != self.shape_version:
             self.subpath_end_indices = self.get_subpath_end_indices_from_points(self.get_points())
+            self.subpath_end_indices_version = self.shape_version
         return self.subpath_end_indices
 
     def get_subpaths_from_points(self, points: Vect3Array) -> list[Vect3Array]:
@@ -786,45 +815,90 @@ class VMobject(Mobject):
         curve_func = self.get_nth_curve_function(n)
         return curve_func(residue)
 
-    def curve_and_prop_of_partial_point(self, alpha) -> Tuple[int, float]:
+    def quick_points_from_proportions(self, alphas: Iterable[float]) -> Vect3Array:
+        """
+        Same as quick_point_from_proportion, for an array of alphas at once
+        """
+        alphas = np.asarray(alphas, dtype=float)
+        num_curves = self.get_num_curves()
+        if num_curves == 0:
+            return np.repeat([self.get_center()], len(alphas), axis=0)
+        scaled = np.clip(alphas, 0, 1) * num_curves
+        indices = np.clip(np.floor(scaled), 0, num_curves - 1).astype(int)
+        return quadratic_bezier_points_at(self.get_points(), indices, scaled - indices)
+
+    def get_arc_length_table(self) -> np.ndarray:
+        """
+        Cumulative lengths along the path up to each anchor, starting at 0,
+        which relate proportions of the way along it to curves. Each curve's
+        length is approximated as in get_arc_length, except that null curves,
+        including the jumps between subpaths, count for nothing.
+
+        The table is only recomputed when the data has changed since it
+        was last built.
+        """
+        if self.arc_length_table_version != self._data_version:
+            a0, h, a1 = self.get_anchors_and_handles()
+            chords = np.linalg.norm(a1 - a0, axis=1)
+            polygons = np.linalg.norm(h - a0, axis=1) + np.linalg.norm(a1 - h, axis=1)
+            lengths = interpolate(chords, polygons, 1 / 3)
+            lengths[(abs(h - a0) < self.tolerance_for_point_equality).all(1)] = 0
+            self.arc_length_table = np.hstack([0, np.cumsum(lengths)])
+            self.arc_length_table_version = self._data_version
+        return self.arc_length_table
+
+    def curves_and_props_of_partial_points(
+        self,
+        alphas: Iterable[float]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Same as curve_and_prop_of_partial_point, for an array of alphas
+        at once, returning an array of curve indices and one of residues
+        """
+        alphas = np.asarray(alphas, dtype=float)
+        table = self.get_arc_length_table()
+        full = table[-1]
+        if full == 0:
+            last = max(self.get_num_curves() - 1, 0)
+            return np.full(len(alphas), last), np.ones(len(alphas))
+        lengths = full * alphas
+        # First index where the partial length is at least alpha times the full length
+        indices = np.searchsorted(table, lengths).clip(1, len(table) - 1)
+        residues = inverse_interpolate(table[indices - 1], table[indices], lengths)
+        residues[alphas <= 0] = 0
+        return indices - 1, residues
+
+    def curve_and_prop_of_partial_point(self, alpha: float) -> Tuple[int, float]:
         """
         If you want a point a proportion alpha along the curve, this
         gives you the index of the appropriate bezier curve, together
         with the proportion along that curve you'd need to travel
         """
-        if alpha == 0:
-            return (0, 0.0)
-        partials: list[float] = [0]
-        for tup in self.get_bezier_tuples():
-            if self.consider_points_equal(tup[0], tup[1]):
-                # Don't consider null curves
-                arclen = 0
-            else:
-                # Approximate length with straight line from start to end
-                arclen = get_norm(tup[2] - tup[0])
-            partials.append(partials[-1] + arclen)
-        full = partials[-1]
-        if full == 0:
-            return len(partials), 1.0
-        # First index where the partial length is more than alpha times the full length
-        index = next(
-            (i for i, x in enumerate(partials) if x >= full * alpha),
-            len(partials) - 1  # Default
-        )
-        residue = float(inverse_interpolate(
-            partials[index - 1] / full, partials[index] / full, alpha
-        ))
-        return index - 1, residue
+        indices, residues = self.curves_and_props_of_partial_points([alpha])
+        return int(indices[0]), float(residues[0])
 
     def point_from_proportion(self, alpha: float) -> Vect3:
         if alpha <= 0:
             return self.get_start()
         elif alpha >= 1:
             return self.get_end()
-        if self.get_num_points() == 0:
-            return self.get_center()
-        index, residue = self.curve_and_prop_of_partial_point(alpha)
-        return self.get_nth_curve_function(index)(residue)
+        return self.points_from_proportions([alpha])[0]
+
+    def points_from_proportions(self, alphas: Iterable[float]) -> Vect3Array:
+        """
+        Same as point_from_proportion, for an array of alphas at once, so
+        that many points along a path cost a single search through its
+        arc length table
+        """
+        alphas = np.asarray(alphas, dtype=float)
+        if self.get_num_curves() == 0:
+            return np.repeat([self.get_center()], len(alphas), axis=0)
+        points = self.get_points()
+        indices, residues = self.curves_and_props_of_partial_points(alphas)
+        result = quadratic_bezier_points_at(points, indices, residues)
+        result[alphas <= 0] = points[0]
+        result[alphas >= 1] = points[-1]
+        return result
 
     def get_anchors_and_handles(self) -> list[Vect3]:
         """
@@ -854,10 +928,7 @@ class VMobject(Mobject):
 
     def get_arc_length(self, n_sample_points: int | None = None) -> float:
         if n_sample_points is not None:
-            points = np.array([
-                self.quick_point_from_proportion(a)
-                for a in np.linspace(0, 1, n_sample_points)
-            ])
+            points = self.quick_points_from_proportions(np.linspace(0, 1, n_sample_points))
             return poly_line_length(points)
         points = self.get_points()
         inner_len = poly_line_length(points[::2])
@@ -888,7 +959,7 @@ class VMobject(Mobject):
         if self.get_num_points() < 3:
             return OUT
 
-        if not self.needs_new_unit_normal and not refresh:
+        if self.unit_normal_version == self.shape_version and not refresh:
             return self.data["base_normal"][1, :]
 
         area_vect = self.get_area_vector()
@@ -899,23 +970,11 @@ class VMobject(Mobject):
             p = self.get_points()
             normal = get_unit_normal(p[1] - p[0], p[2] - p[1])
         self.data["base_normal"][1::2] = normal
-        self.needs_new_unit_normal = False
+        self.unit_normal_version = self.shape_version
         return normal
 
     def refresh_unit_normal(self) -> Self:
-        self.needs_new_unit_normal = True
-        return self
-
-    def rotate(
-        self,
-        angle: float,
-        axis: Vect3 = OUT,
-        about_point: Vect3 | None = None,
-        **kwargs
-    ) -> Self:
-        super().rotate(angle, axis, about_point, **kwargs)
-        for mob in self.get_family():
-            mob.refresh_unit_normal()
+        self.unit_normal_version = -1
         return self
 
     def ensure_positive_orientation(self, recurse=True) -> Self:
@@ -941,10 +1000,9 @@ class VMobject(Mobject):
         subpaths1 = self.get_subpaths()
         subpaths2 = vmobject.get_subpaths()
         for subpaths in [subpaths1, subpaths2]:
-            subpaths.sort(key=lambda sp: -sum(
-                get_norm(p2 - p1)
-                for p1, p2 in zip(sp, sp[1:])
-            ))
+            # Longest first, going by the lengths of their control polygons
+            lengths = np.array([np.linalg.norm(np.diff(sp, axis=0), axis=1).sum() for sp in subpaths])
+            subpaths[:] = [subpaths[i] for i in np.argsort(-lengths, kind="stable")]
         n_subpaths = max(len(subpaths1), len(subpaths2))
 
         # Start building new ones
@@ -988,28 +1046,16 @@ class VMobject(Mobject):
         if len(points) == 1:
             return np.repeat(points, 2 * n + 1, 0)
 
-        bezier_tuples = list(self.get_bezier_tuples_from_points(points))
+        a0, h, a1 = points[0:-1:2], points[1::2], points[2::2]
         atol = self.tolerance_for_point_equality
-        norms = [
-            0 if get_norm(tup[1] - tup[0]) < atol else get_norm(tup[2] - tup[0])
-            for tup in bezier_tuples
-        ]
-        # Calculate insertions per curve (ipc)
-        ipc = np.zeros(len(bezier_tuples), dtype=int)
-        for _ in range(n):
-            index = np.argmax(norms)
-            ipc[index] += 1
-            norms[index] *= ipc[index] / (ipc[index] + 1)
-
-        new_points = [points[0]]
-        for tup, n_inserts in zip(bezier_tuples, ipc):
-            # What was once a single quadratic curve defined
-            # by "tup" will now be broken into n_inserts + 1
-            # smaller quadratic curves
-            alphas = np.linspace(0, 1, n_inserts + 2)
-            for a1, a2 in zip(alphas, alphas[1:]):
-                new_points.extend(partial_quadratic_bezier_points(tup, a1, a2)[1:])
-        return np.vstack(new_points)
+        norms = np.linalg.norm(a1 - a0, axis=1)
+        norms[np.linalg.norm(h - a0, axis=1) < atol] = 0
+        # Calculate insertions per curve (ipc), with longer curves
+        # broken into more pieces
+        ipc = apportion(norms, n)
+        # What was once a single quadratic curve will now be
+        # broken into n_inserts + 1 smaller quadratic curves
+        return subdivide_quadratic_bezier_points(points, ipc + 1)
 
     def pointwise_become_partial(self, vmobject: VMobject, a: float, b: float) -> Self:
         assert isinstance(vmobject, VMobject)
@@ -1071,7 +1117,20 @@ class VMobject(Mobject):
 
     # Data for shaders that may need refreshing
 
+    def refresh_triangulation(self) -> Self:
+        for mob in self.get_family():
+            mob.triangulation_version = -1
+        return self
+
     def get_triangulation(self) -> np.ndarray:
+        # Keyed on the data version, since animations such as Transform
+        # and ShowCreation write points without marking the shape changed
+        if self.triangulation_version != self._data_version:
+            self.triangulation = self.compute_triangulation()
+            self.triangulation_version = self._data_version
+        return self.triangulation
+
+    def compute_triangulation(self) -> np.ndarray:
         # Figure out how to triangulate the interior to know
         # how to send the points as to the vertex shader.
         # First triangles come directly from the points
@@ -1122,7 +1181,7 @@ class VMobject(Mobject):
 
     def refresh_joint_angles(self) -> Self:
         for mob in self.get_family():
-            mob.needs_new_joint_angles = True
+            mob.joint_angles_version = -1
         return self
 
     def get_joint_angles(self, refresh: bool = False) -> np.ndarray:
@@ -1130,21 +1189,21 @@ class VMobject(Mobject):
         The 'joint product' is a 4-vector holding the cross and dot
         product between tangent vectors at a joint
         """
-        if not self.needs_new_joint_angles and not refresh:
+        if self.joint_angles_version == self.shape_version and not refresh:
             return self.data["joint_angle"][:, 0]
 
         if "joint_angle" in self.locked_data_keys:
             return self.data["joint_angle"][:, 0]
 
-        self.needs_new_joint_angles = False
-        self._data_has_changed = True
+        self.joint_angles_version = self.shape_version
+        self.note_changed_data(recurse_up=False)
+
+        if self.get_num_points() < 3:
+            return self.data["joint_angle"][:, 0]
 
         # Rotate points such that positive z direction is the normal
         points = self.get_points() @ rotation_between_vectors(OUT, self.get_unit_normal())
 
-        if len(points) < 3:
-            return self.data["joint_angle"][:, 0]
-
         # Find all the unit tangent vectors at each joint
         a0, h, a1 = points[0:-1:2], points[1::2], points[2::2]
         a0_to_h = h - a0
@@ -1188,14 +1247,54 @@ class VMobject(Mobject):
         super().lock_matching_data(vmobject1, vmobject2)
         return self
 
+    def note_changed_shape(self, recurse: bool = True) -> Self:
+        """
+        Marks everything derived from the shape of the points, that is the
+        subpath ends, unit normal and joint angles, as out of date. Each is only recomputed once it's next asked for.
+        """
+        for mob in self.get_family(recurse):
+            mob.shape_version = next(DATA_VERSIONS)
+        return self
+
+    def transform_derived_data(self, matrix: np.ndarray) -> Self:
+        """
+        Having applied a linear map to the points of this family, update
+        what was derived from their shape without recomputing it.
+
+        Normals are carried by the cofactor matrix of the map. For maps
+        preserving angles, such as rotations, joint angles and subpath ends
+        stay as they are, while other maps leave only the normal up to date.
+        """
+        cofactor = np.array([
+            np.cross(matrix[:, 1], matrix[:, 2]),
+            np.cross(matrix[:, 2], matrix[:, 0]),
+            np.cross(matrix[:, 0], matrix[:, 1]),
+        ]).T
+        gram = matrix.T @ matrix
+        scale = gram[0, 0]
+        preserves_angles = scale > 0 and np.allclose(gram, scale * np.identity(3), atol=1e-8 * scale)
+        for mob in self.get_family():
+            if not mob.has_points():
+                continue
+            normal_is_current = mob.unit_normal_version == mob.shape_version
+            if not preserves_angles:
+                mob.note_changed_shape(recurse=False)
+            if normal_is_current:
+                normal = cofactor @ mob.data["base_normal"][1]
+                norm = math.sqrt(normal.dot(normal))
+                if norm > 0:
+                    mob.data["base_normal"][1::2] = normal / norm
+                    mob.unit_normal_version = mob.shape_version
+                else:
+                    mob.refresh_unit_normal()
+        return self
+
     def triggers_refresh(func: Callable):
         @wraps(func)
         def wrapper(self, *args, refresh=True, **kwargs):
             func(self, *args, **kwargs)
             if refresh:
-                self.subpath_end_indices = None
-                self.refresh_joint_angles()
-                self.refresh_unit_normal()
+                self.note_changed_shape()
             return self
         return wrapper
 
@@ -1218,13 +1317,19 @@ class VMobject(Mobject):
             inner_ends = mob.get_subpath_end_indices()[:-1]
             mob.data["point"][inner_ends + 1] = mob.data["point"][inner_ends + 2]
             mob.data["base_normal"][1::2] *= -1  # Invert normal vector
-            self.subpath_end_indices = None
+            # Joint angles are unchanged, as both the direction
+            # of travel and the normal are reversed
+            mob.subpath_end_indices_version = -1
         return super().reverse_points()
 
     @triggers_refresh
     def set_data(self, data: np.ndarray) -> Self:
         return super().set_data(data)
 
+    @triggers_refresh
+    def match_points(self, mobject: Mobject) -> Self:
+        return super().match_points(mobject)
+
     # TODO, how to be smart about tangents here?
     @triggers_refresh
     def apply_function(
@@ -1238,13 +1343,20 @@ class VMobject(Mobject):
             self.make_smooth(approx=True)
         return self
 
-    @triggers_refresh
-    def stretch(self, *args, **kwargs) -> Self:
-        return super().stretch(*args, **kwargs)
+    def stretch(self, factor: float, dim: int, **kwargs) -> Self:
+        super().stretch(factor, dim, **kwargs)
+        matrix = np.identity(self.dim)
+        matrix[dim, dim] = factor
+        self.transform_derived_data(matrix)
+        return self
 
-    @triggers_refresh
-    def apply_matrix(self, *args, **kwargs) -> Self:
-        return super().apply_matrix(*args, **kwargs)
+    def apply_matrix(self, matrix: npt.ArrayLike, **kwargs) -> Self:
+        super().apply_matrix(matrix, **kwargs)
+        full_matrix = np.identity(self.dim)
+        matrix = np.array(matrix)
+        full_matrix[:matrix.shape[0], :matrix.shape[1]] = matrix
+        self.transform_derived_data(full_matrix)
+        return self
 
     def rotate(
         self,
@@ -1259,8 +1371,7 @@ class VMobject(Mobject):
             about_point,
             **kwargs
         )
-        for mob in self.get_family():
-            mob.get_unit_normal(refresh=True)
+        self.transform_derived_data(rot_matrix_T.T)
         return self
 
     def set_animating_status(self, is_animating: bool, recurse: bool = True):
@@ -1289,7 +1400,8 @@ class VMobject(Mobject):
         return self
 
     def get_shader_data(self) -> np.ndarray:
-        # Do we want this elsewhere? Say whenever points are refreshed or something?
+        # Each of these is only recomputed if the shape has changed
+        self.get_unit_normal()
         self.get_joint_angles()
         self.data["base_normal"][0::2] = self.data["point"][0]
         return super().get_shader_data()
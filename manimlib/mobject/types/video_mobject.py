@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import numpy as np
+
+from manimlib.config import manim_config
+from manimlib.constants import DR, UL
+from manimlib.mobject.mobject import Mobject
+from manimlib.mobject.types.image_mobject import ImageMobject
+from manimlib.utils.bezier import inverse_interpolate
+from manimlib.utils.file_ops import find_file
+from manimlib.utils.tracing import add_count
+from manimlib.utils.tracing import trace_span
+from manimlib.utils.video import VideoDecoder
+from manimlib.utils.video import probe_video
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Optional
+    from moderngl.context import Context
+    from manimlib.shader_wrapper import ShaderWrapper
+    from manimlib.typing import Vect3
+
+
+class VideoMobject(ImageMobject):
+    """
+    Plays a video clip as an image which changes with scene time, e.g. for
+    picture-in-picture. Frames are decoded by ffmpeg on a background thread,
+    and each one is written into the same texture, so there are no
+    intermediate image files, and memory use doesn't grow with the clip.
+
+    With speed, start_time and loop, the clip can be sped up or slowed
+    down, started partway through, or repeated. Otherwise, it holds its
+    last frame once it ends. resolution sets the size frames are decoded
+    at, if smaller than the video's own is enough.
+
+    Playback is driven by an updater, so it can be paused and resumed with
+    suspend_updating and resume_updating, like any other mobject's updaters.
+    """
+    def __init__(
+        self,
+        filename: str,
+        height: float = 4.0,
+        speed: float = 1.0,
+        start_time: float = 0.0,
+        loop: bool = False,
+        resolution: Optional[tuple[int, int]] = None,
+        n_buffers: int = 4,
+        **kwargs
+    ):
+        self.height = height
+        self.video_path = str(find_file(filename, extensions=[".mp4", ".mov", ".webm", ".mkv", ".avi", ""]))
+        self.ffmpeg_bin = manim_config.file_writer.ffmpeg_bin or "ffmpeg"
+        self.info = probe_video(self.video_path, self.ffmpeg_bin)
+        self.frame_size = tuple(resolution or (self.info.width, self.info.height))
+        self.speed = speed
+        self.start_time = start_time
+        self.loop = loop
+        self.n_buffers = n_buffers
+
+        self.video_time = 0.0
+        self.decoder: Optional[VideoDecoder] = None
+        self.decoder_start_time = 0.0
+        self.texture = None
+        self.shown_frame_index = -1
+
+        # ImageMobject.__init__ would open filename as an image
+        Mobject.__init__(self, **kwargs)
+        self.add_updater(VideoMobject.update_video)
+
+    def __getstate__(self):
+        # A copy decodes its own frames, into its own texture
+        state = super().__getstate__()
+        state.update(decoder=None, texture=None, shown_frame_index=-1)
+        return state
+
+    def init_points(self) -> None:
+        width, height = self.frame_size
+        self.set_width(2 * width / height, stretch=True)
+        self.set_height(self.height)
+
+    def update_video(self, dt: float) -> None:
+        self.video_time += self.speed * dt
+        # Once drawn, the texture is kept current here, since rendering
+        # only asks for shader wrappers again when data has changed
+        if self.texture is not None:
+            self.update_texture()
+
+    def set_video_time(self, time: float) -> VideoMobject:
+        """
+        Jump to a time in the clip, measured from start_time. Going
+        backwards means starting a new decoder from that point.
+        """
+        if time < self.video_time and self.decoder is not None:
+            self.close_decoder()
+        self.video_time = time
+        return self
+
+    def get_frame_index(self) -> int:
+        return int((self.video_time - self.decoder_start_time) * self.info.fps)
+
+    def get_decoder(self) -> VideoDecoder:
+        if self.decoder is None:
+            self.decoder_start_time = self.video_time
+            self.decoder = VideoDecoder(
+                self.video_path,
+                self.frame_size,
+                start_time=self.start_time + self.video_time,
+                loop=self.loop,
+                n_buffers=self.n_buffers,
+                ffmpeg_bin=self.ffmpeg_bin,
+            )
+        return self.decoder
+
+    def close_decoder(self) -> None:
+        if self.decoder is not None:
+            self.decoder.close()
+        self.decoder = None
+        self.shown_frame_index = -1
+
+    def get_current_frame(self) -> Optional[bytearray]:
+        return self.get_decoder().get_frame(max(self.get_frame_index(), 0))
+
+    def init_shader_wrapper(self, ctx: Context):
+        Mobject.init_shader_wrapper(self, ctx)
+        self.texture = ctx.texture(self.frame_size, components=4)
+        self.shader_wrapper.add_texture("Texture", self.texture)
+        self.shown_frame_index = -1
+        # Shader wrappers are batched by id, which would otherwise be the
+        # same for every video, as their textures don't come from files
+        self.shader_wrapper.texture_paths = {"Texture": f"{self.video_path}#{id(self)}"}
+        self.shader_wrapper.refresh_id()
+
+    def get_shader_wrapper(self, ctx: Context) -> ShaderWrapper:
+        shader_wrapper = super().get_shader_wrapper(ctx)
+        self.update_texture()
+        return shader_wrapper
+
+    def update_texture(self) -> None:
+        index = self.get_frame_index()
+        if index == self.shown_frame_index:
+            return
+        if self.decoder is not None and self.decoder.finished:
+            # The texture already shows the last frame
+            return
+        with trace_span("video_decode"):
+            frame = self.get_current_frame()
+        if frame is not None:
+            self.texture.write(frame)
+            add_count("bytes_uploaded", len(frame))
+        self.shown_frame_index = index
+        if self.decoder.finished and not self.loop:
+            # Keep showing the last frame, which is in the texture, without
+            # holding a process and thread for the rest of the scene
+            self.decoder.close()
+
+    def point_to_rgb(self, point: Vect3) -> Vect3:
+        x0, y0 = self.get_corner(UL)[:2]
+        x1, y1 = self.get_corner(DR)[:2]
+        x_alpha = inverse_interpolate(x0, x1, point[0])
+        y_alpha = inverse_interpolate(y0, y1, point[1])
+        if not (0 <= x_alpha <= 1 and 0 <= y_alpha <= 1):
+            raise Exception("Cannot sample color from outside a video")
+        frame = self.get_current_frame()
+        if frame is None:
+            raise Exception(f"No frames could be decoded from {self.video_path}")
+        width, height = self.frame_size
+        pixels = np.frombuffer(frame, dtype=np.uint8).reshape((height, width, 4))
+        rgb = pixels[int((height - 1) * y_alpha), int((width - 1) * x_alpha), :3]
+        return rgb / 255
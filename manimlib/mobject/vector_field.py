@@ -8,6 +8,8 @@ from scipy.integrate import solve_ivp
 from manimlib.constants import FRAME_HEIGHT, FRAME_WIDTH
 from manimlib.constants import DEFAULT_MOBJECT_COLOR
 from manimlib.animation.indication import VShowPassingFlash
+from manimlib.mobject.mobject import Mobject
+from manimlib.mobject.types.arrow_cloud import ArrowCloud
 from manimlib.mobject.types.vectorized_mobject import VGroup
 from manimlib.mobject.types.vectorized_mobject import VMobject
 from manimlib.utils.bezier import interpolate
@@ -25,11 +27,16 @@ if TYPE_CHECKING:
     from manimlib.typing import ManimColor, Vect3, VectN, VectArray, Vect3Array, Vect4Array
 
     from manimlib.mobject.coordinate_systems import CoordinateSystem
-    from manimlib.mobject.mobject import Mobject
 
     T = TypeVar("T")
 
 
+# How far along an arrow each of its 8 points sits, as weights
+# for the distance to the base of its head, and for its full length
+ARROW_HEAD_BASE_WEIGHTS = np.array([0, 0.5, 1, 1, 1, 0.5, 0, 0])
+ARROW_TIP_WEIGHTS = np.array([0, 0, 0, 0, 0, 0.5, 1, 1])
+
+
 #### Delete these two ###
 def get_vectorized_rgb_gradient_function(
     min_value: T,
@@ -128,6 +135,35 @@ def get_sample_coords(
     return np.array(list(it.product(*ranges)))
 
 
+def get_drawn_vectors(
+    func: Callable[[VectArray], VectArray],
+    coordinate_system: CoordinateSystem,
+    sample_coords: VectArray,
+    max_len: float,
+) -> tuple[np.ndarray, Vect3Array, np.ndarray]:
+    """
+    Evaluates func at sample_coords, returning the norms of its outputs,
+    their directions in global coordinates, and how long to draw each of
+    them there, smoothly capped at max_len
+    """
+    # Outputs in the coordinate system
+    outputs = func(sample_coords)
+    output_norms = np.linalg.norm(outputs, axis=1)
+
+    # Corresponding vector values in global coordinates
+    out_vects = coordinate_system.c2p(*outputs.T) - coordinate_system.get_origin()
+    out_vect_norms = np.linalg.norm(out_vects, axis=1)[:, np.newaxis]
+    unit_outputs = np.zeros_like(out_vects)
+    np.true_divide(out_vects, out_vect_norms, out=unit_outputs, where=(out_vect_norms > 0))
+
+    # How long should the arrows be drawn, in global coordinates
+    if max_len < np.inf:
+        drawn_norms = max_len * np.tanh(out_vect_norms / max_len)
+    else:
+        drawn_norms = out_vect_norms
+    return output_norms, unit_outputs, drawn_norms
+
+
 def vectorize(pointwise_function: Callable[[Tuple], Tuple]):
     def v_func(coords_array: VectArray) -> VectArray:
         return np.array([pointwise_function(*coords) for coords in coords_array])
@@ -138,34 +174,28 @@ def vectorize(pointwise_function: Callable[[Tuple], Tuple]):
 # Mobjects
 
 
-class VectorField(VMobject):
-    def __init__(
+class SampledVectors(object):
+    """
+    What VectorField and VectorCloud share, being the sample coordinates
+    at which func is drawn, how long the drawn vectors may get, and how
+    they're colored by magnitude
+    """
+    def init_sampled_vectors(
         self,
-        # Vectorized function: Takes in an array of coordinates, returns an array of outputs.
         func: Callable[[VectArray], VectArray],
-        # Typically a set of Axes or NumberPlane
         coordinate_system: CoordinateSystem,
-        sample_coords: Optional[VectArray] = None,
-        density: float = 2.0,
-        magnitude_range: Optional[Tuple[float, float]] = None,
-        color: Optional[ManimColor] = None,
-        color_map_name: Optional[str] = "3b1b_colormap",
-        color_map: Optional[Callable[[Sequence[float]], Vect4Array]] = None,
-        stroke_opacity: float = 1.0,
-        stroke_width: float = 3,
-        tip_width_ratio: float = 4,
-        tip_len_to_width: float = 0.01,
-        max_vect_len: float | None = None,
-        max_vect_len_to_step_size: float = 0.8,
-        flat_stroke: bool = False,
-        norm_to_opacity_func=None,  # TODO, check on this
-        **kwargs
+        sample_coords: Optional[VectArray],
+        density: float,
+        magnitude_range: Optional[Tuple[float, float]],
+        color: Optional[ManimColor],
+        color_map_name: Optional[str],
+        color_map: Optional[Callable[[Sequence[float]], Vect4Array]],
+        max_vect_len: float | None,
+        max_vect_len_to_step_size: float,
+        norm_to_opacity_func,
     ):
         self.func = func
         self.coordinate_system = coordinate_system
-        self.stroke_width = stroke_width
-        self.tip_width_ratio = tip_width_ratio
-        self.tip_len_to_width = tip_len_to_width
         self.norm_to_opacity_func = norm_to_opacity_func
 
         # Search for sample_points
@@ -193,7 +223,57 @@ class VectorField(VMobject):
         else:
             self.color_map = color_map or get_color_map(color_map_name)
 
+    def set_sample_coords(self, sample_coords: VectArray):
+        self.sample_coords = sample_coords
+        return self
+
+    def update_sample_points(self):
+        self.sample_points = self.coordinate_system.c2p(*self.sample_coords.T)
+
+    def get_drawn_vectors(self) -> tuple[np.ndarray, Vect3Array, np.ndarray]:
+        return get_drawn_vectors(
+            self.func, self.coordinate_system, self.sample_coords, self.max_displayed_vect_len
+        )
+
+    def get_magnitude_rgbs(self, output_norms: np.ndarray) -> Vect3Array:
+        low, high = self.magnitude_range
+        return self.color_map(inverse_interpolate(low, high, output_norms))[:, :3]
+
+
+class VectorField(VMobject, SampledVectors):
+    def __init__(
+        self,
+        # Vectorized function: Takes in an array of coordinates, returns an array of outputs.
+        func: Callable[[VectArray], VectArray],
+        # Typically a set of Axes or NumberPlane
+        coordinate_system: CoordinateSystem,
+        sample_coords: Optional[VectArray] = None,
+        density: float = 2.0,
+        magnitude_range: Optional[Tuple[float, float]] = None,
+        color: Optional[ManimColor] = None,
+        color_map_name: Optional[str] = "3b1b_colormap",
+        color_map: Optional[Callable[[Sequence[float]], Vect4Array]] = None,
+        stroke_opacity: float = 1.0,
+        stroke_width: float = 3,
+        tip_width_ratio: float = 4,
+        tip_len_to_width: float = 0.01,
+        max_vect_len: float | None = None,
+        max_vect_len_to_step_size: float = 0.8,
+        flat_stroke: bool = False,
+        norm_to_opacity_func=None,  # TODO, check on this
+        **kwargs
+    ):
+        self.stroke_width = stroke_width
+        self.tip_width_ratio = tip_width_ratio
+        self.tip_len_to_width = tip_len_to_width
+        self.init_sampled_vectors(
+            func, coordinate_system, sample_coords, density, magnitude_range,
+            color, color_map_name, color_map, max_vect_len, max_vect_len_to_step_size,
+            norm_to_opacity_func,
+        )
         self.init_base_stroke_width_array(len(self.sample_coords))
+        self.arrow_point_buffer = np.zeros((0, 8, 3))
+        self.arrow_value_buffer = np.zeros((0, 8))
 
         super().__init__(
             stroke_opacity=stroke_opacity,
@@ -229,16 +309,10 @@ class VectorField(VMobject):
         ))
 
     def init_base_stroke_width_array(self, n_sample_points):
-        arr = np.ones(8 * n_sample_points - 1)
-        arr[4::8] = self.tip_width_ratio
-        arr[5::8] = self.tip_width_ratio * 0.5
-        arr[6::8] = 0
-        arr[7::8] = 0
-        self.base_stroke_width_array = arr
-
-    def set_sample_coords(self, sample_coords: VectArray):
-        self.sample_coords = sample_coords
-        return self
+        # Widths for the 8 points of one arrow
+        tip_ratio = self.tip_width_ratio
+        self.arrow_stroke_widths = np.array([1, 1, 1, 1, tip_ratio, 0.5 * tip_ratio, 0, 0])
+        self.base_stroke_width_array = np.tile(self.arrow_stroke_widths, n_sample_points)[:-1]
 
     def set_stroke(self, color=None, width=None, opacity=None, behind=None, flat=None, recurse=True):
         super().set_stroke(color, None, opacity, behind, flat, recurse)
@@ -252,62 +326,52 @@ class VectorField(VMobject):
             self.stroke_width = width
         return self
 
-    def update_sample_points(self):
-        self.sample_points = self.coordinate_system.c2p(*self.sample_coords.T)
+    def get_arrow_buffers(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Arrays laid out as (n_samples, 8, ...), one row for each arrow's
+        8 points, which update_vectors reuses each frame to build point
+        positions and per-point values, rather than allocating new ones
+        """
+        n_samples = len(self.sample_coords)
+        if len(self.arrow_point_buffer) != n_samples:
+            self.arrow_point_buffer = np.zeros((n_samples, 8, 3))
+            self.arrow_value_buffer = np.zeros((n_samples, 8))
+        return self.arrow_point_buffer, self.arrow_value_buffer
 
     def update_vectors(self):
         tip_width = self.tip_width_ratio * self.stroke_width
         tip_len = self.tip_len_to_width * tip_width
+        point_buffer, value_buffer = self.get_arrow_buffers()
 
-        # Outputs in the coordinate system
-        outputs = self.func(self.sample_coords)
-        output_norms = np.linalg.norm(outputs, axis=1)[:, np.newaxis]
-
-        # Corresponding vector values in global coordinates
-        out_vects = self.coordinate_system.c2p(*outputs.T) - self.coordinate_system.get_origin()
-        out_vect_norms = np.linalg.norm(out_vects, axis=1)[:, np.newaxis]
-        unit_outputs = np.zeros_like(out_vects)
-        np.true_divide(out_vects, out_vect_norms, out=unit_outputs, where=(out_vect_norms > 0))
-
-        # How long should the arrows be drawn, in global coordinates
-        max_len = self.max_displayed_vect_len
-        if max_len < np.inf:
-            drawn_norms = max_len * np.tanh(out_vect_norms / max_len)
-        else:
-            drawn_norms = out_vect_norms
+        output_norms, unit_outputs, drawn_norms = self.get_drawn_vectors()
 
         # What's the distance from the base of an arrow to
         # the base of its head?
         dist_to_head_base = np.clip(drawn_norms - tip_len, 0, np.inf)  # Mixing units!
 
-        # Set all points
-        points = self.get_points()
-        points[0::8] = self.sample_points
-        points[2::8] = self.sample_points + dist_to_head_base * unit_outputs
-        points[4::8] = points[2::8]
-        points[6::8] = self.sample_points + drawn_norms * unit_outputs
-        for i in (1, 3, 5):
-            points[i::8] = 0.5 * (points[i - 1::8] + points[i + 1::8])
-        points[7::8] = points[6:-1:8]
+        # Each of an arrow's points lies some distance along it from its
+        # base, a combination of the distance to the head base and the
+        # full drawn length
+        np.multiply(dist_to_head_base, ARROW_HEAD_BASE_WEIGHTS, out=value_buffer)
+        value_buffer += drawn_norms * ARROW_TIP_WEIGHTS
+        np.multiply(value_buffer[:, :, np.newaxis], unit_outputs[:, np.newaxis, :], out=point_buffer)
+        point_buffer += self.sample_points[:, np.newaxis, :]
+        self.get_points()[:] = point_buffer.reshape(-1, 3)[:-1]
 
         # Adjust stroke widths
-        width_arr = self.stroke_width * self.base_stroke_width_array
         width_scalars = np.clip(drawn_norms / tip_len, 0, 1)
-        width_scalars = np.repeat(width_scalars, 8)[:-1]
-        self.get_stroke_widths()[:] = width_scalars * width_arr
+        np.multiply(width_scalars, self.stroke_width * self.arrow_stroke_widths, out=value_buffer)
+        self.get_stroke_widths()[:] = value_buffer.reshape(-1)[:-1]
 
-        # Potentially adjust opacity and color
+        # Potentially adjust opacity and color, working out
+        # one value per arrow, shared by all its points
         if self.color_map is not None:
-            self.get_stroke_colors()  # Ensures the array is updated to appropriate length
-            low, high = self.magnitude_range
-            self.data['stroke_rgba'][:, :3] = self.color_map(
-                inverse_interpolate(low, high, np.repeat(output_norms, 8)[:-1])
-            )[:, :3]
+            point_buffer[:] = self.get_magnitude_rgbs(output_norms)[:, np.newaxis, :]
+            self.data['stroke_rgba'][:, :3] = point_buffer.reshape(-1, 3)[:-1]
 
         if self.norm_to_opacity_func is not None:
-            self.get_stroke_opacities()[:] = self.norm_to_opacity_func(
-                np.repeat(output_norms, 8)[:-1]
-            )
+            value_buffer[:] = self.norm_to_opacity_func(output_norms)[:, np.newaxis]
+            self.get_stroke_opacities()[:] = value_buffer.reshape(-1)[:-1]
 
         self.note_changed_data()
         return self
@@ -334,6 +398,85 @@ class TimeVaryingVectorField(VectorField):
         self.time += dt
 
 
+class VectorCloud(ArrowCloud, SampledVectors):
+    """
+    Draws the same arrows as VectorField, taking the same arguments, but
+    as an ArrowCloud, so each arrow is a single vertex expanded on the GPU.
+    For dense fields which change every frame, this is much cheaper to
+    update and upload.
+    """
+    def __init__(
+        self,
+        func: Callable[[VectArray], VectArray],
+        coordinate_system: CoordinateSystem,
+        sample_coords: Optional[VectArray] = None,
+        density: float = 2.0,
+        magnitude_range: Optional[Tuple[float, float]] = None,
+        color: Optional[ManimColor] = None,
+        color_map_name: Optional[str] = "3b1b_colormap",
+        color_map: Optional[Callable[[Sequence[float]], Vect4Array]] = None,
+        stroke_opacity: float = 1.0,
+        stroke_width: float = 3,
+        tip_width_ratio: float = 4,
+        tip_len_to_width: float = 0.01,
+        max_vect_len: float | None = None,
+        max_vect_len_to_step_size: float = 0.8,
+        norm_to_opacity_func=None,
+        **kwargs
+    ):
+        self.init_sampled_vectors(
+            func, coordinate_system, sample_coords, density, magnitude_range,
+            color, color_map_name, color_map, max_vect_len, max_vect_len_to_step_size,
+            norm_to_opacity_func,
+        )
+        super().__init__(
+            color=color or DEFAULT_MOBJECT_COLOR,
+            opacity=stroke_opacity,
+            stroke_width=stroke_width,
+            tip_width_ratio=tip_width_ratio,
+            tip_length=tip_len_to_width * tip_width_ratio * stroke_width,
+            **kwargs
+        )
+        self.set_points(self.sample_points)
+        self.update_vectors()
+
+    @Mobject.affects_data
+    def update_vectors(self):
+        output_norms, unit_outputs, drawn_norms = self.get_drawn_vectors()
+        self.data["point"][:] = self.sample_points
+        self.data["end"][:] = self.sample_points + drawn_norms * unit_outputs
+
+        if self.color_map is not None:
+            self.data["rgba"][:, :3] = self.get_magnitude_rgbs(output_norms)
+
+        if self.norm_to_opacity_func is not None:
+            self.data["rgba"][:, 3] = self.norm_to_opacity_func(output_norms)
+
+        self.refresh_bounding_box()
+        return self
+
+
+class TimeVaryingVectorCloud(VectorCloud):
+    def __init__(
+        self,
+        # Takes in an array of points and a float for time
+        time_func: Callable[[VectArray, float], VectArray],
+        coordinate_system: CoordinateSystem,
+        **kwargs
+    ):
+        self.time = 0
+
+        def func(coords):
+            return time_func(coords, self.time)
+
+        super().__init__(func, coordinate_system, **kwargs)
+        self.add_updater(lambda m, dt: m.increment_time(dt))
+        self.always.update_vectors()
+
+    def increment_time(self, dt):
+        self.time += dt
+
+
 class StreamLines(VGroup):
     def __init__(
         self,
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 from collections import OrderedDict
+import json
+import pickle
 import platform
 import random
 import time
@@ -10,7 +12,6 @@ from contextlib import ExitStack
 
 import numpy as np
 from tqdm.auto import tqdm as ProgressDisplay
-from pyglet.window import key as PygletWindowKeys
 
 from manimlib.animation.animation import prepare_animation
 from manimlib.camera.camera import Camera
@@ -18,6 +19,7 @@ from manimlib.camera.camera_frame import CameraFrame
 from manimlib.config import manim_config
 from manimlib.event_handler import EVENT_DISPATCHER
 from manimlib.event_handler.event_type import EventType
+from manimlib.event_handler import keys as PygletWindowKeys
 from manimlib.logger import log
 from manimlib.mobject.mobject import _AnimationBuilder
 from manimlib.mobject.mobject import Group
@@ -32,9 +34,15 @@ from manimlib.utils.dict_ops import merge_dicts_recursively
 from manimlib.utils.family_ops import extract_mobject_family_members
 from manimlib.utils.family_ops import recursive_mobject_remove
 from manimlib.utils.iterables import batch_by_property
+from manimlib.utils.snapshots import ArrayStore
+from manimlib.utils.snapshots import MobjectSnapshot
 from manimlib.utils.sounds import play_sound
 from manimlib.utils.color import color_to_rgba
-from manimlib.window import Window
+from manimlib.utils.tracing import add_count
+from manimlib.utils.tracing import set_profile_section
+from manimlib.utils.tracing import start_profiling
+from manimlib.utils.tracing import stop_profiling
+from manimlib.utils.tracing import trace_span
 
 from typing import TYPE_CHECKING
 
@@ -47,6 +55,7 @@ if TYPE_CHECKING:
     from PIL.Image import Image
 
     from manimlib.animation.animation import Animation
+    from manimlib.window import Window
 
 
 class Scene(object):
@@ -55,6 +64,9 @@ class Scene(object):
     scroll_sensitivity: float = 20
     drag_to_pan: bool = True
     max_num_saved_states: int = 50
+    # Once saved states hold this many bytes of mobject data in
+    # memory, further data is spilled to a memory-mapped file
+    snapshot_spill_threshold: int | None = None
     default_camera_config: dict = dict()
     default_file_writer_config: dict = dict()
     samples = 0
@@ -75,6 +87,7 @@ class Scene(object):
         preview_while_skipping: bool = True,
         presenter_mode: bool = False,
         default_wait_time: float = 1.0,
+        profile: bool = False,
     ):
         self.skip_animations = skip_animations
         self.always_update_mobjects = always_update_mobjects
@@ -85,6 +98,7 @@ class Scene(object):
         self.preview_while_skipping = preview_while_skipping
         self.presenter_mode = presenter_mode
         self.default_wait_time = default_wait_time
+        self.profile = profile
 
         self.camera_config = merge_dicts_recursively(
             manim_config.camera,         # Global default
@@ -123,9 +137,12 @@ class Scene(object):
         self.original_skipping_status: bool = self.skip_animations
         self.undo_stack = []
         self.redo_stack = []
+        self.snapshot_store = ArrayStore(spill_threshold=self.snapshot_spill_threshold)
 
         if self.start_at_animation_number is not None:
             self.skip_animations = True
+        if self.file_writer.resume_checkpoint is not None:
+            self.skip_animations = True
         if self.file_writer.has_progress_display():
             self.show_animation_progress = False
 
@@ -147,13 +164,16 @@ class Scene(object):
         return self.window
 
     def run(self) -> None:
+        if self.profile:
+            start_profiling()
         self.virtual_animation_start_time: float = 0
         self.real_animation_start_time: float = time.time()
         self.file_writer.begin()
 
         self.setup()
         try:
-            self.construct()
+            with trace_span("construct", category="scene", scene=str(self), skip_animations=self.skip_animations):
+                self.construct()
             self.interact()
         except EndScene:
             pass
@@ -179,10 +199,24 @@ class Scene(object):
     def tear_down(self) -> None:
         self.stop_skipping()
         self.file_writer.finish()
+        if self.profile:
+            self.report_profile()
         if self.window:
             self.window.destroy()
             self.window = None
 
+    def report_profile(self) -> None:
+        profiler = stop_profiling()
+        if profiler is None:
+            return
+        print(profiler.get_report())
+        if self.file_writer.write_to_movie or self.file_writer.save_last_frame:
+            rootname = self.file_writer.get_output_file_rootname()
+            path = rootname.with_name(rootname.name + "_profile.json")
+            with open(path, "w") as fp:
+                json.dump(profiler.to_dict(), fp, indent=2)
+            log.info(f"Profile written to {path}")
+
     def interact(self) -> None:
         """
         If there is a window, enter a loop
@@ -248,7 +282,9 @@ class Scene(object):
             self.window._window.dispatch_events()
             return
 
-        self.camera.capture(*self.render_groups)
+        with trace_span("frame_render"):
+            self.camera.capture(*self.render_groups)
+        add_count("frames")
 
         if self.window and not self.skip_animations:
             vt = self.time - self.virtual_animation_start_time
@@ -262,8 +298,9 @@ class Scene(object):
     # Related to updating
 
     def update_mobjects(self, dt: float) -> None:
-        for mobject in self.mobjects:
-            mobject.update(dt)
+        with trace_span("updaters"):
+            for mobject in self.mobjects:
+                mobject.update(dt)
 
     def should_update_mobjects(self) -> bool:
         return self.always_update_mobjects or any(
@@ -299,21 +336,44 @@ class Scene(object):
 
     def assemble_render_groups(self):
         """
-        Rendering can be more efficient when mobjects of the
-        same type are grouped together, so this function creates
-        Groups of all clusters of adjacent Mobjects in the scene
+        Rendering can be more efficient when mobjects sharing a shader
+        are grouped together, so this function creates Groups of all
+        clusters of adjacent Mobjects in the scene with the same type,
+        shader and z_index. Mixing types would let one mobject's fill be
+        drawn over another's stroke, since a VMobject batch draws all its
+        fills before any of its strokes.
+
+        Mobjects which never draw anything, like the camera frame or
+        value trackers, go into a group of their own, so that they don't
+        split up the clusters on either side of them.
         """
-        batches = batch_by_property(
-            self.mobjects,
-            lambda m: str(type(m)) + str(m.get_shader_wrapper(self.camera.ctx).get_id()) + str(m.z_index)
-        )
+        with trace_span("assemble_render_groups"):
+            drawn_mobjects = []
+            undrawn_mobjects = []
+            for mob in self.mobjects:
+                if self.never_draws(mob):
+                    undrawn_mobjects.append(mob)
+                else:
+                    drawn_mobjects.append(mob)
+
+            batches = batch_by_property(
+                drawn_mobjects,
+                lambda m: str(type(m)) + str(m.get_shader_wrapper(self.camera.ctx).get_id()) + str(m.z_index)
+            )
 
-        for group in self.render_groups:
-            group.clear()
-        self.render_groups = [
-            batch[0].get_group_class()(*batch)
-            for batch, key in batches
-        ]
+            for group in self.render_groups:
+                group.clear()
+            self.render_groups = [
+                batch[0].get_group_class()(*batch)
+                for batch, key in batches
+            ]
+            if undrawn_mobjects:
+                self.render_groups.insert(0, Group(*undrawn_mobjects))
+
+    def never_draws(self, mobject: Mobject) -> bool:
+        return not mobject.submobjects \
+            and not isinstance(mobject, Group) \
+            and not mobject.get_shader_wrapper(self.camera.ctx).programs
 
     @staticmethod
     def affects_mobject_list(func: Callable[..., T]) -> Callable[..., T]:
@@ -448,6 +508,12 @@ class Scene(object):
     # Related to skipping
 
     def update_skipping_status(self) -> None:
+        checkpoint = self.file_writer.resume_checkpoint
+        if checkpoint is not None and self.num_plays == checkpoint["num_plays"]:
+            self.restore_checkpoint_data(checkpoint)
+            self.file_writer.resume_checkpoint = None
+            if not self.original_skipping_status:
+                self.stop_skipping()
         if self.start_at_animation_number is not None:
             if self.num_plays == self.start_at_animation_number:
                 self.skip_time = self.time
@@ -538,6 +604,7 @@ class Scene(object):
             self.update_frame(dt=0, force_draw=True)
 
         self.num_plays += 1
+        set_profile_section("outside animations")
 
     def begin_animations(self, animations: Iterable[Animation]) -> None:
         all_mobjects = set(self.get_mobject_family_members())
@@ -557,10 +624,11 @@ class Scene(object):
         for t in self.get_animation_time_progression(animations):
             dt = t - last_t
             last_t = t
-            for animation in animations:
-                animation.update_mobjects(dt)
-                alpha = t / animation.run_time
-                animation.interpolate(alpha)
+            with trace_span("interpolate"):
+                for animation in animations:
+                    animation.update_mobjects(dt)
+                    alpha = t / animation.run_time
+                    animation.interpolate(alpha)
             self.update_frame(dt)
             self.emit_frame()
 
@@ -587,6 +655,7 @@ class Scene(object):
         animations = list(map(prepare_animation, proto_animations))
         for anim in animations:
             anim.update_rate_info(run_time, rate_func, lag_ratio)
+        set_profile_section(f"play {self.num_plays}: " + ", ".join(map(str, animations)))
         self.pre_play()
         self.begin_animations(animations)
         self.progress_through_animations(animations)
@@ -602,6 +671,7 @@ class Scene(object):
     ):
         if duration is None:
             duration = self.default_wait_time
+        set_profile_section(f"wait {self.num_plays}")
         self.pre_play()
         self.update_mobjects(dt=0)  # Any problems with this?
         if self.presenter_mode and not self.skip_animations and not ignore_presenter_mode:
@@ -682,6 +752,52 @@ class Scene(object):
             self.undo_stack.append(self.get_state())
             self.restore_state(self.redo_stack.pop())
 
+    # Related to checkpoints for resuming renders
+
+    def get_checkpoint_data(self) -> dict:
+        return dict(
+            num_plays=self.num_plays,
+            time=self.time,
+            random_state=random.getstate(),
+            np_random_state=np.random.get_state(),
+            mobjects=list(map(self.serialize_for_checkpoint, self.mobjects)),
+        )
+
+    @staticmethod
+    def serialize_for_checkpoint(mobject: Mobject) -> bytes | None:
+        # Updaters and event listeners are usually closures, which can't
+        # be pickled, and the live mobject keeps its own anyway
+        mob_copy = mobject.copy()
+        mob_copy.clear_updaters()
+        mob_copy.clear_event_listners()
+        try:
+            return mob_copy.serialize()
+        except (pickle.PicklingError, TypeError, AttributeError) as err:
+            log.debug(f"Leaving {mobject} out of checkpoint: {err}")
+            return None
+
+    def restore_checkpoint_data(self, checkpoint: dict) -> None:
+        """
+        By the time this is called, construct has been run in skip mode up
+        to the checkpoint, so the scene already holds the right mobjects. This
+        then matches their state to what it was in the original render, which
+        can differ from the skipped version when updaters depend on dt.
+        """
+        self.time = checkpoint["time"]
+        random.setstate(checkpoint["random_state"])
+        np.random.set_state(checkpoint["np_random_state"])
+        self.file_writer.restore_checkpoint_audio(checkpoint)
+
+        if len(checkpoint["mobjects"]) != len(self.mobjects):
+            log.warning("Scene no longer matches its checkpoint, resuming with the skipped state")
+            return
+        for mob, data in zip(self.mobjects, checkpoint["mobjects"]):
+            if data is None:
+                continue
+            mob_copy = pickle.loads(data)
+            if type(mob_copy) is type(mob):
+                mob.become(mob_copy)
+
     @contextmanager
     def temp_skip(self):
         prev_status = self.skip_animations
@@ -883,43 +999,44 @@ class SceneState():
     def __init__(self, scene: Scene, ignore: list[Mobject] | None = None):
         self.time = scene.time
         self.num_plays = scene.num_plays
-        self.mobjects_to_copies = OrderedDict.fromkeys(scene.mobjects)
+        self.mobjects_to_snapshots = OrderedDict.fromkeys(scene.mobjects)
         if ignore:
             for mob in ignore:
-                self.mobjects_to_copies.pop(mob, None)
+                self.mobjects_to_snapshots.pop(mob, None)
 
-        last_m2c = scene.undo_stack[-1].mobjects_to_copies if scene.undo_stack else dict()
-        for mob in self.mobjects_to_copies:
+        store = scene.snapshot_store
+        last_m2s = scene.undo_stack[-1].mobjects_to_snapshots if scene.undo_stack else dict()
+        for mob in self.mobjects_to_snapshots:
+            snapshot = MobjectSnapshot(mob, store)
             # If it hasn't changed since the last state, just point to the
-            # same copy as before
-            if mob in last_m2c and last_m2c[mob].looks_identical(mob):
-                self.mobjects_to_copies[mob] = last_m2c[mob]
-            else:
-                self.mobjects_to_copies[mob] = mob.copy()
+            # same snapshot as before
+            if mob in last_m2s and last_m2s[mob] == snapshot:
+                snapshot = last_m2s[mob]
+            self.mobjects_to_snapshots[mob] = snapshot
 
     def __eq__(self, state: SceneState):
         return all((
             self.time == state.time,
             self.num_plays == state.num_plays,
-            self.mobjects_to_copies == state.mobjects_to_copies
+            self.mobjects_to_snapshots == state.mobjects_to_snapshots
         ))
 
     def mobjects_match(self, state: SceneState):
-        return self.mobjects_to_copies == state.mobjects_to_copies
+        return self.mobjects_to_snapshots == state.mobjects_to_snapshots
 
     def n_changes(self, state: SceneState):
-        m2c = state.mobjects_to_copies
+        m2s = state.mobjects_to_snapshots
         return sum(
-            1 - int(mob in m2c and mob.looks_identical(m2c[mob]))
-            for mob in self.mobjects_to_copies
+            1 - int(mob in m2s and snapshot == m2s[mob])
+            for mob, snapshot in self.mobjects_to_snapshots.items()
         )
 
     def restore_scene(self, scene: Scene):
         scene.time = self.time
         scene.num_plays = self.num_plays
         scene.mobjects = [
-            mob.become(mob_copy)
-            for mob, mob_copy in self.mobjects_to_copies.items()
+            snapshot.restore()
+            for snapshot in self.mobjects_to_snapshots.values()
         ]
 
 
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import os
+import pickle
 import platform
 import shutil
 import subprocess as sp
@@ -15,6 +16,7 @@ from manimlib.logger import log
 from manimlib.mobject.mobject import Mobject
 from manimlib.utils.file_ops import guarantee_existence
 from manimlib.utils.sounds import get_full_sound_file_path
+from manimlib.utils.tracing import trace_span
 
 from typing import TYPE_CHECKING
 
@@ -48,6 +50,10 @@ class SceneFileWriter(object):
         pixel_format: str = "yuv420p",
         saturation: float = 1.0,
         gamma: float = 1.0,
+        # Save a checkpoint every this many animations (0 means never)
+        checkpoint_interval: int = 0,
+        # Pick up from the latest checkpoint of a previous render
+        resume: bool = False,
     ):
         self.scene: Scene = scene
         self.write_to_movie = write_to_movie
@@ -67,6 +73,8 @@ class SceneFileWriter(object):
         self.pixel_format = pixel_format
         self.saturation = saturation
         self.gamma = gamma
+        self.checkpoint_interval = checkpoint_interval
+        self.resume = resume
 
         # State during file writing
         self.writing_process: sp.Popen | None = None
@@ -75,6 +83,7 @@ class SceneFileWriter(object):
 
         self.init_output_directories()
         self.init_audio()
+        self.init_checkpoints()
 
     # Output directories and files
     def init_output_directories(self) -> None:
@@ -125,6 +134,17 @@ class SceneFileWriter(object):
     def get_movie_file_path(self) -> str:
         return self.movie_file_path
 
+    def get_checkpoint_directory(self) -> Path:
+        rootname = self.get_output_file_rootname()
+        return guarantee_existence(rootname.with_name(rootname.name + "_checkpoints"))
+
+    def get_checkpoint_file_path(self, index: int) -> Path:
+        return Path(self.checkpoint_directory, f"checkpoint_{index:05}.pkl")
+
+    def get_segment_file_path(self, index: int) -> Path:
+        result = Path(self.checkpoint_directory, f"segment_{index:05}")
+        return result.with_suffix(self.movie_file_extension)
+
     # Sound
     def init_audio(self) -> None:
         self.includes_sound: bool = False
@@ -174,21 +194,151 @@ class SceneFileWriter(object):
             new_segment = new_segment.apply_gain(gain)
         self.add_audio_segment(new_segment, time, gain_to_background)
 
+    # Checkpoints
+    def init_checkpoints(self) -> None:
+        # Index of the animation which began the movie segment currently being written
+        self.segment_start: int | None = None
+        self.resume_checkpoint: dict | None = None
+        if not self.uses_checkpoints():
+            return
+        self.checkpoint_directory = self.get_checkpoint_directory()
+        if self.resume:
+            self.resume_checkpoint = self.find_checkpoint_to_resume()
+        if self.resume_checkpoint is None:
+            self.clear_checkpoints()
+
+    def uses_checkpoints(self) -> bool:
+        return all((
+            self.write_to_movie,
+            not self.subdivide_output,
+            self.checkpoint_interval > 0,
+        ))
+
+    @staticmethod
+    def get_file_index(path: Path) -> int:
+        return int(path.stem.split("_")[1])
+
+    def find_checkpoint_to_resume(self) -> dict | None:
+        """
+        Checkpoint n is saved just before animation n, and the movie segment
+        starting there runs until the next checkpoint. The one to resume from
+        is the first whose segment was never finished.
+        """
+        indices = sorted(map(
+            self.get_file_index,
+            self.checkpoint_directory.glob("checkpoint_*.pkl")
+        ))
+        resume_index = None
+        for index in indices:
+            resume_index = index
+            if not self.get_segment_file_path(index).exists():
+                break
+        if resume_index is None:
+            log.info("No checkpoint found to resume from, rendering from the start")
+            return None
+
+        with open(self.get_checkpoint_file_path(resume_index), "rb") as fp:
+            checkpoint = pickle.load(fp)
+
+        if checkpoint["render_settings"] != self.get_render_settings():
+            log.warning(
+                "Checkpoints were made with a different resolution, fps or codec, " + \
+                "rendering from the start"
+            )
+            return None
+
+        # Anything at or past the resume point will be rewritten
+        for path in self.checkpoint_directory.iterdir():
+            if path.name.startswith(("checkpoint_", "segment_")):
+                index = self.get_file_index(path)
+                if index > resume_index or (index == resume_index and path.name.startswith("segment_")):
+                    path.unlink()
+
+        log.info(f"Resuming render from checkpoint at animation {resume_index}")
+        return checkpoint
+
+    def get_render_settings(self) -> tuple:
+        return (
+            tuple(self.scene.camera.get_pixel_shape()),
+            self.scene.camera.fps,
+            self.movie_file_extension,
+            self.video_codec,
+            self.pixel_format,
+        )
+
+    def save_checkpoint(self, index: int) -> None:
+        checkpoint = self.scene.get_checkpoint_data()
+        checkpoint["render_settings"] = self.get_render_settings()
+        if self.includes_sound:
+            checkpoint["audio_segment"] = self.audio_segment
+        file_path = self.get_checkpoint_file_path(index)
+        temp_file_path = file_path.with_suffix(".tmp")
+        with open(temp_file_path, "wb") as fp:
+            pickle.dump(checkpoint, fp)
+        # Only ever leave complete checkpoint files behind
+        os.replace(temp_file_path, file_path)
+
+    def restore_checkpoint_audio(self, checkpoint: dict) -> None:
+        if "audio_segment" in checkpoint:
+            self.includes_sound = True
+            self.audio_segment = checkpoint["audio_segment"]
+
+    def begin_checkpoint_segment(self) -> None:
+        index = self.scene.num_plays
+        if self.segment_start is not None:
+            if index - self.segment_start < self.checkpoint_interval:
+                return
+            self.close_movie_pipe(keep_progress_display=True)
+        self.save_checkpoint(index)
+        self.segment_start = index
+        self.open_movie_pipe(self.get_segment_file_path(index))
+
+    def combine_checkpoint_segments(self) -> None:
+        segment_paths = sorted(
+            path for path in self.checkpoint_directory.glob("segment_*" + self.movie_file_extension)
+            if not path.stem.endswith("_temp")
+        )
+        if not segment_paths:
+            return
+        list_file_path = Path(self.checkpoint_directory, "segments.txt")
+        list_file_path.write_text("".join(
+            f"file '{path.absolute()}'\n"
+            for path in segment_paths
+        ))
+        sp.call([
+            self.ffmpeg_bin,
+            '-y',  # overwrite output file if it exists
+            '-f', 'concat',
+            '-safe', '0',
+            '-i', str(list_file_path),
+            '-c', 'copy',
+            '-loglevel', 'error',
+            str(self.get_movie_file_path()),
+        ])
+
+    def clear_checkpoints(self) -> None:
+        for path in self.checkpoint_directory.iterdir():
+            path.unlink()
+
     # Writers
     def begin(self) -> None:
-        if not self.subdivide_output and self.write_to_movie:
+        if not self.subdivide_output and self.write_to_movie and not self.uses_checkpoints():
             self.open_movie_pipe(self.get_movie_file_path())
 
     def begin_animation(self) -> None:
         if self.subdivide_output and self.write_to_movie:
             self.open_movie_pipe(self.get_next_partial_movie_path())
+        elif self.uses_checkpoints():
+            self.begin_checkpoint_segment()
 
     def end_animation(self) -> None:
         if self.subdivide_output and self.write_to_movie:
             self.close_movie_pipe()
 
     def finish(self) -> None:
-        if not self.subdivide_output and self.write_to_movie:
+        if self.uses_checkpoints():
+            self.finish_checkpoint_segments()
+        elif not self.subdivide_output and self.write_to_movie:
             self.close_movie_pipe()
             if self.includes_sound:
                 self.add_sound_to_video()
@@ -199,6 +349,22 @@ class SceneFileWriter(object):
         if self.should_open_file():
             self.open_file()
 
+    def finish_checkpoint_segments(self) -> None:
+        if self.segment_start is not None:
+            self.close_movie_pipe()
+        if self.ended_with_interrupt:
+            log.info(
+                "Render interrupted, rerun with --resume to continue from " + \
+                f"the checkpoint at animation {self.segment_start}"
+            )
+            return
+        self.combine_checkpoint_segments()
+        if self.includes_sound:
+            self.add_sound_to_video()
+        self.clear_checkpoints()
+        self.checkpoint_directory.rmdir()
+        self.print_file_ready_message(self.get_movie_file_path())
+
     def open_movie_pipe(self, file_path: str) -> None:
         stem, ext = os.path.splitext(file_path)
         self.final_file_path = file_path
@@ -229,7 +395,7 @@ class SceneFileWriter(object):
         command += [self.temp_file_path]
         self.writing_process = sp.Popen(command, stdin=sp.PIPE)
 
-        if not self.quiet:
+        if not self.quiet and self.progress_display is None:
             self.progress_display = ProgressDisplay(
                 range(self.total_frames),
                 leave=False,
@@ -283,17 +449,21 @@ class SceneFileWriter(object):
 
     def write_frame(self, camera: Camera) -> None:
         if self.write_to_movie:
-            raw_bytes = camera.get_raw_fbo_data()
-            self.writing_process.stdin.write(raw_bytes)
+            with trace_span("frame_readback"):
+                raw_bytes = camera.get_raw_fbo_data()
+            with trace_span("ffmpeg_write"):
+                self.writing_process.stdin.write(raw_bytes)
             if self.progress_display is not None:
                 self.progress_display.update()
 
-    def close_movie_pipe(self) -> None:
-        self.writing_process.stdin.close()
-        self.writing_process.wait()
+    def close_movie_pipe(self, keep_progress_display: bool = False) -> None:
+        with trace_span("ffmpeg_finish"):
+            self.writing_process.stdin.close()
+            self.writing_process.wait()
         self.writing_process.terminate()
-        if self.progress_display is not None:
+        if self.progress_display is not None and not keep_progress_display:
             self.progress_display.close()
+            self.progress_display = None
 
         if not self.ended_with_interrupt:
             shutil.move(self.temp_file_path, self.final_file_path)
@@ -11,15 +11,17 @@ from functools import lru_cache
 
 from manimlib.config import parse_cli
 from manimlib.config import manim_config
+from manimlib.utils.iterables import concatenate_records
 from manimlib.utils.shaders import get_shader_code_from_file
 from manimlib.utils.shaders import get_shader_program
-from manimlib.utils.shaders import image_path_to_texture
+from manimlib.utils.shaders import image_paths_to_textures
 from manimlib.utils.shaders import set_program_uniform
+from manimlib.utils.tracing import add_count
 
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from typing import Optional, Tuple, Iterable
+    from typing import Optional, Sequence, Tuple
     from manimlib.typing import UniformDict
     from moderngl.vertex_array import VertexArray
     from moderngl.framebuffer import Framebuffer
@@ -50,6 +52,7 @@ class ShaderWrapper(object):
         self.depth_test = depth_test
         self.render_primitive = render_primitive
         self.texture_paths = texture_paths or dict()
+        self.texture_max_size: Optional[int] = None
 
         self.program_uniform_mirror: UniformDict = dict()
         self.bind_to_mobject_uniforms(mobject_uniforms or dict())
@@ -92,15 +95,25 @@ class ShaderWrapper(object):
 
     def init_textures(self):
         self.texture_names_to_ids = dict()
-        self.textures = []
-        for name, path in self.texture_paths.items():
-            self.add_texture(name, image_path_to_texture(path, self.ctx))
+        self.textures: list[Optional[moderngl.Texture]] = []
+        # Textures from files are left as None here, and looked up from
+        # the texture cache each time they're drawn, since it may have
+        # released them in the meantime
+        for name in self.texture_paths:
+            self.add_texture(name, None)
 
     def init_vertex_objects(self):
         self.vbo = None
+        self.instance_vbo = None
         self.vaos = []
-
-    def add_texture(self, name: str, texture: moderngl.Texture):
+        self.num_vertices: int = 0
+        self.first_vertex: int = 0
+        # False when drawing from a buffer shared with other wrappers
+        self.owns_vbo: bool = True
+        self.chunk_lengths: Tuple[int, ...] = ()
+        self.chunk_versions: Optional[Tuple[int, ...]] = None
+
+    def add_texture(self, name: str, texture: Optional[moderngl.Texture]):
         max_units = self.ctx.info['GL_MAX_TEXTURE_IMAGE_UNITS']
         if len(self.textures) >= max_units:
             raise ValueError(f"Unable to use more than {max_units} textures for a program")
@@ -108,6 +121,33 @@ class ShaderWrapper(object):
         self.texture_names_to_ids[name] = len(self.textures)
         self.textures.append(texture)
 
+    def set_texture_max_size(self, max_size: Optional[int]):
+        """
+        Limits the textures loaded from files to max_size pixels on
+        their longer side
+        """
+        self.texture_max_size = max_size
+        self.refresh_id()
+
+    def get_textures(self) -> list[moderngl.Texture]:
+        """
+        The texture for each unit, with those from files all fetched
+        before any is bound, so that loading one can't release another.
+        Units already given a texture, like a video's, are left as they are.
+        """
+        textures = list(self.textures)
+        names = [
+            name for name in self.texture_paths
+            if textures[self.texture_names_to_ids[name]] is None
+        ]
+        loaded = image_paths_to_textures(
+            [self.texture_paths[name] for name in names],
+            self.ctx, self.texture_max_size
+        )
+        for name, texture in zip(names, loaded):
+            textures[self.texture_names_to_ids[name]] = texture
+        return textures
+
     def bind_to_mobject_uniforms(self, mobject_uniforms: UniformDict):
         self.mobject_uniforms = mobject_uniforms
 
@@ -121,6 +161,7 @@ class ShaderWrapper(object):
             self.depth_test,
             self.render_primitive,
             self.texture_paths,
+            self.texture_max_size,
         ])))
 
     def replace_code(self, old: str, new: str) -> None:
@@ -150,35 +191,162 @@ class ShaderWrapper(object):
 
     # Adding data
 
-    def read_in(self, data_list: Iterable[np.ndarray]):
-        total_len = sum(map(len, data_list))
-        if total_len == 0:
-            if self.vbo is not None:
-                self.vbo.clear()
+    def read_in(
+        self,
+        data_list: Sequence[np.ndarray],
+        data_versions: Optional[Sequence[int]] = None,
+    ):
+        """
+        Concatenates data_list into the vertex buffer.
+
+        If data_versions is given, with one version number for each array
+        in data_list, and the lengths of those arrays match those from the
+        previous call, then only the arrays whose version changed are
+        written to the buffer.
+        """
+        if self.instance_vbo is not None:
+            # Go back to drawing the data just once
+            self.release()
+        self.write_data(data_list, data_versions)
+
+    def read_in_instances(
+        self,
+        data: np.ndarray,
+        data_version: int,
+        instance_shifts: np.ndarray,
+    ):
+        """
+        Reads in the data of a single mobject, which will be drawn once
+        for each of the shifts in instance_shifts
+        """
+        shifts = np.asarray(instance_shifts, dtype=np.float32)
+        self.write_data([data], [data_version])
+        if self.vbo is None:
             return
+        if self.instance_vbo is None or self.instance_vbo.size < shifts.nbytes:
+            if self.instance_vbo is not None:
+                self.instance_vbo.release()
+            self.instance_vbo = self.ctx.buffer(reserve=shifts.nbytes)
+            add_count("vbos_allocated")
+            self.release_vaos()
+            self.generate_vaos()
+            self.set_num_vertices(self.num_vertices)
+        self.instance_vbo.write(shifts)
+        add_count("bytes_uploaded", shifts.nbytes)
+        for vao in self.vaos:
+            vao.instances = len(shifts)
 
+    def supports_instancing(self) -> bool:
+        return len(self.programs) > 0 and all(
+            program.get("instance_shift", None) is not None
+            for program in self.programs
+        )
+
+    def get_vao_content(self, vert_format: str, vert_attributes: Sequence[str]) -> list[tuple]:
+        content = [(self.vbo, vert_format, *vert_attributes)]
+        if self.instance_vbo is not None:
+            content.append((self.instance_vbo, "3f/i", "instance_shift"))
+        return content
+
+    def write_data(
+        self,
+        data_list: Sequence[np.ndarray],
+        data_versions: Optional[Sequence[int]] = None,
+    ):
+        if not self.owns_vbo:
+            self.release()
+        chunk_lengths = tuple(map(len, data_list))
+        chunk_versions = None if data_versions is None else tuple(data_versions)
+        total_len = sum(chunk_lengths)
+
+        if total_len == 0:
+            self.set_num_vertices(0)
+        elif self.vbo is not None and chunk_versions is not None \
+                and self.chunk_versions is not None and self.chunk_lengths == chunk_lengths:
+            self.write_changed_chunks(data_list, chunk_versions)
+        else:
+            self.write_all_data(data_list, total_len)
+
+        self.chunk_lengths = chunk_lengths
+        self.chunk_versions = chunk_versions
+
+    def write_all_data(self, data_list: Sequence[np.ndarray], total_len: int):
         # If possible, read concatenated data into existing list
         if len(self.vert_data) != total_len:
-            self.vert_data = np.concatenate(data_list)
+            self.vert_data = concatenate_records(data_list)
         else:
-            np.concatenate(data_list, out=self.vert_data)
+            concatenate_records(data_list, out=self.vert_data)
 
-        # Either create new vbo, or read data into it
+        # The buffer only ever grows, so that changes in the number of
+        # points, e.g. during animations, don't require a new vbo and vaos
         total_size = self.vert_data.itemsize * total_len
-        if self.vbo is not None and self.vbo.size != total_size:
+        if self.vbo is not None and self.vbo.size < total_size:
+            new_size = max(total_size, 2 * self.vbo.size)
             self.release()  # This sets vbo to be None
+        else:
+            new_size = total_size
         if self.vbo is None:
-            self.vbo = self.ctx.buffer(self.vert_data)
+            self.vbo = self.ctx.buffer(reserve=new_size)
+            add_count("vbos_allocated")
             self.generate_vaos()
-        else:
-            self.vbo.write(self.vert_data)
+        self.vbo.write(self.vert_data)
+        add_count("bytes_uploaded", self.vert_data.nbytes)
+        self.set_num_vertices(total_len)
+
+    def write_changed_chunks(
+        self,
+        data_list: Sequence[np.ndarray],
+        chunk_versions: Sequence[int],
+    ):
+        """
+        Writes the arrays whose versions differ from those last read in
+        into vert_data, and uploads each contiguous run of them to the vbo
+        """
+        itemsize = self.vert_data.itemsize
+        run_start = None
+        start = 0
+        for data, version, prev_version in zip(data_list, chunk_versions, self.chunk_versions):
+            end = start + len(data)
+            if version != prev_version:
+                # Copied as raw bytes, which skips numpy's slow field
+                # by field assignment for structured dtypes
+                self.vert_data[start:end].view(np.uint8)[:] = np.ascontiguousarray(data).view(np.uint8)
+                if run_start is None:
+                    run_start = start
+            elif run_start is not None:
+                self.vbo.write(self.vert_data[run_start:start], offset=run_start * itemsize)
+                add_count("bytes_uploaded", (start - run_start) * itemsize)
+                run_start = None
+            start = end
+        if run_start is not None:
+            self.vbo.write(self.vert_data[run_start:start], offset=run_start * itemsize)
+            add_count("bytes_uploaded", (start - run_start) * itemsize)
+
+    def read_in_shared_buffer(self, vbo: moderngl.Buffer, first_vertex: int, num_vertices: int):
+        """
+        Draws num_vertices vertices from vbo, starting at first_vertex,
+        rather than data of its own. The vbo belongs to whatever wrote to
+        it, e.g. a PointCloudStore, so it's never released from here.
+        """
+        if self.vbo is not vbo:
+            self.release()
+            self.vbo = vbo
+            self.owns_vbo = False
+            self.generate_vaos()
+        self.first_vertex = first_vertex
+        self.set_num_vertices(num_vertices)
+
+    def set_num_vertices(self, num_vertices: int):
+        self.num_vertices = num_vertices
+        for vao in self.vaos:
+            vao.vertices = num_vertices
 
     def generate_vaos(self):
         # Vertex array object
         self.vaos = [
             self.ctx.vertex_array(
                 program=program,
-                content=[(self.vbo, self.vert_format, *self.vert_attributes)],
+                content=self.get_vao_content(self.vert_format, self.vert_attributes),
                 mode=self.render_primitive,
             )
             for program in self.programs
@@ -188,12 +356,12 @@ class ShaderWrapper(object):
     def pre_render(self):
         self.set_ctx_depth_test(self.depth_test)
         self.set_ctx_clip_plane(self.use_clip_plane())
-        for tid, texture in enumerate(self.textures):
+        for tid, texture in enumerate(self.get_textures()):
             texture.use(tid)
 
     def render(self):
         for vao in self.vaos:
-            vao.render()
+            vao.render(first=self.first_vertex)
 
     def update_program_uniforms(self, camera_uniforms: UniformDict):
         for program in self.programs:
@@ -203,16 +371,24 @@ class ShaderWrapper(object):
                 for name, value in uniforms.items():
                     set_program_uniform(program, name, value)
 
+    def release_vaos(self):
+        for vao in self.vaos:
+            vao.release()
+        self.vaos = []
+
     def release(self):
-        for obj in (self.vbo, *self.vaos):
+        self.release_vaos()
+        vbo = self.vbo if self.owns_vbo else None
+        for obj in (vbo, self.instance_vbo):
             if obj is not None:
                 obj.release()
         self.init_vertex_objects()
 
     def release_textures(self):
+        # Those from files belong to the texture cache
         for texture in self.textures:
-            texture.release()
-            del texture
+            if texture is not None:
+                texture.release()
         self.textures = []
         self.texture_names_to_ids = dict()
 
@@ -305,31 +481,30 @@ class VShaderWrapper(ShaderWrapper):
         self.fill_depth_vert_attributes = ['point', 'base_normal']
 
     def init_vertex_objects(self):
-        self.vbo = None
+        super().init_vertex_objects()
         self.stroke_vao = None
         self.fill_vao = None
         self.fill_border_vao = None
-        self.vaos = []
 
     def generate_vaos(self):
         self.stroke_vao = self.ctx.vertex_array(
             program=self.stroke_program,
-            content=[(self.vbo, self.stroke_vert_format, *self.stroke_vert_attributes)],
+            content=self.get_vao_content(self.stroke_vert_format, self.stroke_vert_attributes),
             mode=self.render_primitive,
         )
         self.fill_vao = self.ctx.vertex_array(
             program=self.fill_program,
-            content=[(self.vbo, self.fill_vert_format, *self.fill_vert_attributes)],
+            content=self.get_vao_content(self.fill_vert_format, self.fill_vert_attributes),
             mode=self.render_primitive,
         )
         self.fill_border_vao = self.ctx.vertex_array(
             program=self.fill_border_program,
-            content=[(self.vbo, self.fill_border_vert_format, *self.fill_border_vert_attributes)],
+            content=self.get_vao_content(self.fill_border_vert_format, self.fill_border_vert_attributes),
             mode=self.render_primitive,
         )
         self.fill_depth_vao = self.ctx.vertex_array(
             program=self.fill_depth_program,
-            content=[(self.vbo, self.fill_depth_vert_format, *self.fill_depth_vert_attributes)],
+            content=self.get_vao_content(self.fill_depth_vert_format, self.fill_depth_vert_attributes),
             mode=self.render_primitive,
         )
         self.vaos = [self.stroke_vao, self.fill_vao, self.fill_border_vao, self.fill_depth_vao]
@@ -461,6 +636,7 @@ class VShaderWrapper(ShaderWrapper):
             vertex_shader=simple_vert,
             fragment_shader=alpha_adjust_frag,
         )
+        add_count("shader_programs_compiled")
 
         verts = np.array([[0, 0], [0, 1], [1, 0], [1, 1]])
         simple_vbo = ctx.buffer(verts.astype('f4').tobytes())
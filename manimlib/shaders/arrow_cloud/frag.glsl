@@ -0,0 +1,12 @@
+#version 330
+
+in vec4 color;
+in vec3 edge_dists;
+
+out vec4 frag_color;
+
+void main() {
+    frag_color = color;
+    float dist = min(edge_dists.x, min(edge_dists.y, edge_dists.z));
+    frag_color.a *= smoothstep(-0.5, 0.5, dist);
+}
@@ -0,0 +1,101 @@
+#version 330
+
+layout (points) in;
+layout (triangle_strip, max_vertices = 7) out;
+
+uniform float anti_alias_width;
+uniform float pixel_size;
+uniform float frame_scale;
+
+in vec3 v_start[1];
+in vec3 v_end[1];
+in float v_stroke_width[1];
+in float v_tip_width[1];
+in float v_tip_length[1];
+in vec4 v_rgba[1];
+
+out vec4 color;
+// Signed distances to the antialiased edges, as a ratio
+// of the antialias width, positive on the inside
+out vec3 edge_dists;
+
+const float STROKE_WIDTH_CONVERSION = 0.01;
+// Stands in for the distance to edges which aren't antialiased
+const float FAR = 1e4;
+
+#INSERT emit_gl_Position.glsl
+#INSERT finalize_color.glsl
+
+
+void emit_corner(vec3 point, vec3 dists){
+    edge_dists = dists;
+    emit_gl_Position(point);
+    EmitVertex();
+}
+
+
+void main(){
+    vec3 vect = v_end[0] - v_start[0];
+    float arrow_length = length(vect);
+    if (arrow_length == 0.0 || v_rgba[0].a == 0.0) return;
+    vec3 unit_vect = vect / arrow_length;
+
+    // Arrows are drawn in the plane containing them which faces the camera
+    vec3 to_cam = bool(is_fixed_in_frame) ? vec3(0.0, 0.0, 1.0) : normalize(camera_position - v_start[0]);
+    vec3 perp = cross(to_cam, unit_vect);
+    if (length(perp) < 1e-6) return;
+    perp = normalize(perp);
+
+    // Arrows shorter than their tip are scaled down as a whole
+    float shrink = min(arrow_length / max(v_tip_length[0], 1e-8), 1.0);
+    float tip_length = shrink * v_tip_length[0];
+    float width_factor = shrink * STROKE_WIDTH_CONVERSION * frame_scale;
+    float half_width = 0.5 * width_factor * v_stroke_width[0];
+    float half_tip_width = 0.5 * width_factor * v_tip_width[0];
+    float aaw = max(anti_alias_width * pixel_size, 1e-8);
+    // Edges are pushed out by this much, to leave room for antialiasing
+    float buff = 0.5 * aaw;
+
+    color = finalize_color(v_rgba[0], v_start[0], to_cam);
+
+    vec3 tip_base = v_end[0] - tip_length * unit_vect;
+
+    // Shaft, antialiased along its sides and start
+    if (arrow_length > tip_length && half_width > 0.0){
+        vec3 ends[2] = vec3[2](v_start[0] - buff * unit_vect, tip_base);
+        for (int i = 0; i < 2; i++){
+            for (int sign = 1; sign >= -1; sign -= 2){
+                vec3 corner = ends[i] + sign * (half_width + buff) * perp;
+                vec3 diff = corner - v_start[0];
+                emit_corner(corner, vec3(
+                    dot(diff, unit_vect),
+                    half_width - dot(diff, perp),
+                    half_width + dot(diff, perp)
+                ) / aaw);
+            }
+        }
+        EndPrimitive();
+    }
+
+    // Tip, antialiased along its two slanted sides
+    if (tip_length > 0.0 && half_tip_width > 0.0){
+        float slant = length(vec2(tip_length, half_tip_width));
+        vec3 left = tip_base + half_tip_width * perp;
+        vec3 right = tip_base - half_tip_width * perp;
+        vec3 left_normal = -(half_tip_width * unit_vect + tip_length * perp) / slant;
+        vec3 right_normal = (-half_tip_width * unit_vect + tip_length * perp) / slant;
+        vec3 corners[3] = vec3[3](
+            tip_base + (half_tip_width + buff * slant / tip_length) * perp,
+            tip_base - (half_tip_width + buff * slant / tip_length) * perp,
+            v_end[0] + (buff * slant / half_tip_width) * unit_vect
+        );
+        for (int i = 0; i < 3; i++){
+            emit_corner(corners[i], vec3(
+                FAR,
+                dot(corners[i] - left, left_normal) / aaw,
+                dot(corners[i] - right, right_normal) / aaw
+            ));
+        }
+        EndPrimitive();
+    }
+}
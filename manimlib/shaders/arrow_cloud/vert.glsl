@@ -0,0 +1,25 @@
+#version 330
+
+in vec3 point;
+in vec3 end;
+in float stroke_width;
+in float tip_width;
+in float tip_length;
+in vec4 rgba;
+
+out vec3 v_start;
+out vec3 v_end;
+out float v_stroke_width;
+out float v_tip_width;
+out float v_tip_length;
+out vec4 v_rgba;
+
+
+void main(){
+    v_start = point;
+    v_end = end;
+    v_stroke_width = stroke_width;
+    v_tip_width = tip_width;
+    v_tip_length = tip_length;
+    v_rgba = rgba;
+}
@@ -2,11 +2,15 @@
 
 in vec3 point;
 in vec3 base_normal;
+// Only set when drawing many translated copies of one mobject at once
+in vec3 instance_shift;
 
 out vec3 verts;
 out vec3 v_base_point;
 
 void main(){
-    verts = point;
-    v_base_point = base_normal;
+    verts = point + instance_shift;
+    // Only the first vertex of each triangle holds a base point,
+    // which is the only one read by the geometry shader
+    v_base_point = base_normal + instance_shift;
 }
\ No newline at end of file
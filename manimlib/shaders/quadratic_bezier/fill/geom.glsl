@@ -6,6 +6,7 @@ layout (triangle_strip, max_vertices = 6) out;
 in vec3 verts[3];
 in vec4 v_color[3];
 in vec3 v_base_normal[3];
+in vec3 v_instance_shift[3];
 
 out vec4 color;
 out float fill_all;
@@ -50,7 +51,7 @@ void main(){
     // Check zero fill
     if (vec3(v_color[0].a, v_color[1].a, v_color[2].a) == vec3(0.0, 0.0, 0.0)) return;
 
-    vec3 base_point = v_base_normal[0];
+    vec3 base_point = v_base_normal[0] + v_instance_shift[0];
     vec3 unit_normal = v_base_normal[1];
     // Emit main triangle
     fill_all = 1.0;
@@ -3,13 +3,17 @@
 in vec3 point;
 in vec4 fill_rgba;
 in vec3 base_normal;
+// Only set when drawing many translated copies of one mobject at once
+in vec3 instance_shift;
 
 out vec3 verts;  // Bezier control point
 out vec4 v_color;
 out vec3 v_base_normal;
+out vec3 v_instance_shift;
 
 void main(){
-    verts = point;
+    verts = point + instance_shift;
     v_color = fill_rgba;
     v_base_normal = base_normal;
+    v_instance_shift = instance_shift;
 }
\ No newline at end of file
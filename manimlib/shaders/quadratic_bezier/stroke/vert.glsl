@@ -9,6 +9,8 @@ in vec4 stroke_rgba;
 in float stroke_width;
 in float joint_angle;
 in vec3 unit_normal;
+// Only set when drawing many translated copies of one mobject at once
+in vec3 instance_shift;
 
 // Bezier control point
 out vec3 verts;
@@ -21,7 +23,7 @@ out vec3 v_unit_normal;
 const float STROKE_WIDTH_CONVERSION = 0.01;
 
 void main(){
-    verts = point;
+    verts = point + instance_shift;
     v_color = stroke_rgba;
     v_stroke_width = STROKE_WIDTH_CONVERSION * stroke_width * mix(frame_scale, 1, scale_stroke_with_zoom);
     v_joint_angle = joint_angle;
@@ -91,6 +91,76 @@ def partial_quadratic_bezier_points(
     return [h0, h1, h2]
 
 
+def subdivide_quadratic_bezier_points(
+    points: Vect3Array,
+    pieces_per_curve: np.ndarray,
+) -> Vect3Array:
+    """
+    points describe a chain of quadratic bezier curves, sharing anchors,
+    as in VMobject. Splits the nth curve into pieces_per_curve[n] equal
+    parts, in parameter space, returning the points of the new chain.
+
+    This is the same as calling partial_quadratic_bezier_points for each
+    piece, but done for all pieces at once.
+    """
+    a0, h, a1 = points[0:-1:2], points[1::2], points[2::2]
+    pieces_per_curve = np.asarray(pieces_per_curve, dtype=int)
+    curve_indices = np.repeat(np.arange(len(h)), pieces_per_curve)
+    piece_starts = np.cumsum(pieces_per_curve) - pieces_per_curve
+    piece_indices = np.arange(len(curve_indices)) - piece_starts[curve_indices]
+    n_pieces = pieces_per_curve[curve_indices]
+    t0 = (piece_indices / n_pieces)[:, np.newaxis]
+    t1 = ((piece_indices + 1) / n_pieces)[:, np.newaxis]
+
+    p0, p1, p2 = a0[curve_indices], h[curve_indices], a1[curve_indices]
+
+    def curve(t):
+        return p0 * (1 - t) * (1 - t) + 2 * p1 * t * (1 - t) + p2 * t * t
+
+    # Handle of the portion from t0 to the end, scaled back to end at t1
+    h0 = curve(t0)
+    h1_prime = (1 - t0) * p1 + t0 * p2
+    end_prop = (t1 - t0) / (1 - t0)
+    new_points = np.empty((2 * len(curve_indices) + 1, points.shape[1]))
+    new_points[0] = points[0]
+    new_points[1::2] = (1 - end_prop) * h0 + end_prop * h1_prime
+    new_points[2::2] = curve(t1)
+    return new_points
+
+
+def quadratic_bezier_points_at(
+    points: Vect3Array,
+    curve_indices: np.ndarray,
+    t: np.ndarray,
+) -> Vect3Array:
+    """
+    points describe a chain of quadratic bezier curves, sharing anchors,
+    as in VMobject. Returns the point at parameter t[i] along the curve
+    with index curve_indices[i], for each i.
+    """
+    i0 = 2 * np.asarray(curve_indices, dtype=int)
+    t = np.asarray(t)[:, np.newaxis]
+    p0, p1, p2 = points[i0], points[i0 + 1], points[i0 + 2]
+    return p0 * (1 - t) * (1 - t) + 2 * p1 * t * (1 - t) + p2 * t * t
+
+
+def quadratic_bezier_parameter(values: Sequence[float], target: float) -> float:
+    """
+    For a one dimensional quadratic bezier curve with control values
+    (v0, v1, v2), where target lies between v0 and v2, returns the first
+    parameter t in [0, 1] at which the curve reaches target
+    """
+    v0, v1, v2 = values
+    if v0 == target:
+        return 0.0
+    roots = np.roots([v0 - 2 * v1 + v2, 2 * (v1 - v0), v0 - target])
+    ts = [r.real for r in roots if abs(r.imag) < 1e-9 and -1e-9 <= r.real <= 1 + 1e-9]
+    if not ts:
+        # Only possible through rounding, when target is at an end
+        return 0.0 if abs(target - v0) < abs(target - v2) else 1.0
+    return float(np.clip(min(ts), 0, 1))
+
+
 # Linear interpolation variants
 
 
@@ -7,6 +7,7 @@ from functools import wraps
 
 from manimlib.utils.directories import get_cache_dir
 from manimlib.utils.simple_functions import hash_string
+from manimlib.utils.tracing import add_count
 
 from typing import TYPE_CHECKING
 
@@ -26,6 +27,8 @@ def cache_on_disk(func: Callable[..., T]) -> Callable[..., T]:
         if value is None:
             value = func(*args, **kwargs)
             _cache.set(key, value)
+        else:
+            add_count("disk_cache_hits")
         return value
     return wrapper
 
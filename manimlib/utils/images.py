@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from functools import lru_cache
+
 import numpy as np
 from PIL import Image
 
@@ -10,7 +12,7 @@ from manimlib.utils.file_ops import find_file
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from typing import Iterable
+    from typing import Iterable, Optional
 
 
 def get_full_raster_image_path(image_file_name: str) -> str:
@@ -29,6 +31,28 @@ def get_full_vector_image_path(image_file_name: str) -> str:
     )
 
 
+def load_image(path: str, max_size: Optional[int] = None) -> Image.Image:
+    """
+    Reads an image as RGBA, shrinking it, with its aspect ratio kept, if
+    either side is longer than max_size pixels
+    """
+    image = Image.open(path).convert("RGBA")
+    if max_size is not None and max(image.size) > max_size:
+        image.thumbnail((max_size, max_size), Image.LANCZOS)
+    return image
+
+
+def get_image_size(path: str) -> tuple[int, int]:
+    # Opening an image only reads its header, the pixels are read on demand
+    with Image.open(path) as image:
+        return image.size
+
+
+@lru_cache(maxsize=8)
+def get_image_pixels(path: str) -> Image.Image:
+    return load_image(path)
+
+
 def invert_image(image: Iterable) -> Image.Image:
     arr = np.array(image)
     arr = (255 * np.ones(arr.shape)).astype(arr.dtype) - arr
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import heapq
+
 from colour import Color
 
 import numpy as np
@@ -135,6 +137,42 @@ def make_even(
     )
 
 
+def apportion(weights: np.ndarray, n: int) -> np.ndarray:
+    """
+    Splits n items among slots in proportion to weights, returning how
+    many each gets. This matches repeatedly giving one item to the slot
+    with the largest weight / (items so far + 1), lowest index first in
+    a tie, but finds most of the split in closed form, leaving fewer
+    items than twice the number of slots to be handed out one at a time.
+    """
+    weights = np.asarray(weights, dtype=float)
+    result = np.zeros(len(weights), dtype=int)
+    total = weights.sum()
+    if n <= 0 or len(weights) == 0:
+        return result
+    if total <= 0:
+        result[0] = n
+        return result
+    # The exact share, rounded down, never gives a slot more than the
+    # step by step process would, and one less leaves room for rounding
+    # error in computing it
+    result[:] = np.maximum(np.floor(n * weights / total) - 1, 0)
+    # Each slot's value is scaled by k / (k + 1) one item at a time, as in
+    # the step by step process, so that which of two equal values comes
+    # out larger is decided by the same rounding
+    values = weights.copy()
+    for k in range(1, result.max() + 1):
+        values[result >= k] *= k / (k + 1)
+    heap = [(-values[i], i) for i in np.flatnonzero(weights > 0)]
+    heapq.heapify(heap)
+    for _ in range(n - result.sum()):
+        value, index = heapq.heappop(heap)
+        result[index] += 1
+        values[index] *= result[index] / (result[index] + 1)
+        heapq.heappush(heap, (-values[index], index))
+    return result
+
+
 def arrays_match(arr1: np.ndarray, arr2: np.ndarray) -> bool:
     return arr1.shape == arr2.shape and (arr1 == arr2).all()
 
@@ -143,6 +181,23 @@ def array_is_constant(arr: np.ndarray) -> bool:
     return len(arr) > 0 and (arr == arr[0]).all()
 
 
+def concatenate_records(
+    arrays: Sequence[np.ndarray],
+    out: np.ndarray | None = None
+) -> np.ndarray:
+    """
+    Equivalent to np.concatenate for 1d arrays sharing one structured
+    dtype, but skips numpy's dtype promotion for each array, which is
+    slow for structured dtypes, by joining raw bytes instead
+    """
+    dtype = arrays[0].dtype
+    byte_arrays = [np.ascontiguousarray(arr).view(np.uint8) for arr in arrays]
+    if out is None:
+        return np.concatenate(byte_arrays).view(dtype)
+    np.concatenate(byte_arrays, out=out.view(np.uint8))
+    return out
+
+
 def cartesian_product(*arrays: np.ndarray):
     """
     Copied from https://stackoverflow.com/a/11146645
@@ -2,13 +2,16 @@ from __future__ import annotations
 
 import os
 import re
+from collections import OrderedDict
 from functools import lru_cache
 import moderngl
-from PIL import Image
 import numpy as np
 
+from manimlib.config import manim_config
 from manimlib.utils.directories import get_shader_dir
 from manimlib.utils.file_ops import find_file
+from manimlib.utils.images import load_image
+from manimlib.utils.tracing import add_count
 
 from typing import TYPE_CHECKING
 
@@ -20,23 +23,131 @@ if TYPE_CHECKING:
 PROGRAM_UNIFORM_MIRRORS: dict[int, dict[str, float | tuple]] = dict()
 
 
-@lru_cache()
-def image_path_to_texture(path: str, ctx: moderngl.Context) -> moderngl.Texture:
-    im = Image.open(path).convert("RGBA")
-    return ctx.texture(
-        size=im.size,
-        components=len(im.getbands()),
-        data=im.tobytes(),
-    )
+class TextureCache(object):
+    """
+    Keeps the textures made from image files, up to a budget of max_bytes
+    of GPU memory. Past that, the textures drawn least recently are
+    released, to be loaded again from their files if they're needed.
+
+    Textures can be limited to max_size pixels on their longer side, and
+    have mipmaps, so that they look smooth when drawn smaller than that.
+
+    If a single frame draws more than fits in the budget, textures will be
+    loaded again every frame, so it should be set with room for that.
+    """
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self.entries: OrderedDict[tuple, tuple[moderngl.Texture, int]] = OrderedDict()
+
+    def get(
+        self,
+        ctx: moderngl.Context,
+        path: str,
+        max_size: Optional[int] = None,
+        keep: Sequence[tuple] = (),
+    ) -> moderngl.Texture:
+        """
+        Neither this texture, nor those with keys in keep, are released
+        to make room for it
+        """
+        key = (ctx, path, max_size)
+        if key in self.entries:
+            self.entries.move_to_end(key)
+            return self.entries[key][0]
+
+        image = load_image(path, max_size)
+        texture = ctx.texture(size=image.size, components=4, data=image.tobytes())
+        texture.build_mipmaps()
+        texture.filter = (moderngl.LINEAR_MIPMAP_LINEAR, moderngl.LINEAR)
+        # Mipmaps take up another third on top of the full size image
+        nbytes = 4 * image.size[0] * image.size[1] * 4 // 3
+        add_count("textures_loaded")
+        add_count("bytes_uploaded", nbytes)
+
+        self.entries[key] = (texture, nbytes)
+        self.total_bytes += nbytes
+        self.evict(keep=(key, *keep))
+        return texture
+
+    def get_all(
+        self,
+        ctx: moderngl.Context,
+        paths: Sequence[str],
+        max_size: Optional[int] = None
+    ) -> list[moderngl.Texture]:
+        """
+        Textures for several files needed at once, none of which is
+        released to make room for another
+        """
+        keys = [(ctx, path, max_size) for path in paths]
+        return [self.get(ctx, path, max_size, keep=keys) for path in paths]
+
+    def evict(self, keep: Sequence[tuple] = ()) -> None:
+        for key in list(self.entries):
+            if self.total_bytes <= self.max_bytes:
+                break
+            if key in keep:
+                continue
+            texture, nbytes = self.entries.pop(key)
+            texture.release()
+            self.total_bytes -= nbytes
+            add_count("textures_evicted")
+
+    def clear(self) -> None:
+        for texture, nbytes in self.entries.values():
+            texture.release()
+        self.entries.clear()
+        self.total_bytes = 0
+
+
+TEXTURE_CACHE = TextureCache(
+    max_bytes=int(manim_config.textures.cache_size_mb * 1024 * 1024)
+)
+
+
+def image_path_to_texture(
+    path: str,
+    ctx: moderngl.Context,
+    max_size: Optional[int] = None
+) -> moderngl.Texture:
+    """
+    The returned texture is only sure to stay valid until the next one is
+    asked for, as the cache may release it to stay within its budget
+    """
+    return TEXTURE_CACHE.get(ctx, path, max_size)
+
+
+def image_paths_to_textures(
+    paths: Sequence[str],
+    ctx: moderngl.Context,
+    max_size: Optional[int] = None
+) -> list[moderngl.Texture]:
+    """
+    Like image_path_to_texture, for textures which are drawn together,
+    so that loading one can't release another
+    """
+    return TEXTURE_CACHE.get_all(ctx, paths, max_size)
 
 
-@lru_cache()
 def get_shader_program(
         ctx: moderngl.context.Context,
         vertex_shader: str,
         fragment_shader: Optional[str] = None,
         geometry_shader: Optional[str] = None,
 ) -> moderngl.Program:
+    add_count("shader_program_lookups")
+    return compile_shader_program(ctx, vertex_shader, fragment_shader, geometry_shader)
+
+
+@lru_cache()
+def compile_shader_program(
+        ctx: moderngl.context.Context,
+        vertex_shader: str,
+        fragment_shader: Optional[str] = None,
+        geometry_shader: Optional[str] = None,
+) -> moderngl.Program:
+    add_count("shader_programs_compiled")
     return ctx.program(
         vertex_shader=vertex_shader,
         fragment_shader=fragment_shader,
@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import tempfile
+import weakref
+
+import numpy as np
+
+from manimlib.utils.directories import get_temp_dir
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Optional
+    from manimlib.mobject.mobject import Mobject
+    from manimlib.typing import UniformDict
+
+
+def hash_array(array: np.ndarray) -> str:
+    """
+    Content hash of an array, taking its dtype and shape into account,
+    so that two arrays share a key exactly when they hold the same data
+    """
+    array = np.ascontiguousarray(array)
+    hasher = hashlib.blake2b(digest_size=16)
+    hasher.update(str((array.dtype.descr, array.shape)).encode())
+    hasher.update(array.view(np.uint8))
+    return hasher.hexdigest()
+
+
+class ArrayStore(object):
+    """
+    Content-addressed, deduplicated storage for numpy arrays.
+
+    Arrays are keyed by hash_array, so storing the same data twice costs
+    a hash and a dictionary lookup. The store only holds weak references;
+    an array lives for as long as some snapshot refers to it.
+
+    If spill_threshold is set, then once the arrays held in memory exceed
+    that many bytes, new arrays are written to a memory-mapped file instead.
+    Space in that file is not reclaimed until the store is closed.
+    """
+    def __init__(
+        self,
+        spill_threshold: Optional[int] = None,
+        spill_directory: Optional[str] = None,
+    ):
+        self.spill_threshold = spill_threshold
+        self.spill_directory = spill_directory
+        self.arrays: weakref.WeakValueDictionary[str, np.ndarray] = weakref.WeakValueDictionary()
+        self.memory_bytes: int = 0
+        self.spill_file_path: Optional[str] = None
+        self.spill_file_size: int = 0
+
+    def __del__(self):
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self.arrays)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.arrays
+
+    def add(self, array: np.ndarray) -> tuple[str, np.ndarray]:
+        """
+        Returns the key for this array, together with the stored,
+        read-only version of it which callers should hold on to
+        """
+        key = hash_array(array)
+        stored = self.arrays.get(key)
+        if stored is None:
+            stored = self.store(array)
+            self.arrays[key] = stored
+        return key, stored
+
+    def get(self, key: str) -> np.ndarray:
+        return self.arrays[key]
+
+    def store(self, array: np.ndarray) -> np.ndarray:
+        if self.should_spill(array):
+            return self.spill(array)
+        result = np.array(array)
+        result.flags.writeable = False
+        self.memory_bytes += result.nbytes
+        weakref.finalize(result, self.note_released, result.nbytes)
+        return result
+
+    def note_released(self, n_bytes: int) -> None:
+        self.memory_bytes -= n_bytes
+
+    def should_spill(self, array: np.ndarray) -> bool:
+        if self.spill_threshold is None or array.size == 0:
+            return False
+        return self.memory_bytes + array.nbytes > self.spill_threshold
+
+    def spill(self, array: np.ndarray) -> np.ndarray:
+        if self.spill_file_path is None:
+            directory = self.spill_directory or get_temp_dir()
+            fd, self.spill_file_path = tempfile.mkstemp(
+                suffix=".snapshot", dir=directory
+            )
+            os.close(fd)
+        offset = self.spill_file_size
+        with open(self.spill_file_path, "ab") as fp:
+            fp.write(np.ascontiguousarray(array).tobytes())
+        self.spill_file_size += array.nbytes
+        return np.memmap(
+            self.spill_file_path,
+            dtype=array.dtype,
+            mode="r",
+            offset=offset,
+            shape=array.shape,
+        )
+
+    def close(self) -> None:
+        path = getattr(self, "spill_file_path", None)
+        if path is None:
+            return
+        self.arrays = weakref.WeakValueDictionary()
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+        self.spill_file_path = None
+        self.spill_file_size = 0
+
+
+def get_uniforms_key(uniforms: UniformDict) -> tuple:
+    return tuple(
+        (name, tuple(np.ravel(value)))
+        for name, value in sorted(uniforms.items())
+    )
+
+
+class MobjectSnapshot(object):
+    """
+    Records the state of a mobject and its family, with the point data
+    of each member held in an ArrayStore.
+
+    Rather than copying the mobject, this keeps references to the actual
+    family members and their submobject lists, so restoring writes the
+    recorded data back into those same objects with set_data.
+    """
+    def __init__(self, mobject: Mobject, store: ArrayStore):
+        self.mobject = mobject
+        self.member_states = []
+        key_parts = []
+        for mob in mobject.get_family():
+            data_key, data = store.add(mob.data)
+            uniforms = {
+                name: value.copy() if isinstance(value, np.ndarray) else value
+                for name, value in mob.uniforms.items()
+            }
+            render_state = (mob.z_index, mob.depth_test, mob.shader_folder)
+            self.member_states.append((mob, list(mob.submobjects), data, uniforms, render_state))
+            key_parts.append((
+                id(mob),
+                tuple(map(id, mob.submobjects)),
+                data_key,
+                get_uniforms_key(uniforms),
+                render_state,
+            ))
+        self.key = tuple(key_parts)
+
+    def __eq__(self, snapshot: MobjectSnapshot) -> bool:
+        return isinstance(snapshot, MobjectSnapshot) and self.key == snapshot.key
+
+    def __hash__(self) -> int:
+        return hash(self.key)
+
+    def matches(self, mobject: Mobject, store: ArrayStore) -> bool:
+        return self == MobjectSnapshot(mobject, store)
+
+    def restore(self) -> Mobject:
+        for mob, submobjects, data, uniforms, render_state in self.member_states:
+            mob.set_submobjects(submobjects)
+            mob.set_data(data)
+            mob.set_uniforms(uniforms)
+            z_index, depth_test, shader_folder = render_state
+            mob.z_index = z_index
+            mob.depth_test = depth_test
+            if mob.shader_folder != shader_folder:
+                mob.shader_folder = shader_folder
+                mob.shader_wrapper = None
+        self.mobject.refresh_bounding_box(recurse_down=True)
+        self.mobject.refresh_shader_wrapper_id()
+        return self.mobject
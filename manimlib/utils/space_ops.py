@@ -1,14 +1,12 @@
 from __future__ import annotations
 
-from functools import reduce
+from collections import OrderedDict
+import hashlib
 import math
-import operator as op
-import platform
 
 from mapbox_earcut import triangulate_float32 as earcut
 import numpy as np
 from scipy.spatial.transform import Rotation
-from tqdm.auto import tqdm as ProgressDisplay
 
 from manimlib.constants import DOWN, OUT, RIGHT, UP
 from manimlib.constants import PI, TAU
@@ -419,90 +417,189 @@ def norm_squared(v: VectN | List[float]) -> float:
     return sum(x * x for x in v)
 
 
+# Triangulations of recently seen outlines, keyed by hash_rings
+EARCLIP_CACHE: OrderedDict[str, np.ndarray] = OrderedDict()
+EARCLIP_CACHE_SIZE = 256
+# Bounds the size of the intermediate arrays used to nest rings
+RING_NESTING_CHUNK_SIZE = 2**20
+
+
+def hash_rings(verts: Vect2Array, ring_ends: np.ndarray) -> str:
+    hasher = hashlib.blake2b(digest_size=16)
+    hasher.update(np.ascontiguousarray(verts, dtype=np.float64).view(np.uint8))
+    hasher.update(np.ascontiguousarray(ring_ends, dtype=np.int64).view(np.uint8))
+    return hasher.hexdigest()
+
+
+def get_winding_numbers_of_points_in_rings(
+    verts: Vect2Array,
+    starts: np.ndarray,
+    lengths: np.ndarray,
+    points: Vect2Array,
+    ring_ids: np.ndarray,
+) -> np.ndarray:
+    """
+    For each point in points, the number of times the ring of verts
+    with the corresponding index in ring_ids winds around it, where ring
+    i runs from starts[i] to starts[i] + lengths[i], and is closed.
+
+    Unlike get_winding_number, this counts signed crossings of a ray going
+    right from each point, so all pairs are handled in one batch.
+    """
+    n_edges = lengths[ring_ids]
+    owner = np.repeat(np.arange(len(ring_ids)), n_edges)
+    local = np.arange(n_edges.sum()) - np.repeat(np.cumsum(n_edges) - n_edges, n_edges)
+    first = starts[ring_ids][owner]
+    v0 = verts[first + local]
+    v1 = verts[first + (local + 1) % n_edges[owner]]
+    p = points[owner]
+
+    is_left = cross2d(v1 - v0, p - v0)
+    upward = (v0[:, 1] <= p[:, 1]) & (p[:, 1] < v1[:, 1]) & (is_left > 0)
+    downward = (v1[:, 1] <= p[:, 1]) & (p[:, 1] < v0[:, 1]) & (is_left < 0)
+    crossings = upward.astype(int) - downward.astype(int)
+    return np.bincount(owner, weights=crossings, minlength=len(ring_ids)).astype(int)
+
+
+def get_ring_parents(
+    verts: Vect2Array,
+    starts: np.ndarray,
+    lengths: np.ndarray,
+    rank: np.ndarray,
+) -> np.ndarray:
+    """
+    For each ring, the index of the ring directly containing it, or -1.
+
+    Rings can only be contained in those of lower rank, and if several
+    contain it, the one of highest rank is taken to be its parent.
+    """
+    n_rings = len(starts)
+    left = np.minimum.reduceat(verts[:, 0], starts)
+    right = np.maximum.reduceat(verts[:, 0], starts)
+    bottom = np.minimum.reduceat(verts[:, 1], starts)
+    top = np.maximum.reduceat(verts[:, 1], starts)
+
+    # Candidate containers for a ring are those whose bounding boxes hold
+    # its own, which, sweeping over rings sorted by their left edges, can
+    # only come from earlier in that order
+    order = np.argsort(left, kind="stable")
+    sorted_left = left[order]
+    chunk_size = max(RING_NESTING_CHUNK_SIZE // n_rings, 1)
+    inner_list = []
+    outer_list = []
+    for i in range(0, n_rings, chunk_size):
+        a = order[i:i + chunk_size]
+        b = order[:np.searchsorted(sorted_left, sorted_left[i:i + chunk_size][-1], side="right")]
+        A = a[:, np.newaxis]
+        contains = (rank[b] < rank[A]) \
+            & (left[b] <= left[A]) & (right[A] <= right[b]) \
+            & (bottom[b] <= bottom[A]) & (top[A] <= top[b])
+        a_index, b_index = np.nonzero(contains)
+        inner_list.append(a[a_index])
+        outer_list.append(b[b_index])
+    inner = np.hstack([np.zeros(0, dtype=int), *inner_list])
+    outer = np.hstack([np.zeros(0, dtype=int), *outer_list])
+
+    # Of those, keep the ones containing the first point of the inner ring,
+    # in batches with a bounded total number of edges
+    is_in = np.zeros(len(inner), dtype=bool)
+    edge_counts = np.cumsum(lengths[outer])
+    i = 0
+    while i < len(inner):
+        j = max(np.searchsorted(edge_counts, edge_counts[i] + RING_NESTING_CHUNK_SIZE), i + 1)
+        winding = get_winding_numbers_of_points_in_rings(
+            verts, starts, lengths, verts[starts[inner[i:j]]], outer[i:j]
+        )
+        is_in[i:j] = abs(winding) == 1
+        i = j
+
+    parent_rank = np.full(n_rings, -1)
+    np.maximum.at(parent_rank, inner[is_in], rank[outer[is_in]])
+    parents = np.full(n_rings, -1)
+    has_parent = parent_rank >= 0
+    parents[has_parent] = np.argsort(rank)[parent_rank[has_parent]]
+    return parents
+
+
 # TODO, fails for polygons drawn over themselves
-def earclip_triangulation(verts: Vect3Array | Vect2Array, ring_ends: list[int]) -> list[int]:
+def earclip_triangulation(verts: Vect3Array | Vect2Array, ring_ends: list[int]) -> np.ndarray:
     """
-    Returns a list of indices giving a triangulation
+    Returns an array of indices giving a triangulation
     of a polygon, potentially with holes
 
     - verts is a numpy array of points
 
     - ring_ends is a list of indices indicating where
     the ends of new paths are
-    """
 
-    rings = [
-        list(range(e0, e1))
-        for e0, e1 in zip([0, *ring_ends], ring_ends)
-    ]
+    Results for the most recently seen outlines are cached
+    """
+    verts = np.array(verts[:, :2], dtype=np.float64)
+    ring_ends = np.array(ring_ends, dtype=int)
+    key = hash_rings(verts, ring_ends)
+    if key in EARCLIP_CACHE:
+        EARCLIP_CACHE.move_to_end(key)
+        return EARCLIP_CACHE[key]
+
+    starts = np.array([0, *ring_ends[:-1]], dtype=int)
+    lengths = ring_ends - starts
+    starts = starts[lengths > 0]
+    lengths = lengths[lengths > 0]
+    if len(starts) == 0:
+        return np.zeros(0, dtype=int)
     epsilon = 1e-6
 
-    def is_in(point, ring_id):
-        return abs(abs(get_winding_number([i - point for i in verts[rings[ring_id]]])) - 1) < epsilon
-
-    def ring_area(ring_id):
-        ring = rings[ring_id]
-        s = 0
-        for i, j in zip(ring[1:], ring):
-            s += cross2d(verts[i], verts[j])
-        return abs(s) / 2
-
     # Points at the same position may cause problems
-    for i in rings:
-        if len(i) < 2:
-            continue
-        verts[i[0]] += (verts[i[1]] - verts[i[0]]) * epsilon
-        verts[i[-1]] += (verts[i[-2]] - verts[i[-1]]) * epsilon
-
-    # First, we should know which rings are directly contained in it for each ring
-
-    right = [max(verts[rings[i], 0]) for i in range(len(rings))]
-    left = [min(verts[rings[i], 0]) for i in range(len(rings))]
-    top = [max(verts[rings[i], 1]) for i in range(len(rings))]
-    bottom = [min(verts[rings[i], 1]) for i in range(len(rings))]
-    area = [ring_area(i) for i in range(len(rings))]
+    long = lengths >= 2
+    s, e = starts[long], starts[long] + lengths[long] - 1
+    verts[s], verts[e] = (
+        verts[s] + (verts[s + 1] - verts[s]) * epsilon,
+        verts[e] + (verts[e - 1] - verts[e]) * epsilon,
+    )
 
     # The larger ring must be outside
-    rings_sorted = list(range(len(rings)))
-    rings_sorted.sort(key=lambda x: area[x], reverse=True)
-
-    def is_in_fast(ring_a, ring_b):
-        # Whether a is in b
-        return reduce(op.and_, (
-            left[ring_b] <= left[ring_a] <= right[ring_a] <= right[ring_b],
-            bottom[ring_b] <= bottom[ring_a] <= top[ring_a] <= top[ring_b],
-            is_in(verts[rings[ring_a][0]], ring_b)
-        ))
-
-    chilren = [[] for i in rings]
-    ringenum = ProgressDisplay(
-        enumerate(rings_sorted),
-        total=len(rings),
-        leave=False,
-        ascii=True if platform.system() == 'Windows' else None,
-        dynamic_ncols=True,
-        desc="SVG Triangulation",
-        delay=3,
-    )
-    for idx, i in ringenum:
-        for j in rings_sorted[:idx][::-1]:
-            if is_in_fast(i, j):
-                chilren[j].append(i)
-                break
+    next_vert = np.arange(1, len(verts) + 1)
+    next_vert[starts + lengths - 1] = starts
+    areas = abs(np.add.reduceat(cross2d(verts, verts[next_vert]), starts)) / 2
+    rings_sorted = np.argsort(-areas, kind="stable")
+    rank = np.argsort(rings_sorted)
 
-    res = []
+    # First, we should know which rings are directly contained in it for each ring
+    parents = get_ring_parents(verts, starts, lengths, rank)
+
+    # Rings at an even depth are filled, with those directly inside them as
+    # holes, while any nested further in start new fills of their own
+    depth = np.zeros(len(starts), dtype=int)
+    ancestors = parents.copy()
+    while (ancestors >= 0).any():
+        has_ancestor = ancestors >= 0
+        depth[has_ancestor] += 1
+        ancestors[has_ancestor] = parents[ancestors[has_ancestor]]
+    is_outer = depth % 2 == 0
+    group_rank = np.where(is_outer, rank, rank[parents])
+    ring_order = np.lexsort([rank, ~is_outer, group_rank])
+
+    # Indices of the vertices of each ring in that order, all in one array
+    ordered_lengths = lengths[ring_order]
+    ordered_ends = np.cumsum(ordered_lengths)
+    vert_order = np.arange(ordered_ends[-1]) + np.repeat(
+        starts[ring_order] - ordered_ends + ordered_lengths,
+        ordered_lengths
+    )
 
     # Then, we can use earcut for each part
-    used = [False] * len(rings)
-    for i in rings_sorted:
-        if used[i]:
-            continue
-        v = rings[i]
-        ring_ends = [len(v)]
-        for j in chilren[i]:
-            used[j] = True
-            v += rings[j]
-            ring_ends.append(len(v))
-        res += [v[i] for i in earcut(verts[v, :2], ring_ends)]
-
-    return res
+    group_starts = np.flatnonzero(is_outer[ring_order])
+    group_ends = [*group_starts[1:], len(ring_order)]
+    res = []
+    for g0, g1 in zip(group_starts, group_ends):
+        v0 = ordered_ends[g0] - ordered_lengths[g0]
+        v = vert_order[v0:ordered_ends[g1 - 1]]
+        group_ring_ends = (ordered_ends[g0:g1] - v0).astype(np.uint32)
+        res.append(v[earcut(verts[v], group_ring_ends)])
+    result = np.hstack([np.zeros(0, dtype=int), *res])
+
+    EARCLIP_CACHE[key] = result
+    result.setflags(write=False)
+    if len(EARCLIP_CACHE) > EARCLIP_CACHE_SIZE:
+        EARCLIP_CACHE.popitem(last=False)
+    return result
@@ -14,6 +14,7 @@ from manimlib.config import manim_config
 from manimlib.config import get_manim_dir
 from manimlib.logger import log
 from manimlib.utils.simple_functions import hash_string
+from manimlib.utils.tracing import traced
 
 
 def get_tex_template_config(template_name: str) -> dict[str, str]:
@@ -82,6 +83,7 @@ def latex_to_svg(
 
 
 @cache_on_disk
+@traced("tex_compile")
 def full_tex_to_svg(full_tex: str, compiler: str = "latex", message: str = ""):
     if message:
         print(message, end="\r")
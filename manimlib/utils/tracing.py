@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+import atexit
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from contextlib import nullcontext
+from functools import wraps
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Callable, ContextManager, Iterator, Optional, TypeVar
+
+    T = TypeVar("T")
+
+
+# When this environment variable names a file, timing spans for the
+# expensive stages of a render are collected, and written to that file
+# as Chrome trace events (https://ui.perfetto.dev can open it) on exit.
+# Timestamps come from the system-wide monotonic clock, so a process
+# which launched manimgl can merge these spans with its own.
+TRACE_FILE_ENV_VAR = "MANIMGL_TRACE_FILE"
+
+_trace_file = os.environ.get(TRACE_FILE_ENV_VAR)
+_events: list[dict] = []
+
+
+class FrameProfiler(object):
+    """
+    Accumulates the time spent in each traced stage, along with counts
+    of events like buffer uploads and shader compiles, separately for
+    each section of a scene, where sections are typically animations.
+
+    Stages nest, e.g. shader_data and draw happen within frame_render,
+    so their times should not be added together.
+    """
+    # Spans in this category, like construct, enclose many sections
+    # rather than being a stage within one
+    ignored_category = "scene"
+
+    def __init__(self):
+        self.section_names: list[str] = []
+        self.section_wall_times: dict[str, float] = defaultdict(float)
+        self.stage_times: dict[str, dict[str, float]] = defaultdict(lambda: defaultdict(float))
+        self.stage_calls: dict[str, dict[str, int]] = defaultdict(lambda: defaultdict(int))
+        self.counts: dict[str, dict[str, int]] = defaultdict(lambda: defaultdict(int))
+        self.section = ""
+        self.section_start = time.perf_counter()
+        self.set_section("setup")
+
+    def set_section(self, name: str) -> None:
+        now = time.perf_counter()
+        if self.section:
+            self.section_wall_times[self.section] += now - self.section_start
+        if name not in self.section_wall_times:
+            self.section_names.append(name)
+            self.section_wall_times[name] = 0.0
+        self.section = name
+        self.section_start = now
+
+    def add_time(self, stage: str, seconds: float) -> None:
+        self.stage_times[self.section][stage] += seconds
+        self.stage_calls[self.section][stage] += 1
+
+    def add_count(self, name: str, amount: int = 1) -> None:
+        self.counts[self.section][name] += amount
+
+    def finish(self) -> None:
+        self.set_section(self.section)
+
+    def get_totals(self) -> tuple[dict[str, float], dict[str, int], dict[str, int]]:
+        times = defaultdict(float)
+        calls = defaultdict(int)
+        counts = defaultdict(int)
+        for section in self.section_names:
+            for stage, value in self.stage_times[section].items():
+                times[stage] += value
+                calls[stage] += self.stage_calls[section][stage]
+            for name, value in self.counts[section].items():
+                counts[name] += value
+        return times, calls, counts
+
+    def to_dict(self) -> dict:
+        return dict(
+            sections=[
+                dict(
+                    name=section,
+                    wall_seconds=self.section_wall_times[section],
+                    stages={
+                        stage: dict(seconds=seconds, calls=self.stage_calls[section][stage])
+                        for stage, seconds in self.stage_times[section].items()
+                    },
+                    counts=dict(self.counts[section]),
+                )
+                for section in self.section_names
+            ],
+        )
+
+    def get_report(self, max_sections: int = 10) -> str:
+        times, calls, counts = self.get_totals()
+        total_wall = sum(self.section_wall_times.values())
+        lines = [f"Profile: {total_wall:.3f}s in {len(self.section_names)} sections"]
+        lines.append(f"  {'stage':<24}{'total (s)':>12}{'calls':>10}{'mean (ms)':>12}")
+        for stage, seconds in sorted(times.items(), key=lambda item: -item[1]):
+            n_calls = calls[stage]
+            lines.append(f"  {stage:<24}{seconds:>12.3f}{n_calls:>10}{1000 * seconds / n_calls:>12.3f}")
+        if counts:
+            lines.append(f"  {'counter':<24}{'total':>12}")
+            for name, value in sorted(counts.items()):
+                lines.append(f"  {name:<24}{value:>12,}")
+        slowest = sorted(self.section_names, key=lambda s: -self.section_wall_times[s])
+        lines.append("Slowest sections:")
+        for section in slowest[:max_sections]:
+            frames = self.counts[section].get("frames", 0)
+            lines.append(f"  {self.section_wall_times[section]:>8.3f}s {frames:>6} frames  {section}")
+        return "\n".join(lines)
+
+
+_profiler: Optional[FrameProfiler] = None
+
+
+def start_profiling() -> FrameProfiler:
+    global _profiler
+    _profiler = FrameProfiler()
+    return _profiler
+
+
+def stop_profiling() -> Optional[FrameProfiler]:
+    global _profiler
+    profiler = _profiler
+    if profiler is not None:
+        profiler.finish()
+    _profiler = None
+    return profiler
+
+
+def set_profile_section(name: str) -> None:
+    if _profiler is not None:
+        _profiler.set_section(name)
+
+
+def add_count(name: str, amount: int = 1) -> None:
+    """
+    Adds to a named counter of the active profiler, if any
+    """
+    if _profiler is not None:
+        _profiler.add_count(name, amount)
+
+
+def is_tracing() -> bool:
+    return _trace_file is not None or _profiler is not None
+
+
+@contextmanager
+def _span(name: str, category: str, args: dict) -> Iterator[None]:
+    start = time.monotonic_ns()
+    try:
+        yield
+    finally:
+        end = time.monotonic_ns()
+        if _trace_file is not None:
+            _events.append(dict(
+                name=name,
+                cat=category,
+                ph="X",
+                ts=start / 1000,
+                dur=(end - start) / 1000,
+                pid=os.getpid(),
+                tid=threading.get_ident(),
+                args=args,
+            ))
+        if _profiler is not None and category != FrameProfiler.ignored_category:
+            _profiler.add_time(name, (end - start) / 1e9)
+
+
+def trace_span(name: str, category: str = "manimgl", **args) -> ContextManager:
+    """
+    Time the enclosed block as a span named name, if tracing or profiling is on
+    """
+    if _trace_file is None and _profiler is None:
+        return nullcontext()
+    return _span(name, category, args)
+
+
+def traced(name: str, category: str = "manimgl") -> Callable[[Callable[..., T]], Callable[..., T]]:
+    """
+    Decorator timing each call of a function as a span
+    """
+    def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with trace_span(name, category):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def write_trace() -> None:
+    if _trace_file is None or not _events:
+        return
+    with open(_trace_file, "w") as fp:
+        json.dump(_events, fp)
+
+
+atexit.register(write_trace)
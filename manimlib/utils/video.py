@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import queue
+import re
+import subprocess
+import threading
+from dataclasses import dataclass
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Optional
+
+
+@dataclass
+class VideoInfo:
+    width: int
+    height: int
+    fps: float
+    duration: float  # In seconds, or 0 if ffmpeg doesn't report it
+
+
+def probe_video(path: str, ffmpeg_bin: str = "ffmpeg") -> VideoInfo:
+    """
+    Reads the size, frame rate and duration of a video from the stream
+    summary which ffmpeg prints when given an input and no output
+    """
+    proc = subprocess.run(
+        [ffmpeg_bin, "-hide_banner", "-i", str(path)],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    video_line = next((
+        line for line in proc.stderr.split("\n")
+        if "Stream #" in line and "Video:" in line
+    ), None)
+    size_match = video_line and re.search(r"[ ,](\d{2,5})x(\d{2,5})[ ,]", video_line)
+    if not size_match:
+        raise ValueError(f"Could not find a video stream in {path}:\n{proc.stderr}")
+    fps_match = re.search(r"([\d.]+) (?:fps|tbr)", video_line)
+    duration_match = re.search(r"Duration: (\d+):(\d+):([\d.]+)", proc.stderr)
+    duration = 0.0
+    if duration_match:
+        hours, minutes, seconds = duration_match.groups()
+        duration = 3600 * int(hours) + 60 * int(minutes) + float(seconds)
+    return VideoInfo(
+        width=int(size_match.group(1)),
+        height=int(size_match.group(2)),
+        fps=float(fps_match.group(1)) if fps_match else 30.0,
+        duration=duration,
+    )
+
+
+class VideoDecoder(object):
+    """
+    Decodes the frames of a video to raw RGBA on a background thread,
+    reading from an ffmpeg pipe into a small ring of reusable buffers, so
+    memory use is bounded by n_buffers frames however long the video is.
+
+    The decoder waits whenever all buffers are full, and get_frame hands
+    buffers the caller has moved past back to it.
+    """
+    def __init__(
+        self,
+        path: str,
+        size: tuple[int, int],
+        start_time: float = 0.0,
+        loop: bool = False,
+        n_buffers: int = 4,
+        ffmpeg_bin: str = "ffmpeg",
+    ):
+        if n_buffers < 2:
+            raise ValueError("VideoDecoder needs at least 2 buffers")
+        self.size = size
+        self.frame_nbytes = 4 * size[0] * size[1]
+        self.free_buffers: queue.Queue[Optional[bytearray]] = queue.Queue()
+        self.decoded: queue.Queue[Optional[tuple[int, bytearray]]] = queue.Queue()
+        for _ in range(n_buffers):
+            self.free_buffers.put(bytearray(self.frame_nbytes))
+
+        self.current: Optional[tuple[int, bytearray]] = None
+        self.finished = False
+        self.closed = False
+
+        command = [ffmpeg_bin, "-loglevel", "error", "-nostdin"]
+        if loop:
+            command += ["-stream_loop", "-1"]
+        if start_time > 0:
+            command += ["-ss", str(start_time)]
+        command += [
+            "-i", str(path),
+            "-f", "rawvideo",
+            "-pix_fmt", "rgba",
+            "-s", f"{size[0]}x{size[1]}",
+            "-",
+        ]
+        self.process = subprocess.Popen(
+            command,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            bufsize=self.frame_nbytes,
+        )
+        self.thread = threading.Thread(target=self.decode_frames, daemon=True)
+        self.thread.start()
+
+    def decode_frames(self) -> None:
+        stdout = self.process.stdout
+        index = 0
+        while True:
+            buffer = self.free_buffers.get()
+            if buffer is None or self.closed:
+                break
+            view = memoryview(buffer)
+            n_read = 0
+            while n_read < self.frame_nbytes:
+                chunk = stdout.readinto(view[n_read:])
+                if not chunk:
+                    break
+                n_read += chunk
+            if n_read < self.frame_nbytes:
+                break
+            self.decoded.put((index, buffer))
+            index += 1
+        # Marks the end of the video
+        self.decoded.put(None)
+
+    def get_frame(self, index: int) -> Optional[bytearray]:
+        """
+        Returns the buffer holding frame number index, counted from the
+        start time, or the last frame if the video ends before then. This
+        waits for the decoder if it hasn't reached that frame yet.
+
+        The buffer stays valid until the next call asking for a later frame.
+        """
+        while not self.finished and (self.current is None or self.current[0] < index):
+            item = self.decoded.get()
+            if item is None:
+                self.finished = True
+                self.process.wait()
+                break
+            if self.current is not None:
+                self.free_buffers.put(self.current[1])
+            self.current = item
+        return self.current[1] if self.current is not None else None
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        self.closed = True
+        self.process.kill()
+        self.process.wait()
+        # Wake the decoding thread, if it's waiting for a buffer
+        self.free_buffers.put(None)
+        self.thread.join()
+
+    def __del__(self):
+        if not self.closed and self.process.poll() is None:
+            self.process.kill()
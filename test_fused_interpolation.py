@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""Test suite checking the fused animations against interpolating one submobject at a time."""
+
+import sys
+from unittest import mock
+
+import numpy as np
+import pytest
+
+with mock.patch.object(sys, "argv", ["manimgl"]):
+    manimlib = pytest.importorskip("manimlib")
+
+
+# Overriding interpolate_submobject keeps these on the per-submobject path
+class UnfusedDrawBorderThenFill(manimlib.DrawBorderThenFill):
+    def interpolate_submobject(self, *args):
+        super().interpolate_submobject(*args)
+
+
+class UnfusedWrite(manimlib.Write):
+    def interpolate_submobject(self, *args):
+        super().interpolate_submobject(*args)
+
+
+class UnfusedTransform(manimlib.Transform):
+    def interpolate_submobject(self, *args):
+        super().interpolate_submobject(*args)
+
+
+class UnfusedShowCreation(manimlib.ShowCreation):
+    def interpolate_submobject(self, *args):
+        super().interpolate_submobject(*args)
+
+
+def make_shapes():
+    inner = manimlib.VGroup(
+        manimlib.Circle(radius=0.3),
+        manimlib.Square(0.5).rotate(0.3),
+    ).shift(manimlib.DOWN)
+    return manimlib.VGroup(
+        manimlib.Square(),
+        inner,
+        manimlib.Triangle().shift(manimlib.LEFT),
+        manimlib.RegularPolygon(7).shift(manimlib.UP),
+        manimlib.Arc(0, manimlib.PI),
+    ).set_fill(manimlib.BLUE, 0.5)
+
+
+def make_target():
+    return make_shapes().rotate(0.4).shift(manimlib.RIGHT).set_fill(manimlib.RED, 0.8)
+
+
+def shader_data_by_frame(anim_class, alphas, **kwargs):
+    mobject = make_shapes()
+    if issubclass(anim_class, manimlib.Transform):
+        anim = anim_class(mobject, make_target(), **kwargs)
+    else:
+        anim = anim_class(mobject, **kwargs)
+    anim.begin()
+    frames = []
+    for alpha in alphas:
+        anim.interpolate(alpha)
+        frames.append([sm.get_shader_data().copy() for sm in mobject.family_members_with_points()])
+    return anim, frames
+
+
+def assert_frames_match(alphas, fused, unfused):
+    for alpha, fused_frame, unfused_frame in zip(alphas, fused, unfused):
+        assert len(fused_frame) == len(unfused_frame)
+        for fused_data, unfused_data in zip(fused_frame, unfused_frame):
+            for key in fused_data.dtype.names:
+                np.testing.assert_allclose(
+                    fused_data[key], unfused_data[key], atol=1e-5,
+                    err_msg=f"{key} at alpha={alpha}",
+                )
+
+
+@pytest.mark.parametrize("fused_class, unfused_class", [
+    (manimlib.DrawBorderThenFill, UnfusedDrawBorderThenFill),
+    (manimlib.Write, UnfusedWrite),
+])
+@pytest.mark.parametrize("lag_ratio", [0.05, 0.3, 0.8])
+def test_fused_creation_matches_unfused(fused_class, unfused_class, lag_ratio):
+    alphas = np.linspace(0, 1, 13)
+    fused_anim, fused = shader_data_by_frame(fused_class, alphas, lag_ratio=lag_ratio)
+    unfused_anim, unfused = shader_data_by_frame(unfused_class, alphas, lag_ratio=lag_ratio)
+    assert fused_anim.fused_partial is not None
+    assert unfused_anim.fused_partial is None
+    assert_frames_match(alphas, fused, unfused)
+
+
+@pytest.mark.parametrize("lag_ratio", [0, 0.3, 1.0])
+def test_fused_show_creation_matches_unfused(lag_ratio):
+    alphas = np.linspace(0, 1, 13)
+    fused_anim, fused = shader_data_by_frame(manimlib.ShowCreation, alphas, lag_ratio=lag_ratio)
+    unfused_anim, unfused = shader_data_by_frame(UnfusedShowCreation, alphas, lag_ratio=lag_ratio)
+    assert fused_anim.fused is not None
+    assert unfused_anim.fused is None
+    assert_frames_match(alphas, fused, unfused)
+
+
+@pytest.mark.parametrize("kwargs", [
+    dict(),
+    dict(lag_ratio=0.3),
+    dict(lag_ratio=0.8),
+    dict(path_arc=manimlib.PI / 2),
+    dict(path_arc=manimlib.PI / 2, lag_ratio=0.3),
+])
+def test_fused_transform_matches_unfused(kwargs):
+    alphas = np.linspace(0, 1, 13)
+    fused_anim, fused = shader_data_by_frame(manimlib.Transform, alphas, **kwargs)
+    unfused_anim, unfused = shader_data_by_frame(UnfusedTransform, alphas, **kwargs)
+    assert fused_anim.fused is not None
+    assert unfused_anim.fused is None
+    assert_frames_match(alphas, fused, unfused)
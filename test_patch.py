@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""Test suite for applying the fixer's SEARCH/REPLACE edits."""
+
+import pytest
+
+from text_to_video import llm
+from text_to_video.patch import PatchError, apply_patch
+
+
+SCENE = """from manimlib import *
+
+class GeneratedScene(Scene):
+    def construct(self):
+        title = Text("Derivatives", font_size=60)
+        self.play(Create(title))
+        self.wait(1)
+        dot = Dot()
+        self.play(FadeIn(dot))
+        self.wait(1)
+"""
+
+
+def edit(search: str, replace: str) -> str:
+    return f"<<<<<<< SEARCH\n{search}=======\n{replace}>>>>>>> REPLACE\n"
+
+
+# Responses, and a line the patched scene must contain
+APPLY_CASES = [
+    {
+        "name": "Exact one-line edit",
+        "response": edit("        self.play(Create(title))\n", "        self.play(Write(title))\n"),
+        "expected_line": "        self.play(Write(title))",
+    },
+    {
+        "name": "Edit with wrong indentation",
+        "response": edit("self.play(Create(title))\n", "self.play(Write(title))\n"),
+        "expected_line": "        self.play(Write(title))",
+    },
+    {
+        "name": "Multi-line edit with wrong indentation",
+        "response": edit("self.play(Create(title))\n", "self.play(ShowCreation(title))\nself.wait(2)\n"),
+        "expected_line": "        self.wait(2)",
+    },
+    {
+        "name": "Edit inside markdown fences",
+        "response": "```\n" + edit("        dot = Dot()\n", "        dot = Dot(color=YELLOW)\n") + "```",
+        "expected_line": "        dot = Dot(color=YELLOW)",
+    },
+    {
+        "name": "Several edits, applied in order",
+        "response": (
+            edit("        self.play(Create(title))\n", "        self.play(Write(title))\n")
+            + edit("        self.play(Write(title))\n        self.wait(1)\n", "        self.play(Write(title))\n        self.wait(2)\n")
+        ),
+        "expected_line": "        self.wait(2)",
+    },
+    {
+        "name": "Whole file instead of edits",
+        "response": SCENE.replace("Create", "ShowCreation"),
+        "expected_line": "        self.play(ShowCreation(title))",
+    },
+]
+
+# Responses which can't be applied, so the fixer must fall back
+FAILURE_CASES = [
+    {"name": "Search text missing", "response": edit("        self.play(Uncreate(title))\n", "")},
+    {"name": "Ambiguous search", "response": edit("        self.wait(1)\n", "        self.wait(2)\n")},
+    {"name": "Unterminated block", "response": "<<<<<<< SEARCH\n        dot = Dot()\n=======\n"},
+    {"name": "Prose only", "response": "Replace Create with ShowCreation."},
+]
+
+
+def test_apply_cases():
+    for case in APPLY_CASES:
+        response = llm._strip_fences(case["response"])
+        patched = apply_patch(SCENE, response)
+        assert case["expected_line"] in patched.split("\n"), case["name"]
+        compile(patched, case["name"], "exec")
+
+
+def test_failure_cases():
+    for case in FAILURE_CASES:
+        with pytest.raises(PatchError):
+            apply_patch(SCENE, case["response"])
+
+
+def fake_calls(monkeypatch, responses: list[str]) -> list[dict]:
+    calls = []
+
+    def _call(system, user, max_tokens=16000, purpose="general"):
+        calls.append(dict(system=system, user=user, max_tokens=max_tokens, purpose=purpose))
+        return responses.pop(0)
+
+    monkeypatch.setattr(llm, "_call", _call)
+    return calls
+
+
+def test_fix_applies_patch(monkeypatch):
+    calls = fake_calls(monkeypatch, [
+        edit("        self.play(Create(title))\n", "        self.play(Write(title))\n"),
+    ])
+    fixed = llm.fix_code(SCENE, "NameError: name 'Create' is not defined")
+    assert "Write(title)" in fixed
+    assert len(calls) == 1
+    assert calls[0]["max_tokens"] == llm.PATCH_MAX_TOKENS
+    assert "SEARCH/REPLACE" in calls[0]["system"]
+
+
+def test_fix_falls_back_to_whole_file(monkeypatch):
+    whole_file = SCENE.replace("Create", "ShowCreation")
+    calls = fake_calls(monkeypatch, [
+        edit("        self.play(Uncreate(title))\n", ""),
+        whole_file,
+    ])
+    fixed = llm.fix_code(SCENE, "NameError: name 'Create' is not defined")
+    assert fixed == whole_file.strip()
+    assert len(calls) == 2
+    assert "SEARCH/REPLACE" not in calls[1]["system"]
+
+
+def test_fix_rejects_patch_breaking_syntax(monkeypatch):
+    calls = fake_calls(monkeypatch, [
+        edit("        self.play(Create(title))\n", "        self.play(Write(title)\n"),
+        SCENE.replace("Create", "Write"),
+    ])
+    fixed = llm.fix_code(SCENE, "NameError: name 'Create' is not defined")
+    assert "self.play(Write(title))" in fixed
+    assert len(calls) == 2
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""Test suite for token-budgeted prompt assembly."""
+
+from text_to_video.metrics import VideoMetrics
+from text_to_video.prompt import ENHANCED_PROMPT, FIX_CODE_PROMPT
+from text_to_video.prompt_builder import (
+    _load_module,
+    build_enhanced_fix_prompt,
+    build_fix_prompt,
+    count_tokens,
+    select_reference,
+    trim_reference,
+)
+
+
+TRACKER_CODE = """from manimlib import *
+
+class GeneratedScene(Scene):
+    def construct(self):
+        x = ValueTracker(0)
+        label = DecimalNumber(0)
+        label.add_updater(lambda m: m.set_value(x.get_value()))
+        self.add(label)
+        self.play(x.animate.set_value(3))
+"""
+
+AXES_CODE = """from manimlib import *
+
+class GeneratedScene(Scene):
+    def construct(self):
+        axes = Axes(x_range=(-3, 3, 1), y_range=(-1, 9, 2))
+        graph = axes.get_graph(lambda x: x**2, color=BLUE)
+        self.play(ShowCreation(axes), ShowCreation(graph))
+"""
+
+# Code, and a heading the reference kept for it must (or must not) include
+SELECTION_CASES = [
+    {"code": TRACKER_CODE, "included": "## Updaters & ValueTracker", "excluded": "## Coordinate Systems"},
+    {"code": AXES_CODE, "included": "## Coordinate Systems", "excluded": "## Updaters & ValueTracker"},
+]
+
+
+def test_reference_selection():
+    for case in SELECTION_CASES:
+        reference = trim_reference(case["code"], budget=2000, modules=["reference/api_full.md"])
+        assert case["included"] in reference, case
+        assert case["excluded"] not in reference, case
+
+
+def test_reference_budget():
+    for budget in [0, 100, 500, 2000]:
+        sections = select_reference(AXES_CODE, budget)
+        assert sum(s.tokens for s in sections) <= budget
+
+
+def test_enhanced_fix_prompt_budget():
+    full_tokens = count_tokens(ENHANCED_PROMPT + "\n\n" + FIX_CODE_PROMPT)
+    for budget in [3000, 6000]:
+        prompt = build_enhanced_fix_prompt(ENHANCED_PROMPT, AXES_CODE, budget)
+        assert count_tokens(prompt) <= budget < full_tokens
+        assert "HARD RULES" in prompt
+        assert "get_graph" in prompt
+
+
+def test_fix_prompt_without_code_is_unchanged():
+    assert build_fix_prompt() == FIX_CODE_PROMPT
+    trimmed = build_fix_prompt(code=TRACKER_CODE)
+    assert count_tokens(trimmed) < count_tokens(FIX_CODE_PROMPT)
+
+
+def test_modules_are_read_once():
+    assert _load_module("core/hard_rules.md") is _load_module("core/hard_rules.md")
+
+
+def test_savings_reported():
+    metrics = VideoMetrics(video_id="test", description="", pipeline="single_pass", tier="standard")
+    metrics.add_prompt_trim(full_tokens=19000, sent_tokens=5000)
+    metrics.add_prompt_trim(full_tokens=19000, sent_tokens=4000)
+    assert metrics.trimmed_prompts == 2
+    assert metrics.prompt_tokens_saved == 29000
+    assert "Prompt tokens saved: 29,000" in metrics.summary()
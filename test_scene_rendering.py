@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""Test suite for drawing a scene's mobjects through its render groups."""
+
+import shutil
+import subprocess
+import sys
+from unittest import mock
+
+import numpy as np
+import pytest
+
+with mock.patch.object(sys, "argv", ["manimgl"]):
+    manimlib = pytest.importorskip("manimlib")
+
+from manimlib.config import manim_config
+
+
+def make_scene():
+    return manimlib.Scene(file_writer_config=dict(write_to_movie=False, save_last_frame=False))
+
+
+def render_scene(scene):
+    scene.update_frame(force_draw=True)
+    return np.array(scene.camera.get_image())
+
+
+def render_one_at_a_time(scene, *mobjects):
+    scene.camera.capture(*mobjects)
+    return np.array(scene.camera.get_image())
+
+
+def test_batches_keep_stroke_under_later_fill():
+    scene = make_scene()
+    circle = manimlib.Circle().set_stroke(manimlib.RED, 20)
+    square = manimlib.Square().set_fill(manimlib.BLUE, 1).set_stroke(width=0)
+    scene.add(circle, square)
+    np.testing.assert_array_equal(render_scene(scene), render_one_at_a_time(scene, circle, square))
+
+
+def test_draws_video(tmp_path):
+    ffmpeg_bin = manim_config.file_writer.ffmpeg_bin or "ffmpeg"
+    if shutil.which(ffmpeg_bin) is None:
+        pytest.skip("ffmpeg is not installed")
+    path = tmp_path / "clip.mp4"
+    subprocess.run([
+        ffmpeg_bin, "-loglevel", "error", "-f", "lavfi", "-i", "color=c=red:s=64x48:r=10:d=1",
+        "-pix_fmt", "yuv420p", str(path),
+    ], check=True)
+
+    scene = make_scene()
+    video = manimlib.VideoMobject(str(path))
+    scene.add(video)
+    try:
+        image = render_scene(scene)
+    finally:
+        video.close_decoder()
+    center = image[image.shape[0] // 2, image.shape[1] // 2]
+    assert center[0] > 200 and center[1] < 50
+
+
+def test_point_cloud_store_draws_from_shared_buffer():
+    scene = make_scene()
+    clouds = [
+        manimlib.DotCloud(np.random.default_rng(n).uniform(-3, 3, (50, 3)) * [1, 1, 0], color=color)
+        for n, color in enumerate([manimlib.RED, manimlib.BLUE, manimlib.GREEN])
+    ]
+    store = manimlib.PointCloudStore(*clouds)
+    scene.add(store)
+    image = render_scene(scene)
+
+    assert store.vbo is not None
+    group = next(group for group in scene.render_groups if store in group.submobjects)
+    assert all(shader_wrapper.vbo is store.vbo for shader_wrapper in group.shader_wrappers)
+    np.testing.assert_array_equal(image, render_one_at_a_time(scene, *(cloud.copy() for cloud in clouds)))
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""Test suite for the speculative single-pass pipeline, with the LLM and renderer faked."""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from text_to_video import cli
+from text_to_video.renderer import RenderResult
+from text_to_video.tracing import SubprocessCancelled, run_subprocess
+
+
+GOOD_CODE = "from manimlib import *\n# good\n"
+BAD_CODE = "from manimlib import *\n# bad\n"
+RENDER_FIX = "from manimlib import *\n# fixed render error\n"
+CHECKER_FIX = "from manimlib import *\n# fixed checker feedback\n"
+
+
+class FakeRenderer:
+    """Renders "bad" code as a failure, after render_seconds, honouring cancel."""
+
+    def __init__(self, tmp_path: Path, render_seconds: float):
+        self.tmp_path = tmp_path
+        self.render_seconds = render_seconds
+        self.rendered = []
+        self.cancelled = []
+
+    def write_scene(self, code: str, attempt: int) -> Path:
+        scene_file = self.tmp_path / f"scene_v{attempt}.py"
+        scene_file.write_text(code)
+        return scene_file
+
+    def render(self, scene_file: Path, draft: bool = False, cancel=None) -> RenderResult:
+        code = scene_file.read_text()
+        deadline = time.monotonic() + self.render_seconds
+        while time.monotonic() < deadline:
+            if cancel is not None and cancel.is_set():
+                self.cancelled.append(code)
+                raise SubprocessCancelled(["manimgl"])
+            time.sleep(0.01)
+        self.rendered.append(code)
+        if "bad" in code:
+            return RenderResult(success=False, video_path=None, error_msg="NameError: name 'Create' is not defined")
+        return RenderResult(success=True, video_path=scene_file.with_suffix(".mp4"), error_msg="")
+
+
+def fake_llm(monkeypatch, first_code: str, approvals: list[bool], check_seconds: float):
+    """Patch the LLM stages, returning the list of feedback sp_fix_code received."""
+    fix_feedback = []
+
+    def sp_check_code(code, plan):
+        time.sleep(check_seconds)
+        approved = approvals.pop(0)
+        return approved, "" if approved else "The title overlaps the graph."
+
+    def sp_fix_code(plan, code, feedback, patch=True):
+        fix_feedback.append(feedback)
+        return CHECKER_FIX
+
+    monkeypatch.setattr(cli, "sp_generate_plan", lambda description: "PLAN")
+    monkeypatch.setattr(cli, "sp_generate_code", lambda plan: first_code)
+    monkeypatch.setattr(cli, "sp_check_code", sp_check_code)
+    monkeypatch.setattr(cli, "sp_fix_code", sp_fix_code)
+    monkeypatch.setattr(cli, "fix_code", lambda code, error, **kwargs: RENDER_FIX)
+    return fix_feedback
+
+
+def run_pipeline(renderer):
+    return cli.speculative_single_pass_pipeline("a circle", renderer, validate_first=False)
+
+
+def test_approved_code_is_rendered_while_checking(tmp_path, monkeypatch):
+    fake_llm(monkeypatch, GOOD_CODE, approvals=[True], check_seconds=0.3)
+    renderer = FakeRenderer(tmp_path, render_seconds=0.3)
+
+    start = time.monotonic()
+    plan, code, speculation = run_pipeline(renderer)
+    elapsed = time.monotonic() - start
+
+    assert code == GOOD_CODE
+    assert speculation.result.success
+    assert speculation.fixed_code is None
+    # Checking and rendering overlapped, rather than taking 0.6s in sequence
+    assert elapsed < 0.5
+
+
+def test_rejected_code_render_is_cancelled(tmp_path, monkeypatch):
+    fix_feedback = fake_llm(monkeypatch, GOOD_CODE, approvals=[False, True], check_seconds=0.05)
+    renderer = FakeRenderer(tmp_path, render_seconds=2)
+
+    plan, code, speculation = run_pipeline(renderer)
+
+    assert renderer.cancelled == [GOOD_CODE]
+    assert code == CHECKER_FIX
+    assert renderer.rendered == [CHECKER_FIX]
+    assert fix_feedback == ["The title overlaps the graph."]
+
+
+def test_render_error_is_fixed_while_checking(tmp_path, monkeypatch):
+    fake_llm(monkeypatch, BAD_CODE, approvals=[True], check_seconds=0.3)
+    renderer = FakeRenderer(tmp_path, render_seconds=0.05)
+
+    plan, code, speculation = run_pipeline(renderer)
+
+    assert code == BAD_CODE
+    assert not speculation.result.success
+    assert speculation.fixed_code == RENDER_FIX
+
+
+def test_render_error_is_passed_to_checker_fix(tmp_path, monkeypatch):
+    fix_feedback = fake_llm(monkeypatch, BAD_CODE, approvals=[False, True], check_seconds=0.3)
+    renderer = FakeRenderer(tmp_path, render_seconds=0.05)
+
+    plan, code, speculation = run_pipeline(renderer)
+
+    # The speculative render fix is discarded, in favour of one fix for both
+    assert code == CHECKER_FIX
+    assert speculation.fixed_code is None
+    assert "NameError" in fix_feedback[0]
+
+
+def test_cancelled_subprocess_is_killed():
+    cancel = threading.Event()
+    threading.Timer(0.2, cancel.set).start()
+
+    start = time.monotonic()
+    with pytest.raises(SubprocessCancelled):
+        run_subprocess(
+            [sys.executable, "-c", "import time; time.sleep(10)"],
+            capture_output=True,
+            cancel=cancel,
+        )
+    assert time.monotonic() - start < 2
+
+
+def test_cancellable_subprocess_output():
+    proc = run_subprocess(
+        [sys.executable, "-c", "print('hello')"],
+        capture_output=True,
+        text=True,
+        cancel=threading.Event(),
+    )
+    assert proc.returncode == 0
+    assert proc.stdout.strip() == "hello"
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""Test suite for the static pre-render checks against the manimlib API."""
+
+from text_to_video.prompt_builder import classify_error
+from text_to_video.validator import check_static
+
+
+SCENE_TEMPLATE = """from manimlib import *
+
+class GeneratedScene(Scene):
+    def construct(self):
+{body}
+"""
+
+
+def make_scene(body: str) -> str:
+    return SCENE_TEMPLATE.format(body="\n".join(f"        {line}" for line in body.split("\n")))
+
+
+# Mistakes seen in generated scenes, with the error the static check should report
+STATIC_CASES = [
+    {
+        "name": "ManimCE animation name",
+        "code": make_scene("line = Line(LEFT, RIGHT)\nself.play(Create(line))"),
+        "expected_error": "NameError: name 'Create' is not defined",
+    },
+    {
+        "name": "Old manim class name",
+        "code": make_scene("label = TextMobject('hi')"),
+        "expected_error": "NameError: name 'TextMobject' is not defined",
+    },
+    {
+        "name": "ManimCE import",
+        "code": "from manim import *\n",
+        "expected_error": "ModuleNotFoundError: No module named 'manim'",
+    },
+    {
+        "name": "Unknown constructor kwarg",
+        "code": make_scene("circle = Circle(radious=2)"),
+        "expected_error": "Circle.__init__() got an unexpected keyword argument 'radious'",
+    },
+    {
+        "name": "Unknown animation kwarg",
+        "code": make_scene("dot = Dot()\nself.play(FadeIn(dot, direction=UP))"),
+        "expected_error": "FadeIn.__init__() got an unexpected keyword argument 'direction'",
+    },
+    {
+        "name": "Method from another class",
+        "code": make_scene("label = Text('hi')\nlabel.set_value(5)"),
+        "expected_error": "'Text' object has no attribute 'set_value'",
+    },
+    {
+        "name": "Syntax error",
+        "code": make_scene("self.play(FadeIn(Dot())"),
+        "expected_error": "SyntaxError",
+    },
+]
+
+# Valid code the static check must not complain about
+VALID_CASES = [
+    {
+        "name": "Common objects and animations",
+        "code": make_scene(
+            "axes = Axes((-3, 3), (-2, 2))\n"
+            "graph = axes.get_graph(lambda x: x**2, color=YELLOW)\n"
+            "circle = Circle(radius=2, color=BLUE, fill_opacity=0.5)\n"
+            "group = VGroup(circle, Square(side_length=1)).arrange(RIGHT, buff=1)\n"
+            "self.play(ShowCreation(graph), FadeIn(circle, shift=UP))\n"
+            "self.play(LaggedStartMap(FadeIn, group, shift=UP))\n"
+            "self.play(circle.animate.shift(LEFT), run_time=2)\n"
+            "self.wait()"
+        ),
+    },
+    {
+        "name": "Attribute set by the scene itself",
+        "code": make_scene("circle = Circle()\ncircle.tag = 'a'\nprint(circle.tag)"),
+    },
+    {
+        "name": "Helper functions and loops",
+        "code": make_scene(
+            "def make_dot(x):\n"
+            "    return Dot(x * RIGHT)\n"
+            "dots = VGroup(*(make_dot(i) for i in range(3)))\n"
+            "for dot in dots:\n"
+            "    dot.set_color(RED)"
+        ),
+    },
+]
+
+
+def test_static_errors():
+    """Each known mistake is reported, in a form the error classifier understands."""
+    for case in STATIC_CASES:
+        errors = check_static(case["code"])
+        report = "\n".join(errors)
+        print(f"{case['name']}: {errors}")
+        assert case["expected_error"] in report, case["name"]
+        assert classify_error(report, case["code"]) in ("api", "syntax"), case["name"]
+
+
+def test_valid_code():
+    """Valid scenes pass the static check."""
+    for case in VALID_CASES:
+        errors = check_static(case["code"])
+        print(f"{case['name']}: {errors}")
+        assert errors == [], case["name"]
+
+
+if __name__ == "__main__":
+    test_static_errors()
+    test_valid_code()
+    print("✅ All validator tests passed!")
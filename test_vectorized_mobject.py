@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""Test suite for the data VMobjects cache, checking it against computing it afresh."""
+
+import sys
+from unittest import mock
+
+import numpy as np
+import pytest
+
+with mock.patch.object(sys, "argv", ["manimgl"]):
+    manimlib = pytest.importorskip("manimlib")
+
+
+def assert_triangulation_is_current(vmobject):
+    np.testing.assert_array_equal(vmobject.get_triangulation(), vmobject.compute_triangulation())
+
+
+def test_triangulation_after_transform():
+    square = manimlib.Square().set_fill(manimlib.BLUE, 1)
+    pentagon = manimlib.RegularPolygon(5).shift(manimlib.RIGHT).set_fill(manimlib.RED, 1)
+    square.get_triangulation()
+
+    anim = manimlib.Transform(square, pentagon)
+    anim.begin()
+    for alpha in np.linspace(0, 1, 5):
+        anim.interpolate(alpha)
+        assert_triangulation_is_current(square)
+    anim.finish()
+    assert_triangulation_is_current(square)
+
+
+def test_triangulation_after_pointwise_become_partial():
+    circle = manimlib.Circle().set_fill(manimlib.BLUE, 1)
+    circle.get_triangulation()
+    circle.pointwise_become_partial(circle.copy(), 0, 0.3)
+    assert_triangulation_is_current(circle)
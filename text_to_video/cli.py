@@ -3,8 +3,12 @@
 import argparse
 import re
 import sys
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
+from typing import Optional
 
 from .llm import (
     fix_code,
@@ -18,8 +22,10 @@ from .llm import (
     set_metrics_tracker,
 )
 from .renderer import Renderer, RenderResult, REPO_ROOT
+from .validator import validate
 from .player import play_video
-from .metrics import MetricsCollector
+from .metrics import MetricsCollector, VideoMetrics
+from .tracing import SubprocessCancelled, set_tracer, span
 
 
 def parse_plan_into_acts(plan: str) -> list[dict]:
@@ -144,7 +150,7 @@ def multi_pass_pipeline(description: str, verbose: bool = False) -> tuple[str, s
     return plan, final_code
 
 
-def single_pass_pipeline(description: str, verbose: bool = False) -> tuple[str, str]:
+def single_pass_pipeline(description: str, verbose: bool = False, patch: bool = True) -> tuple[str, str]:
     """
     Single-pass pipeline: Planner → Coder ↔ Checker → final code.
     Flow: plan entire video → generate full scene → check/fix loop → return.
@@ -177,13 +183,158 @@ def single_pass_pipeline(description: str, verbose: bool = False) -> tuple[str,
 
         if check < max_checks:
             print("    Fixing code with feedback...")
-            code = sp_fix_code(plan, code, feedback)
+            code = sp_fix_code(plan, code, feedback, patch=patch)
             if verbose:
                 print(f"\n--- FIXED CODE ---\n{code}\n--- END FIXED CODE ---\n")
 
     return plan, code
 
 
+@dataclass
+class Speculation:
+    """The render of a pipeline's final code, made while the checker reviewed it."""
+    scene_file: Path
+    result: RenderResult
+    fixed_code: Optional[str] = None  # fix_code's answer to result's error, if asked
+
+
+def speculative_single_pass_pipeline(
+    description: str,
+    renderer: Renderer,
+    validate_first: bool = True,
+    draft: bool = True,
+    metrics: Optional[VideoMetrics] = None,
+    verbose: bool = False,
+    patch: bool = True,
+) -> tuple[str, str, Speculation]:
+    """
+    Single-pass pipeline which renders each version of the code while the
+    checker reviews it, instead of rendering only once checking is done.
+    Flow: plan → code → (check ∥ validate + render) → fix → ...
+
+    When the checker rejects the code, its render is moot, so it is killed
+    and the fix starts straight away. When the render fails first, fix_code
+    starts on the render error while the checker is still running; that fix
+    is kept if the checker approves, and discarded if the checker asks for
+    changes, in which case the checker's fix is also told the render error.
+    Returns: (plan, final_code, speculation for final_code)
+    """
+    print("  [1/3] Planning scene...")
+    plan = sp_generate_plan(description)
+    if verbose:
+        print(f"\n--- PLAN ---\n{plan}\n--- END PLAN ---\n")
+
+    print("  [2/3] Generating code from plan...")
+    code = sp_generate_code(plan)
+    if verbose:
+        print(f"\n--- CODE ---\n{code}\n--- END CODE ---\n")
+
+    max_checks = 2
+    pool = ThreadPoolExecutor(max_workers=3, thread_name_prefix="speculate")
+    try:
+        for check in range(1, max_checks + 1):
+            print(f"  [3/3] Checking and rendering code (round {check}/{max_checks})...")
+            scene_file = renderer.write_scene(code, 1)
+            cancel = threading.Event()
+            render_future = pool.submit(
+                validate_and_render, renderer, scene_file, 1,
+                validate_first, draft, metrics, cancel,
+            )
+            check_future = pool.submit(sp_check_code, code, plan)
+            if metrics:
+                metrics.speculative_renders += 1
+
+            fix_future = None
+            wait([render_future, check_future], return_when=FIRST_COMPLETED)
+            if render_future.done() and not check_future.done():
+                render_result = render_future.result()
+                if not render_result.success:
+                    print("    Fixing the render error while the checker runs...")
+                    fix_future = pool.submit(
+                        fix_code, code, render_result.error_msg, use_enhanced=True, patch=patch,
+                    )
+                    if metrics:
+                        metrics.speculative_fixes += 1
+
+            approved, feedback = check_future.result()
+            if approved:
+                print("    ✓ Code approved!")
+            else:
+                print(f"    ✗ Issues found:")
+                print(f"      {feedback[:300]}...")
+
+            if approved or check == max_checks:
+                render_result = render_future.result()
+                fixed_code = None
+                if fix_future is not None:
+                    fixed_code = fix_future.result()
+                    if metrics:
+                        metrics.speculative_fixes_used += 1
+                return plan, code, Speculation(scene_file, render_result, fixed_code)
+
+            # This code is about to be replaced, so stop rendering it, and
+            # pass on any render error to the checker's fix
+            cancel.set()
+            wait([render_future])
+            error = render_future.exception()
+            if isinstance(error, SubprocessCancelled):
+                print("    Cancelled the render of the rejected code")
+                if metrics:
+                    metrics.speculative_renders_cancelled += 1
+            elif error is not None:
+                raise error
+            elif not render_future.result().success:
+                feedback += f"\n\nTHE CODE ALSO FAILED TO RENDER:\n{render_future.result().error_msg}"
+            if fix_future is not None:
+                print("    Discarding the speculative fix for the render error")
+                fix_future.cancel()
+
+            print("    Fixing code with feedback...")
+            code = sp_fix_code(plan, code, feedback, patch=patch)
+            if verbose:
+                print(f"\n--- FIXED CODE ---\n{code}\n--- END FIXED CODE ---\n")
+    finally:
+        # A discarded LLM call can't be interrupted, so don't wait on it here
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def validate_and_render(
+    renderer: Renderer,
+    scene_file: Path,
+    attempt: int,
+    validate_first: bool = True,
+    draft: bool = True,
+    metrics: Optional[VideoMetrics] = None,
+    cancel: Optional[threading.Event] = None,
+) -> RenderResult:
+    """
+    Validate the scene file, then render it if it passed. A failed
+    validation comes back as a failed render, so its error reaches the fixer.
+    Setting cancel stops either step, raising SubprocessCancelled.
+    """
+    # Catch errors cheaply before committing to a full render
+    validation = None
+    if validate_first:
+        with span("validate", attempt=attempt):
+            validation = validate(scene_file, cancel=cancel)
+        if metrics:
+            metrics.add_validation(validation.success, validation.duration_seconds)
+
+    if validation and not validation.success:
+        print(f"  Validation failed ({validation.stage}). Error:\n{validation.error_msg[:500]}")
+        return RenderResult(success=False, video_path=None, error_msg=validation.error_msg)
+
+    if validation:
+        print(f"  Validated in {validation.duration_seconds:.1f}s")
+    with span("render", attempt=attempt, draft=draft) as render_span:
+        result = renderer.render(scene_file, draft=draft, cancel=cancel)
+    if metrics:
+        metrics.render_duration_seconds += render_span.duration_seconds
+    if not result.success:
+        print(f"  Render failed. Error:\n{result.error_msg[:500]}")
+    return result
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Generate a manim video from a text description."
@@ -222,6 +373,26 @@ def main():
         action="store_true",
         help="Enable detailed metrics collection (tokens, timing, errors).",
     )
+    parser.add_argument(
+        "--no-validate",
+        action="store_true",
+        help="Skip the static check and dry run before each render.",
+    )
+    parser.add_argument(
+        "--no-draft",
+        action="store_true",
+        help="Render every attempt at full quality, instead of fast drafts followed by one final render.",
+    )
+    parser.add_argument(
+        "--speculate",
+        action="store_true",
+        help="Render each version of the code while the checker reviews it (single-pass pipeline only).",
+    )
+    parser.add_argument(
+        "--no-patch",
+        action="store_true",
+        help="Have the LLM rewrite the whole scene for each fix, instead of sending edits.",
+    )
     args = parser.parse_args()
 
     # Read input — treat as file path only if it looks like one and exists
@@ -262,6 +433,7 @@ def main():
         )
         metrics = metrics_collector.__enter__()
         set_metrics_tracker(metrics)
+        set_tracer(metrics_collector.tracer)
         print(f"  Metrics collection enabled (tier: {args.tier})")
     else:
         metrics_collector = None
@@ -269,12 +441,27 @@ def main():
 
     try:
         # Step 1: Generate plan + code
-        if args.multi_pass:
-            print("[1/3] Generating scene with multi-pass pipeline...")
-            plan, code = multi_pass_pipeline(description, verbose=args.verbose)
-        else:
-            print("[1/3] Generating scene (Planner → Coder → Checker)...")
-            plan, code = single_pass_pipeline(description, verbose=args.verbose)
+        speculation = None
+        with span("generate", pipeline=pipeline_name):
+            if args.multi_pass:
+                print("[1/3] Generating scene with multi-pass pipeline...")
+                plan, code = multi_pass_pipeline(description, verbose=args.verbose)
+            elif args.speculate:
+                print("[1/3] Generating scene (Planner → Coder → Checker ∥ Renderer)...")
+                plan, code, speculation = speculative_single_pass_pipeline(
+                    description,
+                    renderer,
+                    validate_first=not args.no_validate,
+                    draft=not args.no_draft,
+                    metrics=metrics,
+                    verbose=args.verbose,
+                    patch=not args.no_patch,
+                )
+            else:
+                print("[1/3] Generating scene (Planner → Coder → Checker)...")
+                plan, code = single_pass_pipeline(
+                    description, verbose=args.verbose, patch=not args.no_patch,
+                )
 
         renderer.save_plan(plan)
         if args.verbose:
@@ -291,8 +478,19 @@ def main():
 
         for attempt in range(1, max_attempts + 1):
             print(f"[2/3] Rendering (attempt {attempt}/{max_attempts})...")
-            scene_file = renderer.write_scene(code, attempt)
-            result = renderer.render(scene_file)
+            if speculation and attempt == 1:
+                # Already rendered while the checker was reviewing it
+                scene_file, result = speculation.scene_file, speculation.result
+            else:
+                scene_file = renderer.write_scene(code, attempt)
+                result = validate_and_render(
+                    renderer,
+                    scene_file,
+                    attempt,
+                    validate_first=not args.no_validate,
+                    draft=not args.no_draft,
+                    metrics=metrics,
+                )
 
             if result.success:
                 print(f"  Render succeeded! Video: {result.video_path}")
@@ -300,11 +498,14 @@ def main():
                     metrics.add_render_attempt(attempt, success=True)
                 break
 
-            print(f"  Render failed. Error:\n{result.error_msg[:500]}")
-
             if attempt < max_attempts:
-                print("  Asking LLM to fix the code...")
-                code = fix_code(code, result.error_msg, use_enhanced=True)
+                if speculation and attempt == 1 and speculation.fixed_code:
+                    print("  Using the fix made while the checker was running...")
+                    code = speculation.fixed_code
+                else:
+                    print("  Asking LLM to fix the code...")
+                    with span("fix", attempt=attempt):
+                        code = fix_code(code, result.error_msg, use_enhanced=True, patch=not args.no_patch)
                 if args.verbose:
                     print(f"\n--- FIXED CODE (attempt {attempt + 1}) ---")
                     print(code)
@@ -319,6 +520,22 @@ def main():
             )
             sys.exit(1)
 
+        # Only the accepted code gets a full quality render
+        if not args.no_draft:
+            print("[2/3] Rendering final video...")
+            with span("render_final") as render_span:
+                final = renderer.render(scene_file)
+            if metrics:
+                metrics.render_duration_seconds += render_span.duration_seconds
+            if final.success:
+                result = final
+                print(f"  Final render succeeded! Video: {result.video_path}")
+            else:
+                print(
+                    f"  Final render failed, keeping the draft. Error:\n{final.error_msg[:500]}",
+                    file=sys.stderr,
+                )
+
         # Step 3: Play
         if not args.no_play and result.video_path:
             print("[3/3] Opening video...")
@@ -335,6 +552,7 @@ def main():
             if args.measure:
                 print("\n" + metrics.summary())
                 print(f"\nMetrics saved to: {output_dir / 'metrics.json'}")
+                print(f"Trace saved to: {output_dir / 'trace.json'} (open in ui.perfetto.dev)")
 
 
 if __name__ == "__main__":
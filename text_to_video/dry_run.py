@@ -0,0 +1,34 @@
+"""Run a scene's construct() with animations skipped and nothing written to disk.
+
+Usage: python -m text_to_video.dry_run <scene_file> <scene_name>
+
+manimlib reads its configuration from the command line when first imported,
+so this has to run in its own process, with sys.argv set up before that import.
+"""
+
+import sys
+
+
+def main():
+    scene_file, scene_name = sys.argv[1:3]
+    # -w keeps manimlib headless, -l keeps the camera small
+    sys.argv = ["manimgl", scene_file, scene_name, "-w", "-l"]
+
+    from addict import Dict
+
+    from manimlib.config import manim_config
+    from manimlib.extract_scene import compute_total_frames, get_module, get_scene_classes
+
+    scene_config = Dict(manim_config.scene)
+    module = get_module(manim_config.run)
+    scene_classes = {sc.__name__: sc for sc in get_scene_classes(module)}
+    if scene_name not in scene_classes:
+        print(f"NameError: no scene named '{scene_name}' found in {scene_file}", file=sys.stderr)
+        sys.exit(1)
+
+    n_frames = compute_total_frames(scene_classes[scene_name], scene_config)
+    print(f"Dry run finished: {n_frames} frames")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,6 @@
 """Grok/xAI LLM client using OpenAI-compatible API."""
 
 import os
-import time
 from typing import Optional
 from openai import OpenAI
 from dotenv import load_dotenv
@@ -18,16 +17,24 @@ from .prompt import (
     SP_CHECKER_PROMPT,
 )
 from .prompt_builder import (
+    build_enhanced_fix_prompt,
     build_fix_prompt,
+    build_patch_prompt,
     classify_error,
     classify_error_with_confidence,
+    count_tokens,
     extract_error_context,
     suggest_fix_strategy,
 )
 from .metrics import VideoMetrics
+from .patch import PatchError, apply_patch
+from .tracing import span
 
 load_dotenv()
 
+# Edits for a fix are a small fraction of the file, so need far fewer tokens
+PATCH_MAX_TOKENS = 4000
+
 # Global metrics tracker (set by cli.py when needed)
 _current_metrics: Optional[VideoMetrics] = None
 
@@ -61,17 +68,17 @@ def _call(system: str, user: str, max_tokens: int = 16000, purpose: str = "gener
     """
     client = _get_client()
 
-    start_time = time.time()
-    response = client.chat.completions.create(
-        model="grok-3-fast",
-        messages=[
-            {"role": "system", "content": system},
-            {"role": "user", "content": user},
-        ],
-        max_tokens=max_tokens,
-        temperature=0.3,
-    )
-    duration = time.time() - start_time
+    with span(purpose, category="llm", max_tokens=max_tokens) as call_span:
+        response = client.chat.completions.create(
+            model="grok-3-fast",
+            messages=[
+                {"role": "system", "content": system},
+                {"role": "user", "content": user},
+            ],
+            max_tokens=max_tokens,
+            temperature=0.3,
+        )
+    duration = call_span.duration_seconds
 
     # Track metrics if collector is active
     if _current_metrics:
@@ -97,7 +104,52 @@ def generate_scene(description: str) -> tuple[str, str]:
     return plan, code
 
 
-def fix_code(code: str, error: str, use_enhanced: bool = False, verbose: bool = False) -> str:
+def _fix(system: str, user_msg: str, code: str, purpose: str, patch: bool = True) -> str:
+    """Get fixed code from the LLM, as edits to code when patch is True.
+
+    If the edits can't be applied, or leave the code unparseable, the LLM is
+    asked again for the whole file.
+
+    Args:
+        system: Fix prompt asking for the complete corrected code
+        user_msg: The code and what's wrong with it, without a closing instruction
+        code: The code being fixed
+        purpose: Purpose of the call for metrics tracking
+        patch: Ask for SEARCH/REPLACE edits instead of the whole file
+
+    Returns:
+        Fixed code
+    """
+    if patch:
+        response = _call(
+            build_patch_prompt(system),
+            user_msg + "\nReturn ONLY SEARCH/REPLACE blocks fixing the code.",
+            max_tokens=PATCH_MAX_TOKENS,
+            purpose=f"{purpose}_patch",
+        )
+        try:
+            fixed = apply_patch(code, _strip_fences(response))
+            compile(fixed, "<patched scene>", "exec")
+        except (PatchError, SyntaxError) as err:
+            print(f"  Could not apply the patch ({err}), asking for the whole file...")
+            if _current_metrics:
+                _current_metrics.add_patch(applied=False)
+        else:
+            if _current_metrics:
+                _current_metrics.add_patch(applied=True)
+            return fixed
+
+    fixed = _call(system, user_msg + "\nReturn ONLY the complete corrected Python code.", purpose=purpose)
+    return _strip_fences(fixed)
+
+
+def fix_code(
+    code: str,
+    error: str,
+    use_enhanced: bool = False,
+    verbose: bool = False,
+    patch: bool = True,
+) -> str:
     """Send broken code + error to LLM, get back fixed code.
 
     Uses enhanced error classification with confidence scoring to route to specialized fix prompts.
@@ -107,6 +159,7 @@ def fix_code(code: str, error: str, use_enhanced: bool = False, verbose: bool =
         error: Error message from renderer
         use_enhanced: Force use of full enhanced prompt
         verbose: Print detailed error analysis
+        patch: Ask for SEARCH/REPLACE edits rather than the whole file
 
     Returns:
         Fixed code
@@ -149,21 +202,25 @@ def fix_code(code: str, error: str, use_enhanced: bool = False, verbose: bool =
         elif "issue" in details:
             user_msg += f"LIKELY ISSUE: {details['issue']}\n"
 
-    user_msg += "\nFix the code and return ONLY the corrected Python code."
+    user_msg += "\nFix the code."
 
     # Select prompt based on confidence and strategy
     if use_enhanced or confidence < 0.5 or error_type == "general":
-        # Use full enhanced prompt for low-confidence or complex errors
-        system = ENHANCED_PROMPT + "\n\n" + FIX_CODE_PROMPT
-        print(f"  Using enhanced prompt (full context)")
+        # Use the enhanced prompt for low-confidence or complex errors, with
+        # its API reference cut down to what the code uses
+        system = build_enhanced_fix_prompt(ENHANCED_PROMPT, code)
+        full_tokens = count_tokens(ENHANCED_PROMPT + "\n\n" + FIX_CODE_PROMPT)
+        sent_tokens = count_tokens(system)
+        if _current_metrics:
+            _current_metrics.add_prompt_trim(full_tokens, sent_tokens)
+        print(f"  Using enhanced prompt ({sent_tokens:,} of {full_tokens:,} tokens)")
     else:
         # Use specialized fix prompt
         system = build_fix_prompt(error_type)
         print(f"  Using specialized {error_type} fixer")
 
     # Make LLM call with appropriate purpose tag
-    fixed = _call(system, user_msg, purpose=f"fix_{error_type}_{strategy}")
-    fixed = _strip_fences(fixed)
+    fixed = _fix(system, user_msg, code, purpose=f"fix_{error_type}_{strategy}", patch=patch)
 
     # Track detailed error info in metrics
     if _current_metrics:
@@ -288,14 +345,12 @@ def sp_check_code(code: str, plan: str) -> tuple[bool, str]:
     return False, response
 
 
-def sp_fix_code(plan: str, code: str, feedback: str) -> str:
+def sp_fix_code(plan: str, code: str, feedback: str, patch: bool = True) -> str:
     """Coder stage with checker feedback: plan + code + feedback → fixed code."""
     user_msg = (
         f"SCENE PLAN:\n\n{plan}\n\n"
         f"CURRENT CODE:\n```python\n{code}\n```\n\n"
         f"CHECKER FEEDBACK (fix these issues):\n{feedback}\n\n"
-        f"Fix all issues identified by the checker. Return the complete "
-        f"corrected scene code."
+        f"Fix all issues identified by the checker."
     )
-    code = _call(SP_CODER_PROMPT, user_msg, max_tokens=16000, purpose="fix_checker_feedback")
-    return _strip_fences(code)
+    return _fix(SP_CODER_PROMPT, user_msg, code, purpose="fix_checker_feedback", patch=patch)
@@ -7,6 +7,8 @@ from datetime import datetime
 from pathlib import Path
 from typing import List, Optional
 
+from .tracing import Tracer
+
 
 @dataclass
 class LLMCall:
@@ -43,6 +45,10 @@ class VideoMetrics:
     total_tokens: int = 0
     prompt_tokens: int = 0
     completion_tokens: int = 0
+    trimmed_prompts: int = 0
+    prompt_tokens_saved: int = 0  # By trimming prompts to the APIs in use
+    patched_fixes: int = 0  # Fixes applied as SEARCH/REPLACE edits
+    patch_fallbacks: int = 0  # Edits that didn't apply, so the whole file was regenerated
 
     # Timing metrics
     start_time: str = ""
@@ -50,6 +56,7 @@ class VideoMetrics:
     total_duration_seconds: float = 0.0
     generation_duration_seconds: float = 0.0  # LLM only
     render_duration_seconds: float = 0.0
+    validation_duration_seconds: float = 0.0
 
     # Render metrics
     render_attempts: List[RenderAttempt] = field(default_factory=list)
@@ -57,6 +64,16 @@ class VideoMetrics:
     first_pass_success: bool = False
     final_success: bool = False
 
+    # Validation metrics (static check + dry run before each render)
+    validation_attempts: int = 0
+    validation_failures: int = 0
+
+    # Speculation metrics (--speculate: renders overlapping checker calls)
+    speculative_renders: int = 0
+    speculative_renders_cancelled: int = 0
+    speculative_fixes: int = 0
+    speculative_fixes_used: int = 0
+
     # Quality metrics (if available)
     spatial_errors: int = 0
     timing_errors: int = 0
@@ -85,6 +102,18 @@ class VideoMetrics:
         self.completion_tokens += completion_tokens
         self.generation_duration_seconds += duration_seconds
 
+    def add_prompt_trim(self, full_tokens: int, sent_tokens: int):
+        """Record a prompt sent trimmed to a token budget, rather than in full."""
+        self.trimmed_prompts += 1
+        self.prompt_tokens_saved += max(full_tokens - sent_tokens, 0)
+
+    def add_patch(self, applied: bool):
+        """Record a fix requested as edits, and whether they applied."""
+        if applied:
+            self.patched_fixes += 1
+        else:
+            self.patch_fallbacks += 1
+
     def add_render_attempt(
         self,
         attempt_number: int,
@@ -117,6 +146,13 @@ class VideoMetrics:
             elif "api" in error_type.lower() or "syntax" in error_type.lower():
                 self.api_errors += 1
 
+    def add_validation(self, success: bool, duration_seconds: float):
+        """Record a pre-render validation of the scene code."""
+        self.validation_attempts += 1
+        if not success:
+            self.validation_failures += 1
+        self.validation_duration_seconds += duration_seconds
+
     def finalize(self):
         """Calculate final metrics."""
         self.end_time = datetime.now().isoformat()
@@ -142,12 +178,17 @@ class VideoMetrics:
             f"  Total tokens: {self.total_tokens:,}",
             f"  Prompt tokens: {self.prompt_tokens:,}",
             f"  Completion tokens: {self.completion_tokens:,}",
+            f"  Prompt tokens saved: {self.prompt_tokens_saved:,} ({self.trimmed_prompts} trimmed prompts)",
+            f"  Patched fixes: {self.patched_fixes} ({self.patch_fallbacks} fell back to the whole file)",
             f"  Generation time: {self.generation_duration_seconds:.1f}s",
             f"",
             f"Render Metrics:",
             f"  Total attempts: {self.total_render_attempts}",
             f"  First-pass success: {'✓' if self.first_pass_success else '✗'}",
             f"  Final success: {'✓' if self.final_success else '✗'}",
+            f"  Validations: {self.validation_attempts} ({self.validation_failures} failed)",
+            f"  Speculative renders: {self.speculative_renders} ({self.speculative_renders_cancelled} cancelled)",
+            f"  Speculative fixes: {self.speculative_fixes} ({self.speculative_fixes_used} used)",
             f"",
             f"Error Breakdown:",
             f"  Spatial errors: {self.spatial_errors}",
@@ -157,6 +198,7 @@ class VideoMetrics:
             f"Timing:",
             f"  Total duration: {self.total_duration_seconds:.1f}s",
             f"  Generation: {self.generation_duration_seconds:.1f}s",
+            f"  Validation: {self.validation_duration_seconds:.1f}s",
             f"  Rendering: {self.render_duration_seconds:.1f}s",
         ]
         return "\n".join(lines)
@@ -175,6 +217,7 @@ class MetricsCollector:
             start_time=datetime.now().isoformat(),
         )
         self.render_start_time = None
+        self.tracer = Tracer()
 
     def __enter__(self):
         return self.metrics
@@ -196,6 +239,9 @@ class MetricsCollector:
         with open(summary_file, "w") as f:
             f.write(self.metrics.summary())
 
+        # And the timing spans, for chrome://tracing or ui.perfetto.dev
+        self.tracer.save(self.output_dir / "trace.json")
+
 
 def compare_metrics(before_dir: Path, after_dir: Path) -> str:
     """Compare metrics from two video generations.
@@ -0,0 +1,118 @@
+"""Apply search/replace edits from the LLM to scene code.
+
+Fixes are usually a line or two, so rather than regenerating the whole
+scene, the fixer can answer with blocks of the form
+
+    <<<<<<< SEARCH
+    lines from the current code
+    =======
+    lines to put in their place
+    >>>>>>> REPLACE
+
+which are applied here. Anything that can't be applied unambiguously
+raises PatchError, so the caller can fall back to asking for the whole file.
+"""
+
+import re
+
+SEARCH_MARKER = "<<<<<<< SEARCH"
+DIVIDER_MARKER = "======="
+REPLACE_MARKER = ">>>>>>> REPLACE"
+
+_BLOCK_RE = re.compile(
+    r"^<{5,9} ?SEARCH[^\n]*\n(.*?)^={5,9}[ \t]*\n(.*?)^>{5,9} ?REPLACE[^\n]*$",
+    re.MULTILINE | re.DOTALL,
+)
+
+
+class PatchError(Exception):
+    """Raised when edits are malformed or don't match the code."""
+
+
+def parse_edits(response: str) -> list[tuple[str, str]]:
+    """Extract (search, replace) pairs from an LLM response, in order."""
+    edits = [(search, replace) for search, replace in _BLOCK_RE.findall(response)]
+    if not edits and SEARCH_MARKER in response:
+        raise PatchError("malformed SEARCH/REPLACE block")
+    return edits
+
+
+def apply_edits(code: str, edits: list[tuple[str, str]]) -> str:
+    """Apply each edit in turn, each to the result of the last."""
+    for number, (search, replace) in enumerate(edits, 1):
+        code = _apply_edit(code, search, replace, number)
+    return code
+
+
+def apply_patch(code: str, response: str) -> str:
+    """Apply the edits in an LLM response to code.
+
+    A response with no edits is returned as is, if it looks like a whole
+    scene, since the model sometimes answers with the full file anyway.
+    """
+    edits = parse_edits(response)
+    if edits:
+        return apply_edits(code, edits)
+    if "class " in response and "def construct" in response:
+        return response
+    raise PatchError("response contains no SEARCH/REPLACE blocks")
+
+
+def _apply_edit(code: str, search: str, replace: str, number: int) -> str:
+    if not search.strip():
+        raise PatchError(f"edit {number} has an empty SEARCH section")
+
+    # Exact matches only count from the start of a line, since a search
+    # missing its indentation would otherwise match partway into one, and
+    # leave the lines after the first of the replacement unindented
+    starts = [
+        match.start() for match in re.finditer(re.escape(search), code)
+        if match.start() == 0 or code[match.start() - 1] == "\n"
+    ]
+    if len(starts) == 1:
+        start = starts[0]
+        return code[:start] + replace + code[start + len(search):]
+    if len(starts) > 1:
+        raise PatchError(f"edit {number} matches {len(starts)} places in the code")
+
+    # Models often get the indentation or trailing spaces of the search
+    # lines wrong, so try again comparing stripped lines, and indent the
+    # replacement to where the match was found
+    code_lines = code.split("\n")
+    search_lines = _trim_blank_lines(search.split("\n"))
+    replace_lines = _trim_blank_lines(replace.split("\n"))
+    stripped = [line.strip() for line in search_lines]
+    size = len(search_lines)
+    matches = [
+        i for i in range(len(code_lines) - size + 1)
+        if [line.strip() for line in code_lines[i:i + size]] == stripped
+    ]
+    if not matches:
+        raise PatchError(f"edit {number} SEARCH section not found in the code")
+    if len(matches) > 1:
+        raise PatchError(f"edit {number} matches {len(matches)} places in the code")
+
+    start = matches[0]
+    shift = _indent(code_lines[start]) - _indent(search_lines[0])
+    code_lines[start:start + size] = [_reindent(line, shift) for line in replace_lines]
+    return "\n".join(code_lines)
+
+
+def _trim_blank_lines(lines: list[str]) -> list[str]:
+    while lines and not lines[0].strip():
+        lines = lines[1:]
+    while lines and not lines[-1].strip():
+        lines = lines[:-1]
+    return lines
+
+
+def _indent(line: str) -> int:
+    return len(line) - len(line.lstrip(" "))
+
+
+def _reindent(line: str, shift: int) -> str:
+    if not line.strip():
+        return ""
+    if shift >= 0:
+        return " " * shift + line
+    return line[min(-shift, _indent(line)):]
@@ -1,14 +1,47 @@
 """Prompt composition system for building tiered prompts from modular components."""
 
+import builtins
+import keyword
+import re
+from collections import Counter
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import List
+from typing import List, Optional
+
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
 
 # Prompt module directory
 PROMPT_DIR = Path(__file__).parent / "prompts"
 
+# Token budget for the system prompt of a fix. Untrimmed, the enhanced fix
+# prompt (grok_prompt.md + FIX_CODE_PROMPT) is around 19k tokens.
+FIX_PROMPT_TOKEN_BUDGET = 6000
+
+# Sections of the enhanced prompt (grok_prompt.md), by their role in a fix
+# prompt. Sections not named here, like the API reference, patterns and full
+# example, are replaced by the reference/ sections for the APIs in use.
+ENHANCED_REQUIRED_SECTIONS = ("HARD RULES", "COMMON MISTAKES")
+ENHANCED_OPTIONAL_SECTIONS = ("ANIMATION SELECTION GUIDE", "VIDEO DESIGN PRINCIPLES")
+ENHANCED_REFERENCE_MODULES = ["reference/api_full.md", "reference/patterns.md"]
 
+FIX_PREAMBLE = """You are an expert manimgl debugger. You will receive a manimgl script that failed to render and the error message.
+
+Fix the code so it runs successfully. Return ONLY the fixed Python code — no markdown fences, no explanations.
+
+---
+"""
+
+# Names too common to say which reference sections a script needs
+_IGNORED_NAMES = set(dir(builtins)) | set(keyword.kwlist) | {"self", "construct", "np", "array"}
+
+
+@lru_cache(maxsize=None)
 def _load_module(module_path: str) -> str:
-    """Load a prompt module from file.
+    """Load a prompt module from file, reading each file only once.
 
     Args:
         module_path: Relative path like 'core/hard_rules.md'
@@ -22,24 +55,151 @@ def _load_module(module_path: str) -> str:
     return full_path.read_text().strip()
 
 
-def compose_prompt(tier: str, modules: List[str] = None, task: str = None) -> str:
+@lru_cache(maxsize=None)
+def _get_encoding():
+    if tiktoken is None:
+        return None
+    try:
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception:
+        # The encoding is downloaded on first use, which can fail offline
+        return None
+
+
+@lru_cache(maxsize=128)
+def count_tokens(text: str) -> int:
+    """Count tokens with tiktoken if installed, else estimate 4 characters per token.
+
+    Grok's tokenizer isn't public, so either way this is an approximation,
+    good for budgeting rather than billing.
+    """
+    encoding = _get_encoding()
+    if encoding is None:
+        return (len(text) + 3) // 4
+    return len(encoding.encode(text))
+
+
+def _split_sections(text: str, prefix: str = "## ") -> list[str]:
+    """Split markdown before each heading starting with prefix, outside code fences."""
+    sections = [[]]
+    in_fence = False
+    for line in text.split("\n"):
+        if line.startswith("```"):
+            in_fence = not in_fence
+        if not in_fence and line.startswith(prefix) and sections[-1]:
+            sections.append([])
+        sections[-1].append(line)
+    return ["\n".join(lines).strip() for lines in sections if any(line.strip() for line in lines)]
+
+
+def _identifiers(code: str) -> set[str]:
+    """Every identifier in the code, whether or not it parses."""
+    return set(re.findall(r"[A-Za-z_]\w*", code)) - _IGNORED_NAMES
+
+
+@dataclass(frozen=True)
+class ReferenceSection:
+    """A "## " section of a reference/ module, with the API names it documents."""
+    module: str
+    text: str
+    names: frozenset
+    tokens: int
+
+
+@lru_cache(maxsize=None)
+def reference_index() -> tuple[ReferenceSection, ...]:
+    """Index the sections of every reference/ module by the calls they show."""
+    index = []
+    for path in sorted((PROMPT_DIR / "reference").glob("*.md")):
+        module = f"reference/{path.name}"
+        for text in _split_sections(_load_module(module)):
+            if not text.startswith("## "):
+                continue  # The module's title
+            names = frozenset(re.findall(r"([A-Za-z_]\w*)\s*\(", text)) - _IGNORED_NAMES
+            index.append(ReferenceSection(module, text, names, count_tokens(text)))
+    return tuple(index)
+
+
+def select_reference(code: str, budget: int, modules: Optional[List[str]] = None) -> list[ReferenceSection]:
+    """Pick the reference sections most relevant to the code, within the token budget.
+
+    A section scores for each name it shares with the code, with names
+    shown in fewer sections (like ValueTracker, rather than set_color)
+    counting for more. Names in over a quarter of all sections, like play,
+    say nothing about relevance, and sections sharing no other names with
+    the code are left out.
+    """
+    index = [s for s in reference_index() if modules is None or s.module in modules]
+    section_counts = Counter(name for section in index for name in section.names)
+    common = {name for name, count in section_counts.items() if count > len(index) / 4}
+    used = _identifiers(code) - common
+    scored = []
+    for section in index:
+        score = sum(1 / section_counts[name] for name in section.names & used)
+        if score > 0:
+            scored.append((score, section))
+
+    chosen = []
+    spent = 0
+    for score, section in sorted(scored, key=lambda pair: -pair[0]):
+        if spent + section.tokens <= budget:
+            chosen.append(section)
+            spent += section.tokens
+    return chosen
+
+
+def trim_reference(code: str, budget: int, modules: Optional[List[str]] = None) -> str:
+    """Reference modules cut down to the sections relevant to the code.
+
+    Args:
+        code: Scene code whose APIs decide what to keep
+        budget: Maximum tokens for the kept sections
+        modules: Reference modules to draw from (default: all of them)
+
+    Returns:
+        Each module's title followed by its kept sections, in their original order
+    """
+    index = [s for s in reference_index() if modules is None or s.module in modules]
+    chosen = set(select_reference(code, budget, modules))
+    parts = []
+    for module in dict.fromkeys(s.module for s in index):
+        kept = [s.text for s in index if s.module == module and s in chosen]
+        if kept:
+            title = _load_module(module).split("\n", 1)[0]
+            parts.append("\n\n".join([title, *kept]))
+    return "\n\n".join(parts)
+
+
+@lru_cache(maxsize=None)
+def _compose_modules(module_list: tuple[str, ...]) -> str:
+    return "\n\n".join(_load_module(m) for m in module_list)
+
+
+def compose_prompt(
+    tier: str,
+    modules: List[str] = None,
+    task: str = None,
+    code: str = None,
+    budget: int = None,
+) -> str:
     """Compose a prompt from modular components based on tier and task.
 
     Args:
         tier: Prompt tier - "minimal", "standard", or "detailed"
         modules: Optional explicit list of module paths to include
         task: Optional task type for specialized prompts
+        code: Optional code to trim reference modules to the APIs it uses
+        budget: Token budget for the whole prompt, used along with code
 
     Returns:
         Composed prompt string
     """
     if modules:
         # Explicit module list provided
-        parts = [_load_module(m) for m in modules]
-        return "\n\n".join(parts)
+        module_list = list(modules)
 
     # Default tier-based composition
-    if tier == "minimal":
+    elif tier == "minimal":
         # Syntax fixes, quick edits (250 lines)
         module_list = [
             "core/hard_rules.md",
@@ -75,10 +235,20 @@ def compose_prompt(tier: str, modules: List[str] = None, task: str = None) -> st
     else:
         raise ValueError(f"Unknown tier: {tier}. Use 'minimal', 'standard', or 'detailed'.")
 
-    parts = [_load_module(m) for m in module_list]
-    return "\n\n".join(parts)
+    if code is None:
+        return _compose_modules(tuple(module_list))
 
+    # Swap the reference modules for the parts of them the code needs
+    references = [m for m in module_list if m.startswith("reference/")]
+    others = _compose_modules(tuple(m for m in module_list if m not in references))
+    if not references:
+        return others
+    remaining = (budget or FIX_PROMPT_TOKEN_BUDGET) - count_tokens(others)
+    reference = trim_reference(code, remaining, references)
+    return "\n\n".join(part for part in (others, reference) if part)
 
+
+@lru_cache(maxsize=None)
 def build_system_prompt(tier: str = "standard", task: str = None) -> str:
     """Build a complete system prompt with preamble + composed modules.
 
@@ -102,29 +272,77 @@ You receive a plain-text description and produce a structured plan followed by c
     return preamble + composed
 
 
-def build_fix_prompt(error_type: str = None) -> str:
+def build_fix_prompt(error_type: str = None, code: str = None, budget: int = FIX_PROMPT_TOKEN_BUDGET) -> str:
     """Build a specialized fix prompt based on error type.
 
     Args:
         error_type: Error category - "syntax", "api", "spatial", or "timing"
+        code: Optional failing code, to trim the general prompt's API
+            reference to what it uses
+        budget: Token budget for the general prompt, used along with code
 
     Returns:
         Specialized fix prompt
     """
-    base = """You are an expert manimgl debugger. You will receive a manimgl script that failed to render and the error message.
-
-Fix the code so it runs successfully. Return ONLY the fixed Python code — no markdown fences, no explanations.
-
----
-"""
-
     if error_type:
         specialized = _load_module(f"specialized/{error_type}_fixer.md")
-        return base + specialized
+        return FIX_PREAMBLE + specialized
 
     # General fix prompt (use standard tier)
-    general = compose_prompt("standard")
-    return base + general
+    general = compose_prompt("standard", code=code, budget=budget - count_tokens(FIX_PREAMBLE))
+    return FIX_PREAMBLE + general
+
+
+def build_patch_prompt(system: str) -> str:
+    """Ask for SEARCH/REPLACE edits (see patch.py) rather than the whole file.
+
+    Args:
+        system: A fix prompt which asks for the complete corrected code
+
+    Returns:
+        The same prompt, ending with the edit format instructions
+    """
+    return system + "\n\n---\n\n" + _load_module("core/patch_format.md")
+
+
+def build_enhanced_fix_prompt(
+    enhanced_prompt: str,
+    code: str,
+    budget: int = FIX_PROMPT_TOKEN_BUDGET,
+) -> str:
+    """Build the fix prompt for low-confidence errors, within a token budget.
+
+    Instead of the whole enhanced prompt followed by the general fix prompt,
+    this keeps the enhanced prompt's hard rules and common mistakes, fills
+    the budget with the reference sections for the APIs the code uses, and
+    then with whichever of the enhanced prompt's guidance sections still fit.
+
+    Args:
+        enhanced_prompt: Text of the enhanced prompt (grok_prompt.md)
+        code: The failing code
+        budget: Maximum tokens for the prompt
+
+    Returns:
+        Fix prompt
+    """
+    sections = _split_sections(enhanced_prompt)
+
+    def find(names: tuple[str, ...]) -> list[str]:
+        return [s for name in names for s in sections if s.startswith("## ") and name in s.split("\n", 1)[0]]
+
+    required = [FIX_PREAMBLE.strip(), *find(ENHANCED_REQUIRED_SECTIONS)]
+    remaining = budget - sum(count_tokens(part) for part in required)
+    reference = trim_reference(code, remaining, ENHANCED_REFERENCE_MODULES)
+    remaining -= count_tokens(reference)
+
+    optional = []
+    for section in find(ENHANCED_OPTIONAL_SECTIONS):
+        tokens = count_tokens(section)
+        if tokens <= remaining:
+            optional.append(section)
+            remaining -= tokens
+
+    return "\n\n".join(part for part in (*required, *optional, reference) if part)
 
 
 def classify_error(error_msg: str, code: str) -> str:
@@ -2,13 +2,22 @@
 
 import shutil
 import subprocess
+import threading
 import time
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Optional
+
+from .tracing import run_subprocess, span
 
 REPO_ROOT = Path(__file__).resolve().parent.parent
 VIDEOS_DIR = REPO_ROOT / "videos"
 
+# Drafts render at 480p and 15fps, encoded with ffmpeg's fast built-in mpeg4
+# encoder. They share manimlib's on-disk Tex/Text cache with the final render,
+# so any LaTeX compiled for a draft is reused rather than compiled again.
+DRAFT_ARGS = ["-l", "--fps", "15", "--vcodec", "mpeg4"]
+
 
 @dataclass
 class RenderResult:
@@ -34,20 +43,34 @@ class Renderer:
         scene_file.write_text(code)
         return scene_file
 
-    def render(self, scene_file: Path) -> RenderResult:
-        """Run manimgl on the scene file and return the result."""
+    def render(
+        self,
+        scene_file: Path,
+        draft: bool = False,
+        cancel: Optional[threading.Event] = None,
+    ) -> RenderResult:
+        """Run manimgl on the scene file and return the result.
+
+        With draft=True, render a fast low quality preview, for checking
+        that the code works, rather than the full quality video. Setting
+        cancel stops the render, raising SubprocessCancelled.
+        """
         # Record time before render so we only pick up NEW videos
         before_render = time.time()
 
         cmd = ["manimgl", str(scene_file), "GeneratedScene", "-w"]
+        if draft:
+            cmd += DRAFT_ARGS
         try:
-            proc = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=300,
-                cwd=REPO_ROOT,
-            )
+            with span("manimgl", category="render", draft=draft):
+                proc = run_subprocess(
+                    cmd,
+                    capture_output=True,
+                    text=True,
+                    timeout=300,
+                    cwd=REPO_ROOT,
+                    cancel=cancel,
+                )
         except subprocess.TimeoutExpired:
             return RenderResult(
                 success=False,
@@ -65,7 +88,7 @@ class Renderer:
                 error_msg=error,
             )
 
-        video = self._find_and_move_video(before_render)
+        video = self._find_and_move_video(before_render, "draft.mp4" if draft else "video.mp4")
         if video:
             return RenderResult(success=True, video_path=video, error_msg="")
         else:
@@ -79,7 +102,7 @@ class Renderer:
                 ),
             )
 
-    def _find_and_move_video(self, created_after: float) -> Path | None:
+    def _find_and_move_video(self, created_after: float, dest_name: str = "video.mp4") -> Path | None:
         """Find an .mp4 in videos/ created after the given timestamp and move it."""
         if not VIDEOS_DIR.exists():
             return None
@@ -92,6 +115,6 @@ class Renderer:
             return None
         mp4s.sort(key=lambda p: p.stat().st_mtime)
         source = mp4s[-1]
-        dest = self.output_dir / "video.mp4"
+        dest = self.output_dir / dest_name
         shutil.move(str(source), str(dest))
         return dest
@@ -0,0 +1,182 @@
+"""Lightweight span tracing for the pipeline, exported as a Chrome trace.
+
+Spans nest naturally: each one records its start and duration, and trace
+viewers (chrome://tracing, https://ui.perfetto.dev) stack the spans of a
+thread by time. Timestamps come from the system-wide monotonic clock, so
+spans recorded by manimgl subprocesses (see manimlib/utils/tracing.py)
+can be merged into the same timeline.
+"""
+
+import json
+import os
+import subprocess
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterator, Optional
+
+# Read by manimlib/utils/tracing.py in manimgl subprocesses
+TRACE_FILE_ENV_VAR = "MANIMGL_TRACE_FILE"
+
+
+@dataclass
+class Span:
+    """A timed block of work. duration_seconds is set once the block exits."""
+    name: str
+    category: str
+    args: dict = field(default_factory=dict)
+    start_ns: int = 0
+    end_ns: int = 0
+
+    @property
+    def duration_seconds(self) -> float:
+        return (self.end_ns - self.start_ns) / 1e9
+
+
+class Tracer:
+    """Collects spans from every thread, along with those of child processes."""
+
+    def __init__(self):
+        self.events: list[dict] = []
+        self._lock = threading.Lock()
+
+    def record(self, span: Span):
+        event = {
+            "name": span.name,
+            "cat": span.category,
+            "ph": "X",
+            "ts": span.start_ns / 1000,
+            "dur": (span.end_ns - span.start_ns) / 1000,
+            "pid": os.getpid(),
+            "tid": threading.get_ident(),
+            "args": span.args,
+        }
+        with self._lock:
+            self.events.append(event)
+
+    def child_env(self) -> tuple[dict, Path]:
+        """Environment for a manimgl subprocess, and the file it will trace to."""
+        fd, path = tempfile.mkstemp(prefix="manimgl_trace_", suffix=".json")
+        os.close(fd)
+        env = {**os.environ, TRACE_FILE_ENV_VAR: path}
+        return env, Path(path)
+
+    def merge_child_trace(self, path: Path):
+        """Add the spans a subprocess wrote, then delete its trace file."""
+        try:
+            text = path.read_text()
+            events = json.loads(text) if text else []
+        except (OSError, json.JSONDecodeError):
+            events = []
+        finally:
+            path.unlink(missing_ok=True)
+        with self._lock:
+            self.events.extend(events)
+
+    def save(self, path: Path):
+        """Write all spans in the Chrome trace event format."""
+        with self._lock:
+            events = sorted(self.events, key=lambda e: e["ts"])
+        # Label each process, so viewers show names rather than bare pids
+        for pid in sorted({e["pid"] for e in events}):
+            name = "text_to_video" if pid == os.getpid() else f"manimgl ({pid})"
+            events.append({"name": "process_name", "ph": "M", "pid": pid, "args": {"name": name}})
+        with open(path, "w") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+
+
+# Global tracer (set by cli.py when needed)
+_current_tracer: Optional[Tracer] = None
+
+
+def set_tracer(tracer: Optional[Tracer]):
+    """Set the global tracer for this generation session."""
+    global _current_tracer
+    _current_tracer = tracer
+
+
+def get_tracer() -> Optional[Tracer]:
+    return _current_tracer
+
+
+@contextmanager
+def span(name: str, category: str = "pipeline", **args) -> Iterator[Span]:
+    """Time the enclosed block.
+
+    The yielded Span has its duration once the block exits, whether or not
+    a tracer is active, so callers can use it for their own bookkeeping.
+    """
+    current = Span(name=name, category=category, args=args)
+    current.start_ns = time.monotonic_ns()
+    try:
+        yield current
+    finally:
+        current.end_ns = time.monotonic_ns()
+        if _current_tracer is not None:
+            _current_tracer.record(current)
+
+
+class SubprocessCancelled(Exception):
+    """Raised by run_subprocess when its cancel event is set before the child exits."""
+
+
+# How often a cancellable subprocess checks whether it has been cancelled
+CANCEL_POLL_SECONDS = 0.1
+
+
+def run_subprocess(
+    cmd: list[str],
+    cancel: Optional[threading.Event] = None,
+    **kwargs,
+) -> subprocess.CompletedProcess:
+    """subprocess.run, tracing the child too if a tracer is active.
+
+    The child is pointed at a trace file through the environment, and the
+    spans it writes there are merged in once it exits.
+
+    If cancel is given, setting it from another thread kills the child,
+    and SubprocessCancelled is raised.
+    """
+    run = subprocess.run if cancel is None else _run_cancellable
+    if cancel is not None:
+        kwargs["cancel"] = cancel
+    tracer = _current_tracer
+    if tracer is None:
+        return run(cmd, **kwargs)
+    env, trace_file = tracer.child_env()
+    try:
+        return run(cmd, env=env, **kwargs)
+    finally:
+        tracer.merge_child_trace(trace_file)
+
+
+def _run_cancellable(
+    cmd: list[str],
+    cancel: threading.Event,
+    timeout: Optional[float] = None,
+    capture_output: bool = False,
+    **kwargs,
+) -> subprocess.CompletedProcess:
+    """subprocess.run, except that the child is killed once cancel is set."""
+    if capture_output:
+        kwargs["stdout"] = kwargs["stderr"] = subprocess.PIPE
+    deadline = None if timeout is None else time.monotonic() + timeout
+    with subprocess.Popen(cmd, **kwargs) as proc:
+        while True:
+            try:
+                # Retrying communicate after a timeout loses no output
+                stdout, stderr = proc.communicate(timeout=CANCEL_POLL_SECONDS)
+                break
+            except subprocess.TimeoutExpired:
+                if cancel.is_set():
+                    proc.kill()
+                    proc.communicate()
+                    raise SubprocessCancelled(cmd)
+                if deadline is not None and time.monotonic() > deadline:
+                    proc.kill()
+                    proc.communicate()
+                    raise subprocess.TimeoutExpired(cmd, timeout)
+    return subprocess.CompletedProcess(cmd, proc.returncode, stdout, stderr)
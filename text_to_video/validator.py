@@ -0,0 +1,419 @@
+"""Cheap checks on generated scene code, run before the expensive full render.
+
+Validation has two stages:
+  1. A static pass over the AST, checking names, constructor keyword
+     arguments and method calls against an index of the manimlib API,
+     which is built by parsing the installed package's source.
+  2. A dry run, executing construct() in a child process with animations
+     skipped and nothing written to disk, to surface runtime errors.
+"""
+
+import ast
+import builtins
+import importlib.util
+import subprocess
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+
+from .renderer import REPO_ROOT
+from .tracing import run_subprocess, span
+
+DRY_RUN_TIMEOUT = 120
+
+# Names Python defines in every module namespace
+MODULE_DUNDERS = {"__file__", "__name__", "__doc__", "__spec__", "__loader__", "__builtins__"}
+
+
+@dataclass
+class ValidationResult:
+    success: bool
+    stage: str  # "static" or "dry_run"
+    error_msg: str
+    duration_seconds: float = 0.0
+
+
+@dataclass
+class ClassInfo:
+    """What the manimlib source says about one class."""
+    name: str
+    bases: list[str] = field(default_factory=list)
+    attributes: set[str] = field(default_factory=set)
+    init_params: set[str] | None = None  # None when the class defines no __init__
+    init_takes_kwargs: bool = False
+    init_kwargs_open: bool = False  # **kwargs used for more than passing up to super()
+
+
+@dataclass
+class ApiIndex:
+    """Public manimlib names, along with details on each class."""
+    module_exports: dict[str, set[str]] = field(default_factory=dict)
+    classes: dict[str, ClassInfo] = field(default_factory=dict)
+
+    def star_exports(self, module: str) -> set[str] | None:
+        if module == "manimlib":
+            return self.module_exports.get("manimlib.__init__")
+        return self.module_exports.get(module)
+
+    def ancestry(self, class_name: str) -> list[ClassInfo] | None:
+        """The class and all its bases, or None if any of them is unknown."""
+        result = []
+        to_visit = [class_name]
+        while to_visit:
+            name = to_visit.pop(0)
+            if name in ("object", "ABC", "Generic") or any(info.name == name for info in result):
+                continue
+            info = self.classes.get(name)
+            if info is None:
+                return None
+            result.append(info)
+            to_visit.extend(info.bases)
+        return result
+
+    def accepted_kwargs(self, class_name: str) -> set[str] | None:
+        """Keyword arguments the constructor accepts, or None if open-ended."""
+        ancestry = self.ancestry(class_name)
+        if ancestry is None:
+            return None
+        accepted = set()
+        for info in ancestry:
+            if info.init_params is None:
+                continue
+            accepted.update(info.init_params)
+            if info.init_kwargs_open:
+                return None
+            if not info.init_takes_kwargs:
+                return accepted
+        return None
+
+    def attributes(self, class_name: str) -> set[str] | None:
+        """Attributes instances are known to have, or None if open-ended."""
+        ancestry = self.ancestry(class_name)
+        if ancestry is None:
+            return None
+        result = set(dir(object))
+        for info in ancestry:
+            if "__getattr__" in info.attributes:
+                return None
+            result.update(info.attributes)
+        return result
+
+
+def _base_name(node: ast.expr) -> str:
+    """Name of a base class expression, e.g. 'Generic' for Generic[T]."""
+    if isinstance(node, ast.Subscript):
+        node = node.value
+    if isinstance(node, ast.Attribute):
+        return node.attr
+    if isinstance(node, ast.Name):
+        return node.id
+    return "?"
+
+
+def _is_type_checking_block(node: ast.stmt) -> bool:
+    return isinstance(node, ast.If) and "TYPE_CHECKING" in ast.unparse(node.test)
+
+
+def _kwargs_used_locally(init: ast.FunctionDef) -> bool:
+    """Whether __init__ does anything with **kwargs besides pass it up to super().__init__."""
+    kwarg = init.args.kwarg.arg
+    forwarded = set()
+    for node in ast.walk(init):
+        if isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute) \
+                and node.func.attr == "__init__" and isinstance(node.func.value, ast.Call) \
+                and isinstance(node.func.value.func, ast.Name) and node.func.value.func.id == "super":
+            forwarded.update(id(kw.value) for kw in node.keywords if kw.arg is None)
+    return any(
+        isinstance(node, ast.Name) and node.id == kwarg and id(node) not in forwarded
+        for node in ast.walk(init)
+    )
+
+
+def _index_class(node: ast.ClassDef) -> ClassInfo:
+    info = ClassInfo(name=node.name, bases=[_base_name(base) for base in node.bases])
+    for item in node.body:
+        if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            info.attributes.add(item.name)
+            if item.name == "__init__":
+                args = item.args
+                info.init_params = {
+                    arg.arg for arg in [*args.posonlyargs, *args.args, *args.kwonlyargs]
+                } - {"self"}
+                info.init_takes_kwargs = args.kwarg is not None
+                info.init_kwargs_open = info.init_takes_kwargs and _kwargs_used_locally(item)
+        elif isinstance(item, ast.Assign):
+            info.attributes.update(t.id for t in item.targets if isinstance(t, ast.Name))
+        elif isinstance(item, ast.AnnAssign) and isinstance(item.target, ast.Name):
+            info.attributes.add(item.target.id)
+    # Attributes set on self anywhere in the class body
+    for sub in ast.walk(node):
+        if isinstance(sub, ast.Attribute) and isinstance(sub.ctx, ast.Store) \
+                and isinstance(sub.value, ast.Name) and sub.value.id == "self":
+            info.attributes.add(sub.attr)
+    return info
+
+
+def _module_names(tree: ast.Module) -> tuple[set[str], list[str]]:
+    """Public names bound at the top level of a module, and modules it star-imports."""
+    names = set()
+    star_imports = []
+    statements = list(tree.body)
+    while statements:
+        node = statements.pop(0)
+        if _is_type_checking_block(node):
+            continue
+        if isinstance(node, (ast.If, ast.Try)):
+            # Conditional imports and definitions, e.g. the window import
+            statements.extend(node.body)
+            statements.extend(getattr(node, "orelse", []))
+            for handler in getattr(node, "handlers", []):
+                statements.extend(handler.body)
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            names.add(node.name)
+        elif isinstance(node, (ast.Assign, ast.AnnAssign, ast.AugAssign)):
+            targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+            for target in targets:
+                names.update(n.id for n in ast.walk(target) if isinstance(n, ast.Name))
+        elif isinstance(node, ast.Import):
+            names.update((alias.asname or alias.name).split(".")[0] for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            for alias in node.names:
+                if alias.name == "*":
+                    star_imports.append(node.module or "")
+                else:
+                    names.add(alias.asname or alias.name)
+    return {name for name in names if not name.startswith("_")}, star_imports
+
+
+@lru_cache(maxsize=1)
+def build_api_index() -> ApiIndex | None:
+    """Parse the installed manimlib source into an ApiIndex, without importing it."""
+    spec = importlib.util.find_spec("manimlib")
+    if spec is None or not spec.submodule_search_locations:
+        return None
+    package_dir = Path(list(spec.submodule_search_locations)[0])
+
+    index = ApiIndex()
+    star_imports = {}
+    for path in sorted(package_dir.rglob("*.py")):
+        module = ".".join(("manimlib", *path.relative_to(package_dir).with_suffix("").parts))
+        try:
+            tree = ast.parse(path.read_text(encoding="utf-8"))
+        except (SyntaxError, UnicodeDecodeError):
+            continue
+        index.module_exports[module], star_imports[module] = _module_names(tree)
+        for node in ast.walk(tree):
+            if isinstance(node, ast.ClassDef):
+                index.classes.setdefault(node.name, _index_class(node))
+
+    # Fold star imports into the names each module exports
+    def resolve(module: str, seen: set[str]) -> set[str]:
+        names = set(index.module_exports.get(module, set()))
+        for source in star_imports.get(module, []):
+            if source.startswith("manimlib") and source not in seen:
+                names |= resolve(source, seen | {source})
+        return names
+
+    for module in list(index.module_exports):
+        index.module_exports[module] = resolve(module, {module})
+    return index
+
+
+def _bound_names(tree: ast.Module) -> set[str]:
+    """Every name bound anywhere in the code, ignoring scopes."""
+    names = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Name) and isinstance(node.ctx, (ast.Store, ast.Del)):
+            names.add(node.id)
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            names.add(node.name)
+        elif isinstance(node, ast.arg):
+            names.add(node.arg)
+        elif isinstance(node, ast.alias):
+            names.add((node.asname or node.name).split(".")[0])
+        elif isinstance(node, (ast.ExceptHandler, ast.MatchAs, ast.MatchStar)) and node.name:
+            names.add(node.name)
+        elif isinstance(node, ast.MatchMapping) and node.rest:
+            names.add(node.rest)
+        elif isinstance(node, (ast.Global, ast.Nonlocal)):
+            names.update(node.names)
+    return names
+
+
+def _check_imports(tree: ast.Module, index: ApiIndex) -> tuple[list[str], set[str] | None]:
+    """Check imports, returning errors and the names star imports provide (None if unknown)."""
+    errors = []
+    star_names = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            modules = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.level == 0 and node.module:
+            modules = [node.module]
+        else:
+            continue
+        for module in modules:
+            if importlib.util.find_spec(module.split(".")[0]) is None:
+                errors.append(f"line {node.lineno}: ModuleNotFoundError: No module named '{module.split('.')[0]}'")
+                continue
+        if not isinstance(node, ast.ImportFrom):
+            continue
+        exports = index.star_exports(node.module)
+        for alias in node.names:
+            if alias.name == "*":
+                if exports is None:
+                    star_names = None
+                elif star_names is not None:
+                    star_names |= exports
+            elif exports is not None and alias.name not in exports \
+                    and f"{node.module}.{alias.name}" not in index.module_exports:
+                errors.append(
+                    f"line {node.lineno}: ImportError: cannot import name '{alias.name}' from '{node.module}'"
+                )
+    return errors, star_names
+
+
+def _instance_classes(tree: ast.Module, index: ApiIndex) -> dict[str, str]:
+    """Variables assigned exactly once, from a call to a manimlib class."""
+    assignments = {}
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Name) and isinstance(node.ctx, ast.Store):
+            assignments[node.id] = assignments.get(node.id, 0) + 1
+    result = {}
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Assign) and len(node.targets) == 1 \
+                and isinstance(node.targets[0], ast.Name) \
+                and isinstance(node.value, ast.Call) and isinstance(node.value.func, ast.Name) \
+                and node.value.func.id in index.classes \
+                and assignments.get(node.targets[0].id) == 1:
+            result[node.targets[0].id] = node.value.func.id
+    return result
+
+
+def check_static(code: str) -> list[str]:
+    """Return a list of problems found in the code without running it."""
+    try:
+        tree = ast.parse(code)
+    except SyntaxError as err:
+        return [f"line {err.lineno}: {type(err).__name__}: {err.msg}"]
+
+    index = build_api_index()
+    if index is None:
+        return []
+
+    errors, star_names = _check_imports(tree, index)
+
+    # Names which are never defined
+    if star_names is not None:
+        known = _bound_names(tree) | star_names | set(dir(builtins)) | MODULE_DUNDERS
+        reported = set()
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Name) and isinstance(node.ctx, ast.Load) \
+                    and node.id not in known and node.id not in reported:
+                reported.add(node.id)
+                errors.append(f"line {node.lineno}: NameError: name '{node.id}' is not defined")
+
+    # Keyword arguments manimlib constructors don't take
+    for node in ast.walk(tree):
+        if not (isinstance(node, ast.Call) and isinstance(node.func, ast.Name)):
+            continue
+        if node.func.id in _bound_names(tree) or node.func.id not in index.classes:
+            continue
+        accepted = index.accepted_kwargs(node.func.id)
+        if accepted is None:
+            continue
+        for keyword in node.keywords:
+            if keyword.arg is not None and keyword.arg not in accepted:
+                errors.append(
+                    f"line {node.lineno}: TypeError: {node.func.id}.__init__() got an "
+                    f"unexpected keyword argument '{keyword.arg}'"
+                )
+
+    # Attributes which instances of manimlib classes don't have
+    instance_classes = _instance_classes(tree, index)
+    assigned_attrs = {
+        (node.value.id, node.attr)
+        for node in ast.walk(tree)
+        if isinstance(node, ast.Attribute) and isinstance(node.ctx, ast.Store)
+        and isinstance(node.value, ast.Name)
+    }
+    for node in ast.walk(tree):
+        if not (isinstance(node, ast.Attribute) and isinstance(node.ctx, ast.Load)
+                and isinstance(node.value, ast.Name) and node.value.id in instance_classes):
+            continue
+        if (node.value.id, node.attr) in assigned_attrs:
+            continue
+        class_name = instance_classes[node.value.id]
+        attributes = index.attributes(class_name)
+        if attributes is not None and node.attr not in attributes:
+            errors.append(
+                f"line {node.lineno}: AttributeError: '{class_name}' object has no attribute '{node.attr}'"
+            )
+
+    return errors
+
+
+def dry_run(
+    scene_file: Path,
+    scene_name: str = "GeneratedScene",
+    cancel: Optional[threading.Event] = None,
+) -> ValidationResult:
+    """Execute construct() with animations skipped, in a child process."""
+    start = time.time()
+    cmd = [sys.executable, "-m", "text_to_video.dry_run", str(scene_file), scene_name]
+    try:
+        with span("dry_run", category="validate"):
+            proc = run_subprocess(
+                cmd,
+                capture_output=True,
+                text=True,
+                timeout=DRY_RUN_TIMEOUT,
+                cwd=REPO_ROOT,
+                cancel=cancel,
+            )
+    except subprocess.TimeoutExpired:
+        return ValidationResult(
+            success=False,
+            stage="dry_run",
+            error_msg=f"Dry run timed out after {DRY_RUN_TIMEOUT} seconds.",
+            duration_seconds=time.time() - start,
+        )
+
+    error = ""
+    if proc.returncode != 0:
+        error = proc.stderr or proc.stdout
+        if len(error) > 3000:
+            error = error[:1500] + "\n...[truncated]...\n" + error[-1500:]
+    return ValidationResult(
+        success=(proc.returncode == 0),
+        stage="dry_run",
+        error_msg=error,
+        duration_seconds=time.time() - start,
+    )
+
+
+def validate(
+    scene_file: Path,
+    scene_name: str = "GeneratedScene",
+    cancel: Optional[threading.Event] = None,
+) -> ValidationResult:
+    """Run the static checks, then, if they pass, the dry run.
+
+    Setting cancel stops the dry run, raising SubprocessCancelled.
+    """
+    start = time.time()
+    with span("static_check", category="validate"):
+        errors = check_static(scene_file.read_text())
+    if errors:
+        return ValidationResult(
+            success=False,
+            stage="static",
+            error_msg="Static check found problems:\n" + "\n".join(errors),
+            duration_seconds=time.time() - start,
+        )
+    result = dry_run(scene_file, scene_name, cancel)
+    result.duration_seconds = time.time() - start
+    return result